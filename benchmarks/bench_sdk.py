@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the SDK's hot paths.
+
+Covers model construction, response validation, phone number formatting,
+pagination over large page streams, import time, end-to-end request
+throughput against the local mock API server and cassette replay. Results
+can be written to JSON and compared with an earlier run to spot regressions
+between commits.
+
+Usage:
+    python benchmarks/bench_sdk.py [--filter TEXT] [--output results.json]
+                                   [--compare baseline.json] [--threshold 0.2]
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Tuple
+
+import requests
+
+from openphone_python import OpenPhoneClient
+from openphone_python.models import (
+    Call,
+    CallRecording,
+    CallSummary,
+    CallTranscript,
+    Contact,
+    ContactCustomField,
+    Conversation,
+    Message,
+    PhoneNumber,
+    Webhook,
+    WebhookEvent,
+)
+from openphone_python.testing import CassetteTransport, MockDataset, MockOpenPhoneServer
+from openphone_python.utils.formatting import format_phone_numbers_list
+from openphone_python.utils.pagination import PaginatedResult
+from openphone_python.utils.validation import validate_api_response
+
+Benchmark = Tuple[str, Callable[[], Any], int]
+
+
+def measure(func: Callable[[], Any], repeat: int = 3) -> Dict[str, float]:
+    """Time ``func``, returning the best of ``repeat`` calibrated runs."""
+    timer = timeit.Timer(func)
+    loops, _ = timer.autorange()
+    best = min(timer.repeat(repeat=repeat, number=loops))
+    return {"iterations": loops, "seconds_per_op": best / loops}
+
+
+def make_response(payload: Dict[str, Any], status: int = 200) -> requests.Response:
+    """Build a requests.Response without any network."""
+    response = requests.Response()
+    response.status_code = status
+    response._content = json.dumps(payload).encode()
+    response.headers["Content-Type"] = "application/json"
+    return response
+
+
+class PageSource:
+    """Resource stand-in serving pre-built pages to PaginatedResult."""
+
+    def __init__(self, items: List[Dict[str, Any]], page_size: int):
+        """
+        Initialize page source.
+
+        Args:
+            items: Items served across the pages
+            page_size: Items per page
+        """
+        self.pages = {}
+        for start in range(0, len(items), page_size):
+            page = {"data": items[start : start + page_size]}
+            if start + page_size < len(items):
+                page["nextPageToken"] = str(start + page_size)
+            self.pages[str(start)] = page
+
+    def _request(
+        self, method: str, endpoint: str, params: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        return self.pages[params.get("pageToken", "0")]
+
+
+def model_benchmarks(dataset: MockDataset) -> List[Benchmark]:
+    """Construct every model class from realistic payloads."""
+    call = next(iter(dataset.calls.values()))
+    message = next(iter(dataset.messages.values()))
+    payloads = [
+        (Call, call),
+        (CallRecording, dataset.recording(call)),
+        (CallSummary, dataset.summary(call)),
+        (CallTranscript, dataset.transcript(call)),
+        (Contact, next(iter(dataset.contacts.values()))),
+        (ContactCustomField, {"key": "CF1", "name": "Plan", "type": "string"}),
+        (Conversation, next(iter(dataset.conversations.values()))),
+        (Message, message),
+        (PhoneNumber, dataset.phone_numbers[0]),
+        (
+            Webhook,
+            {
+                "id": "WH1",
+                "url": "https://example.com/hook",
+                "events": ["message.received"],
+                "resourceIds": ["*"],
+                "key": "secret",
+                "createdAt": "2024-01-01T00:00:00.000Z",
+                "updatedAt": "2024-01-01T00:00:00.000Z",
+            },
+        ),
+        (
+            WebhookEvent,
+            {
+                "id": "EV1",
+                "type": "message.received",
+                "createdAt": "2024-01-01T00:00:00.000Z",
+                "data": {"object": message},
+            },
+        ),
+    ]
+    # Models mutate their payload while parsing, so each run gets a copy
+    return [
+        (f"model/{cls.__name__}", lambda cls=cls, data=data: cls(dict(data)), 1)
+        for cls, data in payloads
+    ]
+
+
+def parsing_benchmarks(dataset: MockDataset) -> List[Benchmark]:
+    """Response validation and phone number formatting."""
+    page = {"data": list(dataset.messages.values())[:100], "nextPageToken": "100"}
+    ok = make_response(page)
+    not_found = make_response({"message": "Not found"}, 404)
+
+    def validate_error() -> None:
+        try:
+            validate_api_response(not_found)
+        except Exception:
+            pass
+
+    numbers = [f"+1415555{index:04d}" for index in range(20)]
+    return [
+        ("validate_api_response/200 page of 100", lambda: validate_api_response(ok), 1),
+        ("validate_api_response/404", validate_error, 1),
+        (
+            "format_phone_numbers_list/20 numbers",
+            lambda: format_phone_numbers_list(numbers),
+            20,
+        ),
+    ]
+
+
+def pagination_benchmarks(dataset: MockDataset) -> List[Benchmark]:
+    """Iterate PaginatedResult over a large in-memory page stream."""
+    items = list(dataset.messages.values())
+    source = PageSource(items, page_size=100)
+
+    def iterate() -> None:
+        for _ in PaginatedResult(source, "messages", {}, Message):
+            pass
+
+    return [(f"pagination/{len(items)} messages in pages of 100", iterate, len(items))]
+
+
+def import_benchmark(runs: int = 5) -> Dict[str, float]:
+    """Median cold import time of the package in a fresh interpreter."""
+    code = (
+        "import time; start = time.perf_counter(); import openphone_python; "
+        "print(time.perf_counter() - start)"
+    )
+    samples = [
+        float(subprocess.check_output([sys.executable, "-c", code], text=True))
+        for _ in range(runs)
+    ]
+    return {"iterations": runs, "seconds_per_op": statistics.median(samples)}
+
+
+def end_to_end_benchmarks(requests_count: int) -> Dict[str, Dict[str, float]]:
+    """Request throughput against the local mock API server."""
+    results = {}
+    with MockOpenPhoneServer(dataset_size=max(requests_count, 1000)) as server:
+        client = OpenPhoneClient(api_key=server.api_key, base_url=server.base_url)
+        call_ids = list(server.dataset.calls)[:requests_count]
+        client.calls.get(call_ids[0])
+
+        start = time.perf_counter()
+        for call_id in call_ids:
+            client.calls.get(call_id)
+        elapsed = time.perf_counter() - start
+        results["e2e/calls.get sequential"] = {
+            "iterations": len(call_ids),
+            "seconds_per_op": elapsed / len(call_ids),
+        }
+
+        start = time.perf_counter()
+        client.calls.get_many(call_ids, concurrency=8, rate_limit=None)
+        elapsed = time.perf_counter() - start
+        results["e2e/calls.get_many concurrency=8"] = {
+            "iterations": len(call_ids),
+            "seconds_per_op": elapsed / len(call_ids),
+        }
+
+        start = time.perf_counter()
+        count = sum(1 for _ in client.contacts.list(max_results=50))
+        elapsed = time.perf_counter() - start
+        results["e2e/contacts.list pages of 50"] = {
+            "iterations": count,
+            "seconds_per_op": elapsed / count,
+        }
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "calls.jsonl.gz")
+            with CassetteTransport(path, mode="record") as cassette:
+                recorder = OpenPhoneClient(
+                    api_key=server.api_key, base_url=server.base_url, transport=cassette
+                )
+                for call_id in call_ids:
+                    recorder.calls.get(call_id)
+
+            replay = OpenPhoneClient(
+                api_key="unused", transport=CassetteTransport(path)
+            )
+            start = time.perf_counter()
+            for call_id in call_ids:
+                replay.calls.get(call_id)
+            elapsed = time.perf_counter() - start
+            results["e2e/calls.get cassette replay"] = {
+                "iterations": len(call_ids),
+                "seconds_per_op": elapsed / len(call_ids),
+            }
+    return results
+
+
+def git_revision() -> str:
+    """Return the current commit, if the suite runs inside a git checkout."""
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"],
+            text=True,
+            stderr=subprocess.DEVNULL,
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def report(name: str, result: Dict[str, float], scale: int = 1) -> Dict[str, float]:
+    """Normalize a result per item and print it."""
+    per_op = result["seconds_per_op"] / scale
+    entry = {
+        "iterations": result["iterations"],
+        "us_per_op": per_op * 1e6,
+        "ops_per_sec": 1 / per_op if per_op else float("inf"),
+    }
+    print(
+        f"{name:<48} {entry['ops_per_sec']:>14,.0f} ops/s "
+        f"{entry['us_per_op']:>10.2f} us/op"
+    )
+    return entry
+
+
+def compare(
+    results: Dict[str, Dict[str, float]], baseline_path: str, threshold: float
+) -> int:
+    """Print the change against a baseline file; returns the number of regressions."""
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = json.load(f)["results"]
+    regressions = 0
+    print(f"\nCompared with {baseline_path} (regression threshold {threshold:.0%}):")
+    for name, entry in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+        change = entry["us_per_op"] / previous["us_per_op"] - 1
+        flag = ""
+        if change > threshold:
+            flag = "  REGRESSION"
+            regressions += 1
+        print(f"{name:<48} {change:>+9.1%}{flag}")
+    return regressions
+
+
+def main() -> None:
+    """Run the benchmark suite."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--filter", default="", help="only run benchmarks containing TEXT"
+    )
+    parser.add_argument("--output", help="write results to this JSON file")
+    parser.add_argument(
+        "--compare", help="compare with a JSON file written by --output"
+    )
+    parser.add_argument(
+        "--threshold", type=float, default=0.2, help="regression threshold"
+    )
+    parser.add_argument("--dataset-size", type=int, default=10_000)
+    parser.add_argument(
+        "--requests", type=int, default=2000, help="end-to-end requests"
+    )
+    args = parser.parse_args()
+
+    dataset = MockDataset(args.dataset_size)
+    results: Dict[str, Dict[str, float]] = {}
+
+    micro = (
+        model_benchmarks(dataset)
+        + parsing_benchmarks(dataset)
+        + pagination_benchmarks(dataset)
+    )
+    for name, func, scale in micro:
+        if args.filter in name:
+            results[name] = report(name, measure(func), scale)
+
+    if args.filter in "import/openphone_python":
+        results["import/openphone_python"] = report(
+            "import/openphone_python", import_benchmark()
+        )
+
+    if not args.filter or "e2e/".startswith(args.filter) or "e2e/" in args.filter:
+        for name, result in end_to_end_benchmarks(args.requests).items():
+            if args.filter in name:
+                results[name] = report(name, result)
+
+    if args.output:
+        meta = {
+            "revision": git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        }
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"meta": meta, "results": results}, f, indent=2, sort_keys=True)
+        print(f"\nResults written to {args.output}")
+
+    if args.compare and compare(results, args.compare, args.threshold):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark for the webhook receiving path.
+
+Covers signature verification, parsing, deduplication and the local event
+log.
+
+Usage:
+    python benchmarks/bench_webhook_receiver.py [--iterations N] [--payload-bytes N]
+"""
+
+import argparse
+import base64
+import json
+import tempfile
+import time
+
+from openphone_python.webhooks import (
+    BloomDeduplicator,
+    EventLog,
+    LRUDeduplicator,
+    SignatureVerifier,
+    WebhookReceiver,
+    compute_signature,
+)
+
+
+def make_payload(size: int) -> bytes:
+    """Build a message.received event of roughly ``size`` bytes."""
+    event = {
+        "id": "EVc67ec998b35c41d388af50799aeeba3e",
+        "object": "event",
+        "apiVersion": "v3",
+        "createdAt": "2024-01-01T00:00:00.000Z",
+        "type": "message.received",
+        "data": {"object": {"id": "AC1", "from": "+14155550100", "text": ""}},
+    }
+    filler = max(0, size - len(json.dumps(event)))
+    event["data"]["object"]["text"] = "x" * filler
+    return json.dumps(event).encode()
+
+
+def bench(name: str, func, iterations: int) -> dict:
+    """Run ``func`` repeatedly and report throughput."""
+    for _ in range(min(1000, iterations)):
+        func()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    elapsed = time.perf_counter() - start
+    result = {
+        "name": name,
+        "iterations": iterations,
+        "ops_per_sec": iterations / elapsed,
+        "us_per_op": elapsed / iterations * 1e6,
+    }
+    print(
+        f"{name:<32} {result['ops_per_sec']:>12,.0f} ops/s "
+        f"{result['us_per_op']:>8.2f} us/op"
+    )
+    return result
+
+
+def main() -> None:
+    """Run the microbenchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=50_000)
+    parser.add_argument("--payload-bytes", type=int, default=1024)
+    parser.add_argument(
+        "--webhooks", type=int, default=20, help="registered signing keys"
+    )
+    args = parser.parse_args()
+
+    keys = {
+        f"WH{i}": base64.b64encode(f"signing-key-{i}".encode()).decode()
+        for i in range(args.webhooks)
+    }
+    webhook_id, key = next(iter(keys.items()))
+    body = make_payload(args.payload_bytes)
+    header = compute_signature(body, key, int(time.time() * 1000))
+
+    verifier = SignatureVerifier(keys)
+    receiver = WebhookReceiver(keys)
+    headers = {"openphone-signature": header}
+
+    print(f"payload={len(body)} bytes, keys={len(keys)}")
+    bench(
+        "verify (known webhook id)",
+        lambda: verifier.verify(body, header, webhook_id),
+        args.iterations,
+    )
+    bench(
+        "verify (try all keys)", lambda: verifier.verify(body, header), args.iterations
+    )
+    bench(
+        "receive (verify + parse)",
+        lambda: receiver.receive(body, headers, webhook_id),
+        args.iterations,
+    )
+
+    for name, dedup in (
+        ("dedup LRU (new ids)", LRUDeduplicator(max_entries=100_000)),
+        ("dedup Bloom (new ids)", BloomDeduplicator(capacity=1_000_000)),
+    ):
+        ids = iter([f"EV{i:032x}" for i in range(args.iterations + 1000)])
+        bench(name, lambda: dedup.seen(next(ids)), args.iterations)
+        bench(
+            name.replace("new", "repeated"), lambda: dedup.seen("EV0"), args.iterations
+        )
+
+    with tempfile.TemporaryDirectory() as directory:
+        with EventLog(directory, segment_bytes=16 * 1024 * 1024) as log:
+            bench("event log append", lambda: log.append(body), args.iterations)
+            records = log.reader().read()
+            bench("event log sequential read", lambda: next(records), args.iterations)
+
+
+if __name__ == "__main__":
+    main()
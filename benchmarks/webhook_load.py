@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Load test for the WSGI webhook ingestion app.
+
+Starts WebhookWSGIApp on a local threaded server and floods it with signed
+deliveries from concurrent clients while the handler simulates slow
+downstream processing. Reports acknowledgement latency, throughput and how
+many deliveries were refused with 503 by backpressure.
+
+Usage:
+    python benchmarks/webhook_load.py [--events N] [--clients N] [--handler-ms MS]
+"""
+
+import argparse
+import base64
+import json
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from socketserver import ThreadingMixIn
+from typing import Any
+from wsgiref.simple_server import WSGIRequestHandler, WSGIServer, make_server
+
+import requests
+
+from openphone_python.webhooks import WebhookReceiver, WebhookWSGIApp, compute_signature
+
+KEY = base64.b64encode(b"load-test-signing-key").decode()
+
+
+class ThreadingWSGIServer(ThreadingMixIn, WSGIServer):
+    """wsgiref server handling each connection on its own thread."""
+
+    daemon_threads = True
+    request_queue_size = 1024
+
+
+class QuietHandler(WSGIRequestHandler):
+    """Request handler that does not log every request."""
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """Silence per-request logging."""
+
+
+def make_delivery(index: int) -> tuple:
+    """Signed body and signature header for one event."""
+    body = json.dumps(
+        {
+            "id": f"EV{index:08d}",
+            "type": "message.received",
+            "createdAt": "2024-01-01T00:00:00.000Z",
+            "data": {"object": {"id": f"AC{index}", "text": "load test"}},
+        }
+    ).encode()
+    return body, compute_signature(body, KEY, int(time.time() * 1000))
+
+
+def main() -> None:
+    """Run the load test."""
+    parser = argparse.ArgumentParser(description="Load test the webhook ingestion app")
+    parser.add_argument("--events", type=int, default=5000)
+    parser.add_argument("--clients", type=int, default=16)
+    parser.add_argument("--handler-ms", type=float, default=5.0)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--queue-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    def handler(event):
+        time.sleep(args.handler_ms / 1000)
+
+    app = WebhookWSGIApp(
+        WebhookReceiver({"WH1": KEY}),
+        handler,
+        queue_size=args.queue_size,
+        workers=args.workers,
+    )
+    server = make_server(
+        "127.0.0.1",
+        0,
+        app,
+        server_class=ThreadingWSGIServer,
+        handler_class=QuietHandler,
+    )
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/"
+
+    local = threading.local()
+
+    def post(index: int) -> tuple:
+        session = getattr(local, "session", None)
+        if session is None:
+            session = local.session = requests.Session()
+        body, signature = make_delivery(index)
+        start = time.perf_counter()
+        response = session.post(
+            url, data=body, headers={"openphone-signature": signature}
+        )
+        return response.status_code, time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(args.clients) as pool:
+        results = list(pool.map(post, range(args.events)))
+    elapsed = time.perf_counter() - start
+
+    latencies = sorted(latency for _, latency in results)
+    statuses = {}
+    for status, _ in results:
+        statuses[status] = statuses.get(status, 0) + 1
+
+    drain_start = time.perf_counter()
+    app.join()
+    drain = time.perf_counter() - drain_start
+    app.close()
+    server.shutdown()
+
+    print(f"deliveries:     {args.events} from {args.clients} clients")
+    print(f"statuses:       {statuses}")
+    print(f"throughput:     {args.events / elapsed:,.0f} deliveries/s")
+    print(
+        f"ack latency:    p50={statistics.median(latencies) * 1000:.2f} ms "
+        f"p99={latencies[int(len(latencies) * 0.99) - 1] * 1000:.2f} ms "
+        f"max={latencies[-1] * 1000:.2f} ms"
+    )
+    print(f"queue drained:  {drain:.2f} s after the last delivery")
+    print(f"app stats:      {app.stats.snapshot()}")
+
+
+if __name__ == "__main__":
+    main()
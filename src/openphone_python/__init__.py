@@ -10,6 +10,7 @@ from .exceptions import (
     OpenPhoneError,
     AuthenticationError,
     RateLimitError,
+    CircuitOpenError,
     ValidationError,
     NotFoundError,
     ApiError,
@@ -22,6 +23,9 @@ from .exceptions import (
     TooManyParticipantsError,
     NotPhoneNumberUserError,
     InvalidVersionError,
+    OperationCancelledError,
+    WebhookVerificationError,
+    WebhookKeyUnavailableError,
 )
 
 __all__ = [
@@ -29,6 +33,7 @@ __all__ = [
     "OpenPhoneError",
     "AuthenticationError",
     "RateLimitError",
+    "CircuitOpenError",
     "ValidationError",
     "NotFoundError",
     "ApiError",
@@ -41,6 +46,9 @@ __all__ = [
     "TooManyParticipantsError",
     "NotPhoneNumberUserError",
     "InvalidVersionError",
+    "OperationCancelledError",
+    "WebhookVerificationError",
+    "WebhookKeyUnavailableError",
     "__version__",
 ]
 
@@ -2,10 +2,29 @@
 Main client class for the OpenPhone Python SDK.
 """
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable, ContextManager, Union
 import requests
 from openphone_python.auth.api_key import ApiKeyAuth
-from openphone_python.utils.raw_request import raw_request, raw_request_with_response_object
+from openphone_python.transport import (
+    Transport,
+    TransportResponse,
+    create_transport,
+)
+from openphone_python.utils.circuit_breaker import CircuitBreaker
+from openphone_python.utils.concurrency import (
+    AdaptiveConcurrencyLimiter,
+    request_priority,
+)
+from openphone_python.utils.hedging import HedgingPolicy
+from openphone_python.utils.hooks import RequestEvent, RequestHooks
+from openphone_python.utils.metrics import MetricsRegistry
+from openphone_python.utils.rate_limit import RateLimitState
+from openphone_python.utils.request_log import SlowRequestLogger
+from openphone_python.utils.tracing import Tracer
+from openphone_python.utils.raw_request import (
+    raw_request,
+    raw_request_with_response_object,
+)
 from openphone_python.resources.messages import MessagesResource
 from openphone_python.resources.contacts import ContactsResource
 from openphone_python.resources.contact_custom_fields import ContactCustomFieldsResource
@@ -28,17 +47,74 @@ class OpenPhoneClient:
     - Centralized configuration and authentication
     """
 
-    def __init__(self, api_key: str, base_url: str = "https://api.openphone.com/v1"):
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "https://api.openphone.com/v1",
+        pool_maxsize: int = 32,
+        transport: Union[Transport, str, None] = None,
+        metrics: Optional[MetricsRegistry] = None,
+        hooks: Optional[RequestHooks] = None,
+        tracer: Optional[Tracer] = None,
+        slow_request_threshold: Optional[float] = None,
+        slow_request_sample_rate: float = 1.0,
+        concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        hedging: Optional[HedgingPolicy] = None,
+    ):
         """
         Initialize OpenPhone client.
 
         Args:
             api_key: OpenPhone API key
             base_url: Base URL for OpenPhone API
+            pool_maxsize: Maximum pooled connections per resource, bounds
+                useful concurrency for bulk operations
+            transport: Optional transport shared by every resource and raw
+                request, or the name of one (``requests``, ``httpx``,
+                ``http2``), e.g. from deployment configuration. Each
+                resource uses its own pooled ``requests`` session when None.
+            metrics: Optional registry recording every request made by
+                this client (disabled when None)
+            hooks: Optional request lifecycle callbacks, e.g. shared by
+                several clients (a new empty RequestHooks when None)
+            tracer: Optional tracer opening spans per operation, HTTP
+                attempt and page (disabled when None)
+            slow_request_threshold: Log a warning with endpoint, attempt and
+                payload sizes for requests slower than this many seconds
+            slow_request_sample_rate: Fraction of slow requests to log
+            concurrency_limiter: Optional adaptive limit on requests in
+                flight across all resources, backing off on 429s, 5xx and
+                latency spikes, and scheduling by priority class
+                (unlimited when None)
+            circuit_breaker: Optional per-endpoint circuit breaker failing
+                fast with CircuitOpenError while an endpoint keeps failing
+                (disabled when None)
+            hedging: Optional policy re-sending slow GETs and using the
+                first response, within a cap on the hedged fraction
+                (disabled when None)
         """
         self.base_url = base_url.rstrip("/")
         self.auth = ApiKeyAuth(api_key)
         self.version = "0.1.0"
+        self.pool_maxsize = pool_maxsize
+        if isinstance(transport, str):
+            transport = create_transport(transport, pool_maxsize)
+        self.transport = transport
+        self.metrics = metrics
+        self.hooks = hooks if hooks is not None else RequestHooks()
+        self.tracer = tracer
+        self.rate_limit = RateLimitState()
+        self.concurrency_limiter = concurrency_limiter
+        self.circuit_breaker = circuit_breaker
+        self.hedging = hedging
+        if circuit_breaker is not None and metrics is not None:
+            circuit_breaker.subscribe(metrics.record_circuit_state)
+        if slow_request_threshold is not None:
+            self.hooks.register(
+                "after_response",
+                SlowRequestLogger(slow_request_threshold, slow_request_sample_rate),
+            )
 
         # Lazy-loaded resources
         self._messages: Optional[MessagesResource] = None
@@ -122,6 +198,47 @@ class OpenPhoneClient:
             self._conversations = ConversationsResource(self)
         return self._conversations
 
+    def on(
+        self, event: str, callback: Callable[[RequestEvent], Any]
+    ) -> Callable[[RequestEvent], Any]:
+        """
+        Register a request lifecycle callback.
+
+        Shortcut for ``client.hooks.register(event, callback)``.
+
+        Args:
+            event: One of ``before_send``, ``after_response``, ``on_retry``,
+                ``on_error``
+            callback: Callable invoked with a RequestEvent
+
+        Returns:
+            The callback
+        """
+        return self.hooks.register(event, callback)
+
+    def priority(self, priority: str) -> ContextManager[str]:
+        """
+        Run the requests made in a block under a priority class.
+
+        With a concurrency limiter, ``interactive`` requests get the next
+        free slot ahead of ``default`` ones, and ``bulk`` requests (the
+        default for bulk operations) only use the capacity left over.
+
+        Example:
+            with client.priority("interactive"):
+                contact = client.contacts.get(contact_id)
+
+        Args:
+            priority: ``interactive``, ``default`` or ``bulk``
+
+        Returns:
+            Context manager yielding the priority
+
+        Raises:
+            ValueError: If the priority is unknown
+        """
+        return request_priority(priority)
+
     def __repr__(self) -> str:
         """String representation of client."""
         return f"OpenPhoneClient(base_url='{self.base_url}')"
@@ -132,7 +249,7 @@ class OpenPhoneClient:
         method: str = "GET",
         params: Optional[Dict[str, Any]] = None,
         data: Optional[Dict[str, Any]] = None,
-        timeout: int = 30
+        timeout: int = 30,
     ) -> Dict[str, Any]:
         """
         Make a raw API request using the client's authentication.
@@ -176,7 +293,12 @@ class OpenPhoneClient:
             params=params,
             data=data,
             base_url=self.base_url,
-            timeout=timeout
+            timeout=timeout,
+            transport=self.transport,
+            metrics=self.metrics,
+            hooks=self.hooks,
+            tracer=self.tracer,
+            rate_limit_state=self.rate_limit,
         )
 
     def raw_request_with_response_object(
@@ -185,8 +307,8 @@ class OpenPhoneClient:
         method: str = "GET",
         params: Optional[Dict[str, Any]] = None,
         data: Optional[Dict[str, Any]] = None,
-        timeout: int = 30
-    ) -> requests.Response:
+        timeout: int = 30,
+    ) -> Union[requests.Response, TransportResponse]:
         """
         Make a raw API request and return the full Response object.
 
@@ -202,7 +324,8 @@ class OpenPhoneClient:
             timeout: Request timeout in seconds (default: 30)
 
         Returns:
-            Full requests.Response object
+            Full requests.Response object (a TransportResponse with the
+            same attributes when the client has a transport)
 
         Examples:
             # Get response object
@@ -218,5 +341,10 @@ class OpenPhoneClient:
             params=params,
             data=data,
             base_url=self.base_url,
-            timeout=timeout
+            timeout=timeout,
+            transport=self.transport,
+            metrics=self.metrics,
+            hooks=self.hooks,
+            tracer=self.tracer,
+            rate_limit_state=self.rate_limit,
         )
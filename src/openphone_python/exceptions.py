@@ -111,6 +111,42 @@ class RateLimitError(OpenPhoneError):
         self.retry_after = retry_after
 
 
+class CircuitOpenError(OpenPhoneError):
+    """Raised without a request while an endpoint's circuit breaker is open."""
+
+    def __init__(
+        self,
+        message: str,
+        endpoint: str,
+        retry_after: Optional[float] = None,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Initialize circuit open error.
+
+        Args:
+            message: Error message
+            endpoint: Endpoint whose circuit is open
+            retry_after: Seconds until a probe request is let through
+            **kwargs: Additional OpenPhoneError arguments
+        """
+        super().__init__(message, **kwargs)
+        self.endpoint = endpoint
+        self.retry_after = retry_after
+
+
+class OperationCancelledError(OpenPhoneError):
+    """Raised for work skipped because a bulk operation was cancelled."""
+
+
+class WebhookVerificationError(OpenPhoneError):
+    """Raised when a webhook delivery has a missing, stale or invalid signature."""
+
+
+class WebhookKeyUnavailableError(WebhookVerificationError):
+    """Raised when a webhook signing key could not be loaded; retry later."""
+
+
 class ApiError(OpenPhoneError):
     """Raised for general API errors."""
 
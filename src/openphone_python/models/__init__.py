@@ -13,6 +13,8 @@ from .call_summary import CallSummary
 from .call_transcript import CallTranscript
 from .webhook import Webhook
 from .conversation import Conversation
+from .enriched_call import EnrichedCall
+from .webhook_event import WebhookEvent
 
 __all__ = [
     "BaseModel",
@@ -27,4 +29,6 @@ __all__ = [
     "CallTranscript",
     "Webhook",
     "Conversation",
+    "EnrichedCall",
+    "WebhookEvent",
 ]
@@ -31,12 +31,21 @@ class BaseModel:
         if isinstance(value, datetime):
             return value
         if isinstance(value, str):
+            # API timestamps are ISO 8601, which the stdlib parses far faster
+            try:
+                return datetime.fromisoformat(value)
+            except ValueError:
+                pass
             try:
                 return date_parser.parse(value)
             except (ValueError, TypeError):
                 return None
         return None
 
+    def _get_field(self, name: str, default: Any = None) -> Any:
+        """Get a raw API field, returning default when it is absent."""
+        return self._data.get(name, default)
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert model to dictionary."""
         return self._data.copy()
@@ -0,0 +1,74 @@
+"""Enriched call model for the OpenPhone Python SDK."""
+
+from typing import Dict, List, Optional
+from .call import Call
+from .call_recording import CallRecording
+from .call_summary import CallSummary
+from .call_transcript import CallTranscript
+
+# Artefact statuses that mean OpenPhone has not finished generating them
+PENDING_STATUSES = frozenset({"processing", "in-progress", "pending"})
+
+
+class EnrichedCall:
+    """
+    A call joined with its recording, summary and transcript.
+
+    Artefacts that do not exist are None. Artefacts that could not be
+    fetched for another reason are None with the exception kept in
+    ``errors`` under the artefact name.
+    """
+
+    def __init__(
+        self,
+        call: Call,
+        recording: Optional[CallRecording] = None,
+        summary: Optional[CallSummary] = None,
+        transcript: Optional[CallTranscript] = None,
+        errors: Optional[Dict[str, BaseException]] = None,
+    ):
+        """
+        Initialize enriched call.
+
+        Args:
+            call: The call
+            recording: Its recording, if fetched
+            summary: Its summary, if fetched
+            transcript: Its transcript, if fetched
+            errors: Errors of the artefacts that could not be fetched
+        """
+        self.call = call
+        self.recording = recording
+        self.summary = summary
+        self.transcript = transcript
+        self.errors = errors or {}
+
+    @property
+    def id(self) -> str:
+        """Call ID."""
+        return self.call.id
+
+    @property
+    def pending(self) -> List[str]:
+        """Names of artefacts that are still being processed."""
+        artefacts = {
+            "recording": self.recording,
+            "summary": self.summary,
+            "transcript": self.transcript,
+        }
+        pending = []
+        for name, artefact in artefacts.items():
+            # Recordings may come back as a list, which carries no status
+            data = artefact._data if artefact is not None else None
+            if isinstance(data, dict) and data.get("status") in PENDING_STATUSES:
+                pending.append(name)
+        return pending
+
+    @property
+    def is_complete(self) -> bool:
+        """Whether every artefact was fetched and none is still processing."""
+        return not self.errors and not self.pending
+
+    def __repr__(self) -> str:
+        """Return the string representation of the enriched call."""
+        return f"EnrichedCall(id='{self.id}', pending={self.pending})"
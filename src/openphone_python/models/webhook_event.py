@@ -0,0 +1,87 @@
+"""Webhook event model for the OpenPhone Python SDK."""
+
+from typing import Any, Dict, FrozenSet, Optional, Type
+from datetime import datetime
+from .base import BaseModel
+from .call import Call
+from .call_summary import CallSummary
+from .call_transcript import CallTranscript
+from .message import Message
+
+# Event families, matching the specialized webhook endpoints
+MESSAGE_EVENTS: FrozenSet[str] = frozenset({"message.received", "message.delivered"})
+CALL_EVENTS: FrozenSet[str] = frozenset(
+    {"call.completed", "call.ringing", "call.recording.completed"}
+)
+CALL_SUMMARY_EVENTS: FrozenSet[str] = frozenset({"call.summary.completed"})
+CALL_TRANSCRIPT_EVENTS: FrozenSet[str] = frozenset({"call.transcript.completed"})
+ALL_EVENTS: FrozenSet[str] = (
+    MESSAGE_EVENTS | CALL_EVENTS | CALL_SUMMARY_EVENTS | CALL_TRANSCRIPT_EVENTS
+)
+
+# Model class of the object carried by each event type
+EVENT_MODELS: Dict[str, Type[BaseModel]] = {
+    **{event: Message for event in MESSAGE_EVENTS},
+    **{event: Call for event in CALL_EVENTS},
+    **{event: CallSummary for event in CALL_SUMMARY_EVENTS},
+    **{event: CallTranscript for event in CALL_TRANSCRIPT_EVENTS},
+}
+
+
+class WebhookEvent(BaseModel):
+    """
+    Represents an event delivered to a webhook endpoint.
+
+    Events are built on the receiving hot path, so timestamps and the typed
+    model are only built on first access.
+    """
+
+    @property
+    def id(self) -> str:
+        """Event ID."""
+        return str(self._data.get("id", ""))
+
+    @property
+    def type(self) -> str:
+        """Event type, e.g. ``message.received`` or ``call.completed``."""
+        return str(self._data.get("type", ""))
+
+    @property
+    def api_version(self) -> str:
+        """API version the payload was rendered with."""
+        return str(self._data.get("apiVersion", ""))
+
+    @property
+    def created_at(self) -> Optional[datetime]:
+        """When the event was created."""
+        # Cached on the instance; the raw payload stays JSON-serializable
+        if "_created_at" not in self.__dict__:
+            self._created_at = self._parse_datetime(self._data.get("createdAt"))
+        return self._created_at
+
+    @property
+    def data(self) -> Dict[str, Any]:
+        """Event data envelope."""
+        return self._data.get("data") or {}
+
+    @property
+    def object(self) -> Dict[str, Any]:
+        """Raw API object the event is about (message, call, summary, ...)."""
+        return self.data.get("object") or {}
+
+    @property
+    def model(self) -> BaseModel:
+        """
+        Event object as an SDK model, e.g. Message, Call or CallSummary.
+
+        Unknown event types fall back to a plain BaseModel.
+        """
+        model = self.__dict__.get("_model")
+        if model is None:
+            model = EVENT_MODELS.get(self.type, BaseModel)(self.object)
+            self._model = model
+        return model
+
+    def __repr__(self) -> str:
+        """Return the string representation of the webhook event."""
+        return f"WebhookEvent(id='{self.id}', type='{self.type}')"
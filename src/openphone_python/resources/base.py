@@ -2,20 +2,48 @@
 Base resource class for the OpenPhone Python SDK.
 """
 
-from typing import Dict, Any, Optional, Iterator, TYPE_CHECKING
+from typing import (
+    Dict,
+    Any,
+    Optional,
+    Iterator,
+    Iterable,
+    Callable,
+    ContextManager,
+    TYPE_CHECKING,
+)
+from contextlib import nullcontext
 import requests
 import time
 import logging
-from openphone_python.exceptions import ApiError
+from openphone_python.exceptions import ApiError, CircuitOpenError, OpenPhoneError
+from openphone_python.utils.metrics import endpoint_template
+from openphone_python.utils.request_log import response_preview
 from openphone_python.utils.validation import validate_api_response
 from openphone_python.utils.pagination import PaginatedResult
+from openphone_python.transport import (
+    RequestsTransport,
+    Transport,
+    TransportRequest,
+    TransportResponse,
+)
+from openphone_python.utils.concurrency import (
+    DEFAULT_REQUESTS_PER_SECOND,
+    BatchResult,
+    RateLimiter,
+    run_concurrently,
+)
 
 if TYPE_CHECKING:
+    from concurrent.futures import Future
     from openphone_python.client import OpenPhoneClient
     from openphone_python.models.base import BaseModel
 
 logger = logging.getLogger(__name__)
 
+# Methods that may be safely re-sent after the request reached the server
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
 
 class BaseResource:
     """
@@ -31,15 +59,29 @@ class BaseResource:
         self.client = client
         self.session = requests.Session()
 
+        # Size the connection pool for concurrent bulk operations
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=client.pool_maxsize, pool_maxsize=client.pool_maxsize
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
         # Set up authentication headers
-        auth_headers = client.auth.get_headers()
-        self.session.headers.update(auth_headers)
-        self.session.headers.update(
+        self.headers = client.auth.get_headers()
+        self.headers.update(
             {
                 "Content-Type": "application/json",
                 "User-Agent": f"openphone-python/{client.version}",
             }
         )
+        self.session.headers.update(self.headers)
+
+        # A client-wide transport replaces this resource's own session
+        self.transport: Transport = (
+            client.transport
+            if client.transport is not None
+            else RequestsTransport(self.session)
+        )
 
     def _request(
         self,
@@ -53,13 +95,18 @@ class BaseResource:
         """
         Make HTTP request to OpenPhone API with retry logic.
 
+        Non-idempotent methods (POST, PATCH) are only retried when the
+        connection could not be established, so a request that may have
+        reached the server is never sent twice.
+
         Args:
             method: HTTP method (GET, POST, PUT, DELETE)
             endpoint: API endpoint path
             params: Query parameters
             data: Request body data
             max_retries: Maximum number of retry attempts
-            **kwargs: Additional arguments for requests
+            **kwargs: Additional arguments for the transport (``timeout``
+                and, for the default transport, any ``requests`` argument)
 
         Returns:
             Parsed JSON response
@@ -70,40 +117,246 @@ class BaseResource:
         url = f"{self.client.base_url}/{endpoint.lstrip('/')}"
 
         # Log the outgoing request (single concise log)
-        logger.debug("OpenPhone API Request: %s %s | Params: %s | Data: %s",
-                    method, url, params, data)
+        logger.debug(
+            "OpenPhone API Request: %s %s | Params: %s | Data: %s",
+            method,
+            url,
+            params,
+            data,
+        )
 
+        timeout = kwargs.pop("timeout", None)
+        request = TransportRequest(
+            method,
+            url,
+            params=params,
+            json=data,
+            headers=self.headers,
+            timeout=timeout,
+            options=kwargs,
+        )
+
+        tracer = self.client.tracer
+        if tracer is None:
+            return self._send(request, endpoint, data, max_retries)
+        template = endpoint_template(endpoint)
+        with tracer.span(
+            f"openphone {request.method} {template}",
+            {"http.method": request.method, "openphone.endpoint": template},
+        ):
+            return self._send(request, endpoint, data, max_retries)
+
+    def _send(
+        self,
+        request: TransportRequest,
+        endpoint: str,
+        data: Optional[Dict[str, Any]],
+        max_retries: int,
+    ) -> Dict[str, Any]:
+        """Send a request with retries, reporting to metrics, hooks and tracing."""
+        method = request.method
+        metrics = self.client.metrics
+        hooks = self.client.hooks
+        breaker = self.client.circuit_breaker
         for attempt in range(max_retries + 1):
+            if breaker is not None and not breaker.allow(endpoint):
+                retry_after = breaker.retry_after(endpoint)
+                rejection = CircuitOpenError(
+                    f"Circuit open for {endpoint_template(endpoint)}; "
+                    f"not sending {method}",
+                    endpoint=endpoint,
+                    retry_after=retry_after,
+                )
+                if metrics is not None:
+                    metrics.record_circuit_rejection(endpoint)
+                hooks.emit("on_error", request, endpoint, attempt + 1, error=rejection)
+                raise rejection
+            hooks.emit("before_send", request, endpoint, attempt + 1)
+            started = time.perf_counter()
             try:
-                response = self.session.request(
-                    method=method, url=url, params=params, json=data, **kwargs
+                response = self._attempt(request, endpoint, attempt + 1)
+            except requests.RequestException as e:
+                if breaker is not None:
+                    breaker.record(endpoint, False)
+                if metrics is not None:
+                    metrics.record_request(
+                        method, endpoint, None, time.perf_counter() - started
+                    )
+                logger.warning(
+                    "Request attempt %d/%d failed: %s", attempt + 1, max_retries + 1, e
                 )
 
-                # Log the response (single concise log)
-                content_preview = response.text[:500] + "..." if len(response.text) > 500 else response.text
-                logger.debug("OpenPhone API Response: %s | Headers: %s | Content: %s",
-                           response.status_code, dict(response.headers), content_preview)
-
-                validated_response = validate_api_response(response)
-                return validated_response
+                retryable = method in IDEMPOTENT_METHODS or isinstance(
+                    e, requests.ConnectTimeout
+                )
+                if not retryable:
+                    logger.error(
+                        "Not retrying non-idempotent %s request: %s", method, e
+                    )
+                    error = ApiError(f"Request failed: {e}", 0)
+                elif attempt == max_retries:
+                    logger.error(
+                        "All %d request attempts failed: %s", max_retries + 1, e
+                    )
+                    error = ApiError(
+                        f"Request failed after {max_retries} retries: {e}", 0
+                    )
+                else:
+                    # Exponential backoff: 1s, 2s, 4s
+                    wait_time = 2**attempt
+                    if metrics is not None:
+                        metrics.record_retry(method, endpoint)
+                    hooks.emit(
+                        "on_retry",
+                        request,
+                        endpoint,
+                        attempt + 1,
+                        error=e,
+                        delay=wait_time,
+                    )
+                    time.sleep(wait_time)
+                    continue
+                hooks.emit("on_error", request, endpoint, attempt + 1, error=error)
+                raise error from e
+            except Exception as e:
+                if breaker is not None:
+                    # Hands back a half-open probe slot
+                    breaker.record(endpoint, False)
+                logger.error("Unexpected error during request: %s", e, exc_info=True)
+                hooks.emit("on_error", request, endpoint, attempt + 1, error=e)
+                raise
 
-            except requests.RequestException as e:
-                logger.warning("Request attempt %d/%d failed: %s",
-                             attempt + 1, max_retries + 1, e)
+            elapsed = time.perf_counter() - started
+            if breaker is not None:
+                breaker.record(endpoint, response.status_code < 500)
+            self.client.rate_limit.update(response.status_code, response.headers)
+            if metrics is not None:
+                metrics.record_response(method, endpoint, response, elapsed, data)
+            hooks.emit(
+                "after_response",
+                request,
+                endpoint,
+                attempt + 1,
+                response=response,
+                elapsed=elapsed,
+            )
 
-                if attempt == max_retries:
-                    logger.error("All %d request attempts failed: %s", max_retries + 1, e)
-                    raise ApiError(
-                        f"Request failed after {max_retries} retries: {e}", 0
-                    ) from e
+            # Log the response (single concise log, only built when enabled)
+            if logger.isEnabledFor(logging.DEBUG):
+                fields = {
+                    "method": method,
+                    "endpoint": endpoint,
+                    "status": response.status_code,
+                    "attempt": attempt + 1,
+                    "elapsed": elapsed,
+                }
+                logger.debug(
+                    "OpenPhone API Response: %s %s -> %s in %.3fs "
+                    "| Headers: %s | Content: %s",
+                    method,
+                    endpoint,
+                    response.status_code,
+                    elapsed,
+                    dict(response.headers),
+                    response_preview(response.content),
+                    extra={"openphone": fields},
+                )
 
-                # Exponential backoff: 1s, 2s, 4s
-                wait_time = 2**attempt
-                time.sleep(wait_time)
+            try:
+                return validate_api_response(response)
             except Exception as e:
-                logger.error("Unexpected error during request: %s", e, exc_info=True)
+                if isinstance(e, OpenPhoneError):
+                    # Raised to the caller; a traceback per 404 only adds cost
+                    logger.debug(
+                        "OpenPhone API error: %s %s -> %s", method, endpoint, e
+                    )
+                else:
+                    logger.error(
+                        "Unexpected error during request: %s", e, exc_info=True
+                    )
+                hooks.emit(
+                    "on_error",
+                    request,
+                    endpoint,
+                    attempt + 1,
+                    response=response,
+                    error=e,
+                )
                 raise
 
+    def _attempt(
+        self, request: TransportRequest, endpoint: str, attempt: int
+    ) -> TransportResponse:
+        """Send one HTTP attempt, hedged when it is a GET and hedging is enabled."""
+        hedging = self.client.hedging
+        if hedging is None or request.method != "GET":
+            return self._gated(request, endpoint, attempt)
+        return hedging.run(
+            lambda: self._gated(request, endpoint, attempt),
+            endpoint,
+            self.client.metrics,
+            on_discard=lambda future, seconds: self._record_discarded(
+                request, endpoint, future, seconds
+            ),
+        )
+
+    def _record_discarded(
+        self,
+        request: TransportRequest,
+        endpoint: str,
+        future: "Future[TransportResponse]",
+        seconds: float,
+    ) -> None:
+        """Count the losing request of a hedged GET like any other attempt."""
+        metrics = self.client.metrics
+        breaker = self.client.circuit_breaker
+        error = future.exception()
+        if error is None:
+            response = future.result()
+            if breaker is not None:
+                breaker.record(endpoint, response.status_code < 500)
+            self.client.rate_limit.update(response.status_code, response.headers)
+            if metrics is not None:
+                metrics.record_response(request.method, endpoint, response, seconds)
+        elif isinstance(error, requests.RequestException):
+            if breaker is not None:
+                breaker.record(endpoint, False)
+            if metrics is not None:
+                metrics.record_request(request.method, endpoint, None, seconds)
+
+    def _gated(
+        self, request: TransportRequest, endpoint: str, attempt: int
+    ) -> TransportResponse:
+        """Send one HTTP request within the client's concurrency limit, if any."""
+        limiter = self.client.concurrency_limiter
+        if limiter is None:
+            return self._transmit(request, attempt)
+        permit = limiter.acquire()
+        # acquire() only gives up when handed a cancel_event
+        assert permit is not None
+        metrics = self.client.metrics
+        if metrics is not None:
+            metrics.record_queue_wait(permit.priority, permit.waited)
+        status_code = None
+        try:
+            response = self._transmit(request, attempt)
+            status_code = response.status_code
+            return response
+        finally:
+            limiter.release(permit, status_code, endpoint=endpoint)
+
+    def _transmit(self, request: TransportRequest, attempt: int) -> TransportResponse:
+        """Send one HTTP attempt, in a child span when tracing."""
+        tracer = self.client.tracer
+        if tracer is None:
+            return self.transport.send(request)
+        with tracer.span(
+            f"HTTP {request.method}", {"http.url": request.url, "http.attempt": attempt}
+        ) as span:
+            response = self.transport.send(request)
+            span.set_attribute("http.status_code", response.status_code)
+            return response
+
     def _paginate(
         self, endpoint: str, model_class: type, params: Optional[Dict[str, Any]] = None
     ) -> Iterator["BaseModel"]:
@@ -121,6 +374,73 @@ class BaseResource:
         params = params or {}
         return PaginatedResult(self, endpoint, params, model_class)
 
+    def _get_many(
+        self,
+        ids: Iterable[str],
+        fetch: Callable[[str], "BaseModel"],
+        concurrency: int = 8,
+        rate_limit: Optional[float] = DEFAULT_REQUESTS_PER_SECOND,
+    ) -> BatchResult:
+        """
+        Fetch many objects by ID concurrently.
+
+        Args:
+            ids: IDs to fetch; duplicates are fetched once
+            fetch: Single-object getter, e.g. ``self.get``
+            concurrency: Maximum number of requests in flight (an upper bound
+                when the client has a concurrency limiter)
+            rate_limit: Maximum requests started per second (None disables pacing)
+
+        Returns:
+            BatchResult with one entry per unique ID in input order
+        """
+        unique_ids = list(dict.fromkeys(ids))
+        rate_limiter = self._rate_limiter(rate_limit)
+        with self._operation("get_many", count=len(unique_ids)):
+            results = run_concurrently(
+                fetch,
+                unique_ids,
+                max_workers=concurrency,
+                rate_limiter=rate_limiter,
+                ordered=True,
+            )
+            return BatchResult(list(results))
+
+    def _rate_limiter(self, rate_limit: Optional[float]) -> Optional[RateLimiter]:
+        """
+        Pacing for a bulk operation, slowed down by the client's rate-limit state.
+
+        Args:
+            rate_limit: Maximum requests started per second (None disables pacing)
+
+        Returns:
+            RateLimiter, or None when pacing is disabled
+        """
+        if not rate_limit:
+            return None
+        return RateLimiter(rate_limit, state=self.client.rate_limit)
+
+    def _operation(self, name: str, **attributes: Any) -> ContextManager[Any]:
+        """
+        Span grouping the requests of a multi-request operation when tracing.
+
+        Args:
+            name: Operation name, prefixed with the resource name
+            **attributes: Span attributes
+
+        Returns:
+            Context manager yielding the span (None when not tracing)
+        """
+        tracer = self.client.tracer
+        if tracer is None:
+            return nullcontext()
+        return tracer.span(self._operation_name(name), attributes)
+
+    def _operation_name(self, name: str) -> str:
+        """Span name of an operation, prefixed with the resource name."""
+        resource = type(self).__name__.removesuffix("Resource").lower()
+        return f"openphone {resource}.{name}"
+
     def _get(
         self, endpoint: str, params: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
@@ -2,8 +2,10 @@
 Call Summaries resource for the OpenPhone Python SDK.
 """
 
-from typing import Optional
+from typing import Any, Optional, Iterable
 from openphone_python.models.call_summary import CallSummary
+from openphone_python.utils.concurrency import DEFAULT_REQUESTS_PER_SECOND, BatchResult
+from openphone_python.utils.polling import ArtefactWaiter
 from openphone_python.resources.base import BaseResource
 
 
@@ -32,3 +34,46 @@ class CallSummariesResource(BaseResource):
         """
         response = self._get(f"call-summaries/{call_id}")
         return CallSummary(response.get("data", response))
+
+    def get_many(
+        self,
+        call_ids: Iterable[str],
+        concurrency: int = 8,
+        rate_limit: Optional[float] = DEFAULT_REQUESTS_PER_SECOND,
+    ) -> BatchResult:
+        """
+        Get many call summaries concurrently.
+
+        A failure for one ID (e.g. NotFoundError) is recorded in the result
+        instead of aborting the batch.
+
+        Args:
+            call_ids: Call IDs whose summaries to fetch; duplicates are fetched once
+            concurrency: Maximum number of requests in flight
+            rate_limit: Maximum requests started per second (None disables pacing)
+
+        Returns:
+            BatchResult in input order, with CallSummary instances in ``results``
+            and exceptions in ``errors``, both keyed by ID
+        """
+        return self._get_many(call_ids, self.get, concurrency, rate_limit)
+
+    def waiter(self, **kwargs: Any) -> ArtefactWaiter:
+        """
+        Create a waiter resolving summaries once they are no longer processing.
+
+        Args:
+            **kwargs: ArtefactWaiter options such as initial_delay, max_delay,
+                timeout and rate_limit
+
+        Returns:
+            ArtefactWaiter polling this resource; submit call IDs to it
+
+        Examples:
+            with client.call_summaries.waiter(timeout=600) as waiter:
+                futures = waiter.submit_many(pending_ids)
+                for key, future in futures.items():
+                    print(key, future.result())
+        """
+        kwargs.setdefault("rate_limit_state", self.client.rate_limit)
+        return ArtefactWaiter(self.get, **kwargs)
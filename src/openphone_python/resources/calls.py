@@ -2,12 +2,35 @@
 Calls resource for the OpenPhone Python SDK.
 """
 
-from typing import List, Optional, Iterator
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Iterator,
+    Iterable,
+    Sequence,
+    TypeVar,
+    Union,
+)
+from openphone_python.exceptions import NotFoundError
+from openphone_python.models.base import BaseModel
 from openphone_python.models.call import Call
+from openphone_python.models.enriched_call import EnrichedCall
 from openphone_python.utils.validation import validate_pagination_params
 from openphone_python.utils.formatting import format_phone_numbers_list
+from openphone_python.utils.concurrency import (
+    DEFAULT_REQUESTS_PER_SECOND,
+    BatchResult,
+    run_concurrently,
+)
 from openphone_python.resources.base import BaseResource
 
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
 
 class CallsResource(BaseResource):
     """
@@ -16,8 +39,13 @@ class CallsResource(BaseResource):
     Endpoints covered:
     - GET /v1/calls (List calls)
     - GET /v1/calls/{id} (Get call by ID)
+
+    Call artefacts are joined in enrich() through the call recordings,
+    call summaries and call transcripts resources.
     """
 
+    ARTEFACTS = ("recording", "summary", "transcript")
+
     def list(
         self,
         phone_number_id: str,
@@ -89,3 +117,132 @@ class CallsResource(BaseResource):
         """
         response = self._get(f"calls/{call_id}")
         return Call(response.get("data", response))
+
+    def get_many(
+        self,
+        call_ids: Iterable[str],
+        concurrency: int = 8,
+        rate_limit: Optional[float] = DEFAULT_REQUESTS_PER_SECOND,
+    ) -> BatchResult:
+        """
+        Get many calls concurrently.
+
+        A failure for one ID (e.g. NotFoundError) is recorded in the result
+        instead of aborting the batch.
+
+        Args:
+            call_ids: Call IDs; duplicates are fetched once
+            concurrency: Maximum number of requests in flight
+            rate_limit: Maximum requests started per second (None disables pacing)
+
+        Returns:
+            BatchResult in input order, with Call instances in ``results``
+            and exceptions in ``errors``, both keyed by ID
+        """
+        return self._get_many(call_ids, self.get, concurrency, rate_limit)
+
+    def enrich(
+        self,
+        calls: Iterable[Union[Call, str]],
+        concurrency: int = 4,
+        rate_limit: Optional[float] = DEFAULT_REQUESTS_PER_SECOND,
+        artefacts: Sequence[str] = ARTEFACTS,
+    ) -> Iterator[EnrichedCall]:
+        """
+        Join calls with their recordings, summaries and transcripts.
+
+        The artefacts of each call are fetched concurrently, and up to
+        ``concurrency`` calls are in flight at once, so a slow call does not
+        hold up fetching for the ones behind it. The input is consumed
+        lazily, which makes it suitable for piping ``calls.list()`` through.
+
+        Missing artefacts (404) are returned as None, artefacts that are
+        still processing are returned as-is and listed in
+        ``EnrichedCall.pending``, and other failures are recorded in
+        ``EnrichedCall.errors`` without stopping the stream.
+
+        Args:
+            calls: Call instances or call IDs; IDs are fetched first
+            concurrency: Maximum number of calls enriched at once
+            rate_limit: Maximum requests started per second (None disables pacing)
+            artefacts: Subset of ("recording", "summary", "transcript") to fetch
+
+        Returns:
+            Iterator yielding one EnrichedCall per input call, in input order.
+            A call ID that cannot be fetched yields an EnrichedCall with the
+            exception in ``errors["call"]``.
+
+        Raises:
+            ValueError: If an unknown artefact name is requested
+        """
+        unknown = set(artefacts) - set(self.ARTEFACTS)
+        if unknown:
+            raise ValueError(
+                f"Unknown artefacts: {sorted(unknown)}. "
+                f"Valid artefacts: {list(self.ARTEFACTS)}"
+            )
+        # Validated above, before the generator below is first iterated
+        return self._enrich(calls, concurrency, rate_limit, artefacts)
+
+    def _enrich(
+        self,
+        calls: Iterable[Union[Call, str]],
+        concurrency: int,
+        rate_limit: Optional[float],
+        artefacts: Sequence[str],
+    ) -> Iterator[EnrichedCall]:
+        """Yield the results of enrich() once its arguments are validated."""
+        getters: Dict[str, Callable[[str], BaseModel]] = {
+            "recording": self.client.call_recordings.get,
+            "summary": self.client.call_summaries.get,
+            "transcript": self.client.call_transcripts.get,
+        }
+        rate_limiter = self._rate_limiter(rate_limit)
+
+        def fetch(getter: Callable[[str], ModelT], call_id: str) -> ModelT:
+            if rate_limiter is not None:
+                rate_limiter.acquire()
+            return getter(call_id)
+
+        def enrich_one(
+            item: Union[Call, str], executor: ThreadPoolExecutor
+        ) -> EnrichedCall:
+            if isinstance(item, str):
+                try:
+                    call = fetch(self.get, item)
+                except Exception as e:
+                    return EnrichedCall(Call({"id": item}), errors={"call": e})
+            else:
+                call = item
+
+            # Artefact fetches inherit the call's context (priority, spans)
+            futures = {
+                name: executor.submit(
+                    contextvars.copy_context().run, fetch, getters[name], call.id
+                )
+                for name in artefacts
+            }
+            # Recording, summary and transcript by name, None when not found
+            fetched: Dict[str, Any] = {}
+            errors: Dict[str, BaseException] = {}
+            for name, future in futures.items():
+                try:
+                    fetched[name] = future.result()
+                except NotFoundError:
+                    fetched[name] = None
+                except Exception as e:
+                    errors[name] = e
+            return EnrichedCall(call, errors=errors, **fetched)
+
+        with ThreadPoolExecutor(
+            max_workers=concurrency * len(artefacts) or 1
+        ) as executor:
+            for result in run_concurrently(
+                lambda call: enrich_one(call, executor),
+                calls,
+                max_workers=concurrency,
+                ordered=True,
+            ):
+                if result.error is not None:
+                    raise result.error
+                yield result.value
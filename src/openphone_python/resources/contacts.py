@@ -2,11 +2,113 @@
 Contacts resource for the OpenPhone Python SDK.
 """
 
-from typing import List, Dict, Any, Optional, Iterator
+import threading
+from typing import List, Dict, Any, Optional, Iterator, Iterable, Tuple
 from openphone_python.models.contact import Contact
 from openphone_python.utils.validation import validate_pagination_params
+from openphone_python.utils.concurrency import (
+    DEFAULT_REQUESTS_PER_SECOND,
+    BatchItemResult,
+    BatchResult,
+    RateLimiter,
+    iter_chunks,
+    run_concurrently,
+)
 from openphone_python.resources.base import BaseResource
-from openphone_python.exceptions import ValidationError
+from openphone_python.exceptions import OperationCancelledError, ValidationError
+
+# Fields that are set by OpenPhone and never sent in a PATCH
+READ_ONLY_CONTACT_FIELDS = frozenset(
+    {"id", "externalId", "createdAt", "updatedAt", "createdByUserId"}
+)
+
+
+class ContactUpsertResult(BatchItemResult):
+    """
+    Outcome of upserting a single contact record.
+
+    ``action`` is one of ``"created"``, ``"updated"``, ``"unchanged"`` or
+    ``"failed"``; ``value`` holds the resulting Contact on success.
+    """
+
+    def __init__(
+        self,
+        index: int,
+        item: Dict[str, Any],
+        action: str,
+        value: Optional[Contact] = None,
+        error: Optional[BaseException] = None,
+    ):
+        """
+        Initialize contact upsert result.
+
+        Args:
+            index: Position of the record in the input
+            item: The input record
+            action: created, updated, unchanged or failed
+            value: Resulting Contact on success
+            error: Exception raised on failure
+        """
+        super().__init__(index, item, value=value, error=error)
+        self.action = action
+
+    @property
+    def external_id(self) -> Optional[str]:
+        """External ID of the upserted record."""
+        return self.item.get("externalId") if isinstance(self.item, dict) else None
+
+    def __repr__(self) -> str:
+        """Return the string representation of the result."""
+        return (
+            f"ContactUpsertResult(index={self.index}, "
+            f"external_id={self.external_id!r}, action='{self.action}')"
+        )
+
+
+def _matches(desired: Any, existing: Any) -> bool:
+    """Check whether every value in ``desired`` is already present in ``existing``."""
+    if isinstance(desired, dict):
+        if not isinstance(existing, dict):
+            return False
+        return all(_matches(value, existing.get(key)) for key, value in desired.items())
+    if isinstance(desired, list):
+        if not isinstance(existing, list) or len(desired) != len(existing):
+            return False
+        return all(_matches(d, e) for d, e in zip(desired, existing))
+    return bool(desired == existing)
+
+
+def _contact_changes(
+    desired: Dict[str, Any], existing: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Compute the PATCH body needed to bring an existing contact up to date.
+
+    Default fields are compared one by one so only changed fields are sent.
+
+    Args:
+        desired: Contact record as it should be
+        existing: Raw data of the contact currently stored in OpenPhone
+
+    Returns:
+        Dictionary of changed fields, empty if nothing needs updating
+    """
+    changes: Dict[str, Any] = {}
+    for key, value in desired.items():
+        if key in READ_ONLY_CONTACT_FIELDS:
+            continue
+        if key == "defaultFields" and isinstance(value, dict):
+            current = existing.get("defaultFields") or {}
+            changed = {
+                field: field_value
+                for field, field_value in value.items()
+                if not _matches(field_value, current.get(field))
+            }
+            if changed:
+                changes["defaultFields"] = changed
+        elif not _matches(value, existing.get(key)):
+            changes[key] = value
+    return changes
 
 
 class ContactsResource(BaseResource):
@@ -14,7 +116,7 @@ class ContactsResource(BaseResource):
     Handle all contact-related API operations.
 
     Endpoints covered:
-    - GET /v1/contacts (List contacts)
+    - GET /v1/contacts (List contacts, upsert lookups)
     - POST /v1/contacts (Create contact)
     - GET /v1/contacts/{id} (Get contact)
     - PUT /v1/contacts/{id} (Update contact)
@@ -74,6 +176,169 @@ class ContactsResource(BaseResource):
         response = self._post("contacts", contact_data)
         return Contact(response.get("data", response))
 
+    def upsert_many(
+        self,
+        records: Iterable[Dict[str, Any]],
+        max_workers: int = 8,
+        rate_limit: Optional[float] = DEFAULT_REQUESTS_PER_SECOND,
+        lookup_batch_size: int = 50,
+        chunk_size: int = 500,
+        cancel_event: Optional[threading.Event] = None,
+    ) -> Iterator[ContactUpsertResult]:
+        """
+        Create or update many contacts keyed by their ``externalId``.
+
+        Records are processed in chunks. For each chunk, existing contacts
+        are looked up with batched ``externalIds`` list calls, each record is
+        diffed against what is stored, and only the necessary creates and
+        PATCHes are issued concurrently. Records that already match are
+        reported as unchanged without any write.
+
+        Args:
+            records: Contact payloads as accepted by create(), each with an
+                ``externalId``
+            max_workers: Maximum number of requests in flight
+            rate_limit: Maximum requests started per second (None disables pacing)
+            lookup_batch_size: External IDs per lookup request (1-50)
+            chunk_size: Records looked up and written per round
+            cancel_event: Optional event; once set, records not yet started
+                are reported as failed with OperationCancelledError
+
+        Returns:
+            Iterator yielding one ContactUpsertResult per record, in input
+            order within each chunk
+
+        Raises:
+            ValidationError: If lookup_batch_size is outside 1-50
+        """
+        if not 1 <= lookup_batch_size <= 50:
+            raise ValidationError("lookup_batch_size must be between 1 and 50")
+        # Validated above, before the generator below is first iterated
+        return self._upsert_many(
+            records,
+            max_workers,
+            rate_limit,
+            lookup_batch_size,
+            chunk_size,
+            cancel_event,
+        )
+
+    def _upsert_many(
+        self,
+        records: Iterable[Dict[str, Any]],
+        max_workers: int,
+        rate_limit: Optional[float],
+        lookup_batch_size: int,
+        chunk_size: int,
+        cancel_event: Optional[threading.Event],
+    ) -> Iterator[ContactUpsertResult]:
+        """Yield the results of upsert_many() once its arguments are validated."""
+        rate_limiter = self._rate_limiter(rate_limit)
+        for chunk in iter_chunks(enumerate(records), chunk_size):
+            yield from self._upsert_chunk(
+                chunk, max_workers, rate_limiter, lookup_batch_size, cancel_event
+            )
+
+    def _upsert_chunk(
+        self,
+        chunk: List[Tuple[int, Dict[str, Any]]],
+        max_workers: int,
+        rate_limiter: Optional[RateLimiter],
+        lookup_batch_size: int,
+        cancel_event: Optional[threading.Event],
+    ) -> Iterator[ContactUpsertResult]:
+        """Look up, diff and write one chunk of upsert records."""
+        results: Dict[int, ContactUpsertResult] = {}
+        keyed: List[Tuple[int, Dict[str, Any]]] = []
+        seen_ids = set()
+
+        for index, record in chunk:
+            external_id = record.get("externalId") if isinstance(record, dict) else None
+            if not external_id:
+                error = ValidationError("Record must include an 'externalId'")
+            elif external_id in seen_ids:
+                error = ValidationError(f"Duplicate externalId in batch: {external_id}")
+            else:
+                seen_ids.add(external_id)
+                keyed.append((index, record))
+                continue
+            results[index] = ContactUpsertResult(index, record, "failed", error=error)
+
+        # Look up existing contacts in batches of external IDs
+        existing: Dict[str, Contact] = {}
+        lookup_errors: Dict[str, BaseException] = {}
+
+        def lookup(external_ids: List[str]) -> List[Contact]:
+            return list(self.list(external_ids=external_ids, max_results=50))
+
+        id_batches = iter_chunks(
+            (record["externalId"] for _, record in keyed), lookup_batch_size
+        )
+        for result in run_concurrently(
+            lookup, id_batches, max_workers, rate_limiter, cancel_event
+        ):
+            if result.error is not None:
+                lookup_errors.update(
+                    (external_id, result.error) for external_id in result.item
+                )
+                continue
+            for contact in result.value:
+                existing.setdefault(contact.external_id, contact)
+
+        # Lookups cut short by cancellation: skip the writes entirely
+        if any(isinstance(e, OperationCancelledError) for e in lookup_errors.values()):
+            keyed = []
+
+        # Diff and plan the writes
+        writes: List[Tuple[int, Dict[str, Any], Optional[Contact], Dict[str, Any]]] = []
+        for index, record in keyed:
+            external_id = record["externalId"]
+            if external_id in lookup_errors:
+                results[index] = ContactUpsertResult(
+                    index, record, "failed", error=lookup_errors[external_id]
+                )
+                continue
+            contact = existing.get(external_id)
+            if contact is None:
+                writes.append((index, record, None, record))
+                continue
+            changes = _contact_changes(record, contact.to_dict())
+            if changes:
+                writes.append((index, record, contact, changes))
+            else:
+                results[index] = ContactUpsertResult(
+                    index, record, "unchanged", contact
+                )
+
+        def write(
+            plan: Tuple[int, Dict[str, Any], Optional[Contact], Dict[str, Any]],
+        ) -> Contact:
+            _, _, contact, payload = plan
+            if contact is None:
+                return self.create(payload)
+            return self.update(contact.id, payload)
+
+        for result in run_concurrently(
+            write, writes, max_workers, rate_limiter, cancel_event
+        ):
+            index, record, contact, _ = result.item
+            if not result.ok:
+                action = "failed"
+            else:
+                action = "created" if contact is None else "updated"
+            results[index] = ContactUpsertResult(
+                index, record, action, result.value, result.error
+            )
+
+        for index, record in chunk:
+            upserted = results.get(index)
+            if upserted is None:
+                cancelled = OperationCancelledError(
+                    "Operation cancelled before it started"
+                )
+                upserted = ContactUpsertResult(index, record, "failed", error=cancelled)
+            yield upserted
+
     def get(self, contact_id: str) -> Contact:
         """
         Get a specific contact by ID.
@@ -87,6 +352,29 @@ class ContactsResource(BaseResource):
         response = self._get(f"contacts/{contact_id}")
         return Contact(response.get("data", response))
 
+    def get_many(
+        self,
+        contact_ids: Iterable[str],
+        concurrency: int = 8,
+        rate_limit: Optional[float] = DEFAULT_REQUESTS_PER_SECOND,
+    ) -> BatchResult:
+        """
+        Get many contacts concurrently.
+
+        A failure for one ID (e.g. NotFoundError) is recorded in the result
+        instead of aborting the batch.
+
+        Args:
+            contact_ids: Contact IDs; duplicates are fetched once
+            concurrency: Maximum number of requests in flight
+            rate_limit: Maximum requests started per second (None disables pacing)
+
+        Returns:
+            BatchResult in input order, with Contact instances in ``results``
+            and exceptions in ``errors``, both keyed by ID
+        """
+        return self._get_many(contact_ids, self.get, concurrency, rate_limit)
+
     def update(self, contact_id: str, contact_data: Dict[str, Any]) -> Contact:
         """
         Update an existing contact.
@@ -2,13 +2,22 @@
 Messages resource for the OpenPhone Python SDK.
 """
 
-from typing import List, Optional, Iterator
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Iterator, Sequence, Union
+from openphone_python.exceptions import RateLimitError, ValidationError
 from openphone_python.models.message import Message
 from openphone_python.utils.validation import validate_pagination_params
 from openphone_python.utils.formatting import (
     format_phone_numbers_list,
     ensure_e164_format,
 )
+from openphone_python.utils.concurrency import (
+    DEFAULT_REQUESTS_PER_SECOND,
+    BatchItemResult,
+    BatchResult,
+    run_concurrently,
+)
 from .base import BaseResource
 
 
@@ -18,7 +27,7 @@ class MessagesResource(BaseResource):
 
     Endpoints covered:
     - GET /v1/messages (List messages)
-    - POST /v1/messages (Send message)
+    - POST /v1/messages (Send message, bulk send)
     - GET /v1/messages/{id} (Get message by ID)
     """
 
@@ -109,6 +118,99 @@ class MessagesResource(BaseResource):
         response = self._post("messages", data)
         return Message(response.get("data", response))
 
+    def send_bulk(
+        self,
+        jobs: Iterable[Sequence[Union[str, List[str]]]],
+        user_id: Optional[str] = None,
+        max_workers: int = 8,
+        rate_limit: Optional[float] = DEFAULT_REQUESTS_PER_SECOND,
+        cancel_event: Optional[threading.Event] = None,
+        max_rate_limit_retries: int = 5,
+    ) -> Iterator[BatchItemResult]:
+        """
+        Send many messages concurrently, streaming one result per job.
+
+        Jobs are consumed lazily, so generators of any size can be passed.
+        Each distinct phone number is normalised to E.164 only once. A send
+        is never repeated after it may have reached the server; only 429
+        responses, which OpenPhone rejects before processing, are retried.
+
+        Args:
+            jobs: Iterable of (from_number, to, content) tuples, where ``to``
+                is a phone number or list of phone numbers
+            user_id: Optional user ID to send every message as
+            max_workers: Maximum number of sends in flight
+            rate_limit: Maximum sends started per second (None disables pacing)
+            cancel_event: Optional event; once set, jobs not yet started are
+                skipped with OperationCancelledError
+            max_rate_limit_retries: How often a job rejected with 429 is retried
+
+        Returns:
+            Iterator yielding BatchItemResult instances in completion order.
+            ``item`` is the original job, ``index`` its position in ``jobs``
+            and ``value`` the sent Message. Failures such as
+            NotEnoughCreditsError or A2PRegistrationNotApprovedError are
+            reported on ``error`` without stopping the batch.
+
+        Examples:
+            jobs = [("+14155550100", "+14155550101", "Hi!")]
+            for result in client.messages.send_bulk(jobs):
+                if not result.ok:
+                    print(result.index, result.error)
+        """
+        normalized: Dict[str, str] = {}
+
+        def normalize(phone_number: str) -> str:
+            if phone_number not in normalized:
+                normalized[phone_number] = ensure_e164_format(phone_number)
+            return normalized[phone_number]
+
+        def send_job(job: Sequence[Union[str, List[str]]]) -> Message:
+            if len(job) != 3:
+                raise ValidationError("Each job must be a (from, to, content) tuple")
+            from_number, to_numbers, content = job
+            if not isinstance(from_number, str) or not isinstance(content, str):
+                raise ValidationError("A job's from number and content must be strings")
+            if isinstance(to_numbers, str):
+                to_numbers = [to_numbers]
+
+            data = {
+                "content": content,
+                "from": normalize(from_number),
+                "to": [normalize(number) for number in to_numbers],
+            }
+            if user_id:
+                data["userId"] = user_id
+
+            attempt = 0
+            while True:
+                try:
+                    response = self._request(
+                        "POST", "messages", data=data, max_retries=0
+                    )
+                    return Message(response.get("data", response))
+                except RateLimitError as e:
+                    if attempt == max_rate_limit_retries:
+                        raise
+                    wait_time = (
+                        e.retry_after if e.retry_after is not None else 2**attempt
+                    )
+                    if cancel_event is not None:
+                        if cancel_event.wait(wait_time):
+                            raise
+                    else:
+                        time.sleep(wait_time)
+                attempt += 1
+
+        rate_limiter = self._rate_limiter(rate_limit)
+        return run_concurrently(
+            send_job,
+            jobs,
+            max_workers=max_workers,
+            rate_limiter=rate_limiter,
+            cancel_event=cancel_event,
+        )
+
     def get(self, message_id: str) -> Message:
         """
         Get a specific message by ID.
@@ -121,3 +223,26 @@ class MessagesResource(BaseResource):
         """
         response = self._get(f"messages/{message_id}")
         return Message(response.get("data", response))
+
+    def get_many(
+        self,
+        message_ids: Iterable[str],
+        concurrency: int = 8,
+        rate_limit: Optional[float] = DEFAULT_REQUESTS_PER_SECOND,
+    ) -> BatchResult:
+        """
+        Get many messages concurrently.
+
+        A failure for one ID (e.g. NotFoundError) is recorded in the result
+        instead of aborting the batch.
+
+        Args:
+            message_ids: Message IDs; duplicates are fetched once
+            concurrency: Maximum number of requests in flight
+            rate_limit: Maximum requests started per second (None disables pacing)
+
+        Returns:
+            BatchResult in input order, with Message instances in ``results``
+            and exceptions in ``errors``, both keyed by ID
+        """
+        return self._get_many(message_ids, self.get, concurrency, rate_limit)
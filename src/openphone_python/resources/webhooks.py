@@ -2,9 +2,91 @@
 Webhooks resource for the OpenPhone Python SDK.
 """
 
-from typing import List, Dict, Any, Optional, Iterator
+from typing import List, Dict, Any, Optional, Iterator, Iterable, FrozenSet, Tuple
+from openphone_python.exceptions import OperationCancelledError
 from openphone_python.models.webhook import Webhook
+from openphone_python.models.webhook_event import (
+    ALL_EVENTS,
+    CALL_EVENTS,
+    CALL_SUMMARY_EVENTS,
+    CALL_TRANSCRIPT_EVENTS,
+    MESSAGE_EVENTS,
+)
 from openphone_python.resources.base import BaseResource
+from openphone_python.utils.concurrency import (
+    DEFAULT_REQUESTS_PER_SECOND,
+    BatchItemResult,
+    run_concurrently,
+)
+
+WebhookKey = Tuple[str, FrozenSet[str], FrozenSet[str]]
+
+
+def _webhook_key(
+    url: str, events: Iterable[str], resource_ids: Optional[Iterable[str]]
+) -> WebhookKey:
+    """Identity of a webhook subscription; no resource IDs means all ("*")."""
+    return (url, frozenset(events), frozenset(resource_ids or ["*"]))
+
+
+class WebhookPlan:
+    """
+    Changes needed to reach a desired webhook configuration.
+
+    ``create`` holds the webhook payloads to create, ``delete`` and
+    ``unchanged`` the existing Webhook instances. Once applied, ``results``
+    holds one BatchItemResult per operation, creates first.
+    """
+
+    def __init__(
+        self,
+        create: List[Dict[str, Any]],
+        delete: List[Webhook],
+        unchanged: List[Webhook],
+    ):
+        """
+        Initialize webhook plan.
+
+        Args:
+            create: Webhook payloads to create
+            delete: Existing webhooks to delete
+            unchanged: Existing webhooks that already match
+        """
+        self.create = create
+        self.delete = delete
+        self.unchanged = unchanged
+        self.results: List[BatchItemResult] = []
+
+    @property
+    def has_changes(self) -> bool:
+        """Whether anything needs to be created or deleted."""
+        return bool(self.create or self.delete)
+
+    @property
+    def ok(self) -> bool:
+        """Whether every applied operation succeeded."""
+        return all(result.ok for result in self.results)
+
+    @property
+    def errors(self) -> List[BatchItemResult]:
+        """Results of the operations that failed."""
+        return [result for result in self.results if not result.ok]
+
+    @property
+    def created(self) -> List[Webhook]:
+        """Webhooks created by apply(), including their signing keys."""
+        return [
+            result.value
+            for result in self.results
+            if result.ok and isinstance(result.value, Webhook)
+        ]
+
+    def __repr__(self) -> str:
+        """Return the string representation of the plan."""
+        return (
+            f"WebhookPlan(create={len(self.create)}, delete={len(self.delete)}, "
+            f"unchanged={len(self.unchanged)})"
+        )
 
 
 class WebhooksResource(BaseResource):
@@ -20,6 +102,8 @@ class WebhooksResource(BaseResource):
     - POST /v1/webhooks/calls (Create call webhook)
     - POST /v1/webhooks/call-summaries (Create call summary webhook)
     - POST /v1/webhooks/call-transcripts (Create call transcript webhook)
+
+    apply() reconciles the webhooks with a declarative configuration.
     """
 
     def list(self, user_id: Optional[str] = None, **kwargs) -> Iterator[Webhook]:
@@ -59,43 +143,57 @@ class WebhooksResource(BaseResource):
         Raises:
             ValueError: If events are not specified or are invalid/mixed types
         """
-        events = webhook_data.get("events", [])
+        endpoint = self._endpoint_for(webhook_data.get("events", []))
+        return self._create_via_specialized_endpoint(endpoint, webhook_data)
+
+    def _endpoint_for(self, events: List[str]) -> str:
+        """
+        Specialized create endpoint for a list of events.
+
+        Args:
+            events: Events of the webhook
+
+        Returns:
+            Endpoint path
+
+        Raises:
+            ValueError: If events are not specified or are invalid/mixed types
+        """
         if not events:
             raise ValueError("webhook_data must include 'events' list")
 
-        # Define event categories
-        message_events = {"message.received", "message.delivered"}
-        call_events = {"call.completed", "call.ringing", "call.recording.completed"}
-        summary_events = {"call.summary.completed"}
-        transcript_events = {"call.transcript.completed"}
-
         events_set = set(events)
 
         # Check for single-category events and route accordingly
-        if events_set.issubset(message_events):
-            return self._create_via_specialized_endpoint("webhooks/messages", webhook_data)
-        elif events_set.issubset(call_events):
-            return self._create_via_specialized_endpoint("webhooks/calls", webhook_data)
-        elif events_set == summary_events:
-            return self._create_via_specialized_endpoint("webhooks/call-summaries", webhook_data)
-        elif events_set == transcript_events:
-            return self._create_via_specialized_endpoint("webhooks/call-transcripts", webhook_data)
+        if events_set.issubset(MESSAGE_EVENTS):
+            return "webhooks/messages"
+        elif events_set.issubset(CALL_EVENTS):
+            return "webhooks/calls"
+        elif events_set == CALL_SUMMARY_EVENTS:
+            return "webhooks/call-summaries"
+        elif events_set == CALL_TRANSCRIPT_EVENTS:
+            return "webhooks/call-transcripts"
         else:
             # Mixed or unknown events - provide helpful error
-            if len(events_set.intersection(message_events)) > 0 and len(events_set.intersection(call_events)) > 0:
+            if (
+                len(events_set.intersection(MESSAGE_EVENTS)) > 0
+                and len(events_set.intersection(CALL_EVENTS)) > 0
+            ):
                 raise ValueError(
                     "Cannot mix message and call events in a single webhook. "
                     "Create separate webhooks or use specialized methods: "
                     "create_message_webhook(), create_call_webhook()"
                 )
             else:
-                unknown_events = events_set - message_events - call_events - summary_events - transcript_events
+                unknown_events = events_set - ALL_EVENTS
                 raise ValueError(
                     f"Unknown events: {list(unknown_events)}. "
-                    f"Valid events are: {list(message_events | call_events | summary_events | transcript_events)}"
+                    f"Valid events are: {list(ALL_EVENTS)}"
                 )
 
-    def _create_via_specialized_endpoint(self, endpoint: str, webhook_data: Dict[str, Any]) -> Webhook:
+    def _create_via_specialized_endpoint(
+        self, endpoint: str, webhook_data: Dict[str, Any]
+    ) -> Webhook:
         """
         Helper method to create webhook via specialized endpoint.
 
@@ -136,7 +234,9 @@ class WebhooksResource(BaseResource):
         valid_events = ["message.received", "message.delivered"]
         for event in events:
             if event not in valid_events:
-                raise ValueError(f"Invalid message event: {event}. Valid events: {valid_events}")
+                raise ValueError(
+                    f"Invalid message event: {event}. Valid events: {valid_events}"
+                )
 
         webhook_data = {
             "url": url,
@@ -181,7 +281,9 @@ class WebhooksResource(BaseResource):
         valid_events = ["call.completed", "call.ringing", "call.recording.completed"]
         for event in events:
             if event not in valid_events:
-                raise ValueError(f"Invalid call event: {event}. Valid events: {valid_events}")
+                raise ValueError(
+                    f"Invalid call event: {event}. Valid events: {valid_events}"
+                )
 
         webhook_data = {
             "url": url,
@@ -313,6 +415,103 @@ class WebhooksResource(BaseResource):
         self._delete(f"webhooks/{webhook_id}")
         return True
 
+    def apply(
+        self,
+        desired: Iterable[Dict[str, Any]],
+        user_id: Optional[str] = None,
+        delete_extra: bool = True,
+        dry_run: bool = False,
+        max_workers: int = 8,
+        rate_limit: Optional[float] = DEFAULT_REQUESTS_PER_SECOND,
+    ) -> WebhookPlan:
+        """
+        Bring the webhooks in line with a declarative configuration.
+
+        Current webhooks are listed once and matched to the desired ones by
+        URL, events and resource IDs (order-insensitive; no resource IDs
+        means all numbers). Missing webhooks are created through the
+        specialized endpoints and, with ``delete_extra``, webhooks that are
+        not desired are deleted. Creates run concurrently first and deletes
+        afterwards, so deliveries never stop while a webhook is replaced;
+        if any create fails, the deletes are skipped and reported as
+        cancelled.
+
+        Webhooks cannot be updated in place, so a changed URL, event list
+        or resource list is a create plus a delete. Labels and status are
+        not compared.
+
+        Args:
+            desired: Webhook payloads as accepted by create()
+            user_id: Optional user whose webhooks are managed
+            delete_extra: Delete existing webhooks that are not desired
+            dry_run: Only compute the plan, without creating or deleting
+            max_workers: Maximum number of requests in flight
+            rate_limit: Maximum requests started per second (None disables pacing)
+
+        Returns:
+            WebhookPlan with the results of the applied operations
+
+        Raises:
+            ValueError: If a desired webhook has missing, unknown or mixed
+                events; raised before anything is changed
+        """
+        wanted: Dict[WebhookKey, Dict[str, Any]] = {}
+        for webhook_data in desired:
+            self._endpoint_for(webhook_data.get("events", []))
+            key = _webhook_key(
+                webhook_data.get("url", ""),
+                webhook_data["events"],
+                webhook_data.get("resourceIds"),
+            )
+            wanted.setdefault(key, webhook_data)
+
+        existing: Dict[WebhookKey, List[Webhook]] = {}
+        for webhook in self.list(user_id=user_id):
+            key = _webhook_key(webhook.url, webhook.events, webhook.resource_ids)
+            existing.setdefault(key, []).append(webhook)
+
+        create, unchanged = [], []
+        for key, webhook_data in wanted.items():
+            matches = existing.get(key)
+            if matches:
+                unchanged.append(matches.pop(0))
+            else:
+                create.append(webhook_data)
+        delete = (
+            [webhook for matches in existing.values() for webhook in matches]
+            if delete_extra
+            else []
+        )
+
+        plan = WebhookPlan(create, delete, unchanged)
+        if dry_run or not plan.has_changes:
+            return plan
+
+        limiter = self._rate_limiter(rate_limit)
+        plan.results.extend(
+            run_concurrently(self.create, create, max_workers, limiter, ordered=True)
+        )
+        if not plan.ok:
+            error = OperationCancelledError(
+                "Delete skipped because a webhook could not be created"
+            )
+            plan.results.extend(
+                BatchItemResult(index, webhook, error=error)
+                for index, webhook in enumerate(delete)
+            )
+            return plan
+
+        plan.results.extend(
+            run_concurrently(
+                lambda webhook: self.delete(webhook.id),
+                delete,
+                max_workers,
+                limiter,
+                ordered=True,
+            )
+        )
+        return plan
+
     def get_all(self, user_id: Optional[str] = None) -> List[Webhook]:
         """
         Get all webhooks as a list.
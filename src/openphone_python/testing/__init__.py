@@ -0,0 +1,17 @@
+"""
+Testing utilities for the OpenPhone Python SDK.
+
+Provides a local stand-in for the OpenPhone API and a record/replay
+transport so integrations can be tested and benchmarked without network
+access or an API key.
+"""
+
+from .cassette import CassetteMissError, CassetteTransport
+from .mock_server import MockDataset, MockOpenPhoneServer
+
+__all__ = [
+    "CassetteMissError",
+    "CassetteTransport",
+    "MockDataset",
+    "MockOpenPhoneServer",
+]
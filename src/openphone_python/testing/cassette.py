@@ -0,0 +1,288 @@
+"""
+Record/replay cassette transport for the OpenPhone Python SDK.
+
+Records the request/response pairs of a real run (against the API or the
+mock server) to a compact file, then serves them back without a network so
+performance tests are deterministic and run at tens of thousands of calls
+per second.
+
+Example:
+    # Record once
+    with CassetteTransport("tests/cassettes/sync.jsonl.gz", mode="record") as cassette:
+        client = OpenPhoneClient(api_key=api_key, transport=cassette)
+        run_sync(client)
+
+    # Replay in every test run
+    cassette = CassetteTransport("tests/cassettes/sync.jsonl.gz")
+    client = OpenPhoneClient(api_key="unused", transport=cassette)
+    run_sync(client)
+
+On disk a cassette is one JSON object per line, gzip-compressed when the
+path ends in ``.gz``. Credentials are never written.
+"""
+
+import gzip
+import json
+import logging
+import threading
+import time
+from collections import defaultdict
+from typing import IO, Any, Dict, Iterable, List, Mapping, Optional, Tuple, cast
+from urllib.parse import parse_qsl, urlsplit
+from openphone_python.transport import (
+    RequestsTransport,
+    Transport,
+    TransportRequest,
+    TransportResponse,
+)
+
+logger = logging.getLogger(__name__)
+
+CASSETTE_VERSION = 1
+CASSETTE_MODES = ("replay", "record", "auto")
+
+# Response headers kept in a cassette; the rest only add size
+_RECORDED_HEADERS = frozenset(
+    {
+        "content-type",
+        "retry-after",
+        "x-ratelimit-limit",
+        "x-ratelimit-remaining",
+        "x-ratelimit-reset",
+    }
+)
+
+# (method, path, sorted (name, value) query pairs)
+CassetteKey = Tuple[str, str, Tuple[Tuple[str, str], ...]]
+
+
+class CassetteMissError(LookupError):
+    """Raised when a replayed request has no recorded response."""
+
+
+def _open(path: str, mode: str) -> IO[str]:
+    """Open a cassette file, transparently gzip-compressed."""
+    if path.endswith(".gz"):
+        return cast(IO[str], gzip.open(path, mode + "t", encoding="utf-8"))
+    return open(path, mode, encoding="utf-8")
+
+
+def _param_pairs(params: Optional[Mapping[str, Any]]) -> List[Tuple[str, str]]:
+    """Flatten query parameters the way ``requests`` encodes them."""
+    pairs = []
+    for name, value in (params or {}).items():
+        values = value if isinstance(value, (list, tuple)) else [value]
+        for item in values:
+            if item is None:
+                continue
+            if isinstance(item, bool):
+                item = "true" if item else "false"
+            pairs.append((name, str(item)))
+    return pairs
+
+
+class CassetteTransport(Transport):
+    """
+    Transport that records responses to a file and replays them.
+
+    Principles:
+    - Requests match on method, path and normalized query parameters
+    - Replay does no I/O and no socket work, only a dictionary lookup
+    - Repeated requests replay their recorded responses in order, cycling
+      when a test sends more than were recorded
+    - Optional recorded latency for realistic concurrency tests
+
+    Modes:
+    - ``replay``: serve recorded responses; unknown requests raise
+      CassetteMissError
+    - ``record``: send every request through ``inner`` and record it
+    - ``auto``: replay what is recorded and record what is missing
+    """
+
+    def __init__(
+        self,
+        path: str,
+        mode: str = "replay",
+        inner: Optional[Transport] = None,
+        replay_latency: bool = False,
+        latency_scale: float = 1.0,
+        ignore_params: Iterable[str] = (),
+    ):
+        """
+        Initialize cassette transport.
+
+        Args:
+            path: Cassette file (``.gz`` suffix for gzip compression)
+            mode: ``replay``, ``record`` or ``auto``
+            inner: Transport used for recording (a new RequestsTransport when
+                None)
+            replay_latency: Sleep for each response's recorded latency
+            latency_scale: Multiplier applied to recorded latency
+            ignore_params: Query parameters left out of matching, e.g.
+                time windows that differ between runs
+
+        Raises:
+            ValueError: If the mode is unknown
+            FileNotFoundError: If replaying a cassette that does not exist
+        """
+        if mode not in CASSETTE_MODES:
+            raise ValueError(f"mode must be one of {', '.join(CASSETTE_MODES)}")
+        self.path = path
+        self.mode = mode
+        self.replay_latency = replay_latency
+        self.latency_scale = latency_scale
+        self.ignore_params = frozenset(ignore_params)
+        self._inner = inner
+        self._lock = threading.Lock()
+        self._interactions: Dict[CassetteKey, List[TransportResponse]] = defaultdict(
+            list
+        )
+        self._records: List[Dict[str, Any]] = []
+        self._cursors: Dict[CassetteKey, int] = {}
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+        if mode == "replay":
+            self._load()
+        elif mode == "auto":
+            try:
+                self._load()
+            except FileNotFoundError:
+                pass
+
+    @property
+    def inner(self) -> Transport:
+        """Transport used to send requests that are being recorded."""
+        if self._inner is None:
+            self._inner = RequestsTransport()
+        return self._inner
+
+    def __len__(self) -> int:
+        """Return the number of recorded interactions."""
+        return len(self._records)
+
+    def key(self, request: TransportRequest) -> CassetteKey:
+        """
+        Build the matching key of a request.
+
+        Args:
+            request: Request to match
+
+        Returns:
+            Tuple of method, path and sorted query parameters
+        """
+        parts = urlsplit(request.url)
+        pairs = parse_qsl(parts.query, keep_blank_values=True)
+        pairs.extend(_param_pairs(request.params))
+        if self.ignore_params:
+            pairs = [pair for pair in pairs if pair[0] not in self.ignore_params]
+        return request.method, parts.path, tuple(sorted(pairs))
+
+    def send(self, request: TransportRequest) -> TransportResponse:
+        """Replay a recorded response or record a new one, depending on the mode."""
+        key = self.key(request)
+        if self.mode != "record":
+            response = self._replay(key)
+            if response is not None:
+                if self.replay_latency and response.elapsed:
+                    time.sleep(response.elapsed * self.latency_scale)
+                return response
+            if self.mode == "replay":
+                method, path, params = key
+                raise CassetteMissError(
+                    f"No recorded response for {method} {path} "
+                    f"with params {dict(params)}"
+                )
+        return self._record(key, request)
+
+    def save(self) -> None:
+        """Write the recorded interactions to the cassette file."""
+        with self._lock:
+            records = list(self._records)
+            self._dirty = False
+        with _open(self.path, "w") as f:
+            f.write(json.dumps({"version": CASSETTE_VERSION}) + "\n")
+            for record in records:
+                f.write(json.dumps(record, separators=(",", ":")) + "\n")
+        logger.debug("Saved %d interactions to cassette %s", len(records), self.path)
+
+    def close(self) -> None:
+        """Save new recordings and close the inner transport."""
+        if self._dirty:
+            self.save()
+        if self._inner is not None:
+            self._inner.close()
+
+    def _replay(self, key: CassetteKey) -> Optional[TransportResponse]:
+        """Next recorded response for a key, or None."""
+        responses = self._interactions.get(key)
+        if not responses:
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            position = self._cursors.get(key, 0)
+            self._cursors[key] = position + 1
+            self.hits += 1
+        return responses[position % len(responses)]
+
+    def _record(self, key: CassetteKey, request: TransportRequest) -> TransportResponse:
+        """Send a request through the inner transport and record the response."""
+        response = self.inner.send(request)
+        method, path, params = key
+        record = {
+            "method": method,
+            "path": path,
+            "params": [list(pair) for pair in params],
+            "status": response.status_code,
+            "headers": {
+                name.lower(): value
+                for name, value in response.headers.items()
+                if name.lower() in _RECORDED_HEADERS
+            },
+            "body": response.text,
+            "elapsed": round(response.elapsed, 6),
+        }
+        with self._lock:
+            self._records.append(record)
+            self._interactions[key].append(self._response(record))
+            self._dirty = True
+        return response
+
+    def _load(self) -> None:
+        """Read a cassette file into the replay table."""
+        with _open(self.path, "r") as f:
+            header = json.loads(f.readline() or "{}")
+            if header.get("version") != CASSETTE_VERSION:
+                raise ValueError(f"Unsupported cassette format in {self.path}")
+            for line in f:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                key = (
+                    record["method"],
+                    record["path"],
+                    tuple(
+                        sorted(
+                            (name, value)
+                            for name, value in record["params"]
+                            if name not in self.ignore_params
+                        )
+                    ),
+                )
+                self._records.append(record)
+                self._interactions[key].append(self._response(record))
+        logger.debug(
+            "Loaded %d interactions from cassette %s", len(self._records), self.path
+        )
+
+    @staticmethod
+    def _response(record: Dict[str, Any]) -> TransportResponse:
+        """Build the (shared, read-only) response of a record."""
+        return TransportResponse(
+            record["status"],
+            record["headers"],
+            record["body"].encode("utf-8"),
+            record.get("elapsed", 0.0),
+            record["path"],
+        )
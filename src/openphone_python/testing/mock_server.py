@@ -0,0 +1,724 @@
+"""
+In-process mock OpenPhone API server for the OpenPhone Python SDK.
+
+Serves a generated dataset over real HTTP on localhost so the SDK's request,
+pagination and retry paths can be tested and benchmarked offline. Latency,
+page sizes and failures (429 with ``Retry-After``, 5xx) are configurable.
+
+Example:
+    with MockOpenPhoneServer(dataset_size=5000, latency=0.02) as server:
+        client = OpenPhoneClient(api_key=server.api_key, base_url=server.base_url)
+        contacts = client.contacts.get_all()
+"""
+
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from collections import Counter, deque
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, Union
+from urllib.parse import parse_qs, urlsplit
+
+# Latency in seconds, or a callable returning one per request
+Latency = Union[float, Callable[[], float]]
+
+# Parsed query string, JSON request body and (status, payload) of a route handler
+_Query = Dict[str, List[str]]
+_Body = Dict[str, Any]
+_Response = Tuple[int, Optional[Dict[str, Any]]]
+_Handler = Callable[..., _Response]
+
+DEFAULT_API_KEY = "mock-api-key"
+EPOCH = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+# Webhook creation endpoints and the events they accept
+WEBHOOK_ENDPOINTS = {
+    "messages": ("message.received", "message.delivered"),
+    "calls": ("call.completed", "call.ringing", "call.recording.completed"),
+    "call-summaries": ("call.summary.completed",),
+    "call-transcripts": ("call.transcript.completed",),
+}
+
+
+def _timestamp(moment: datetime) -> str:
+    """Format a timestamp the way the API does."""
+    return moment.isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+class MockDataset:
+    """
+    Deterministic dataset served by the mock server.
+
+    Objects are spread over a few phone numbers and a pool of external
+    participants, with one conversation per (phone number, participant)
+    pair. Every call has a recording, summary and transcript.
+    """
+
+    def __init__(self, size: int = 1000, phone_numbers: int = 3, seed: int = 0):
+        """
+        Initialize dataset.
+
+        Args:
+            size: Number of contacts, messages and calls each
+            phone_numbers: Number of OpenPhone numbers in the workspace
+            seed: Random seed
+        """
+        rng = random.Random(seed)
+        participants = [f"+1415555{index:04d}" for index in range(max(1, size // 10))]
+        self.phone_numbers = [
+            {
+                "id": f"PN{index:08d}",
+                "number": f"+1628555{index:04d}",
+                "name": f"Line {index}",
+                "users": [{"id": "US00000000"}],
+                "createdAt": _timestamp(EPOCH),
+            }
+            for index in range(phone_numbers)
+        ]
+        self.contacts: Dict[str, Dict[str, Any]] = {}
+        self.messages: Dict[str, Dict[str, Any]] = {}
+        self.calls: Dict[str, Dict[str, Any]] = {}
+        self.conversations: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self.webhooks: Dict[str, Dict[str, Any]] = {}
+
+        for index in range(size):
+            contact_id = f"CT{index:08d}"
+            self.contacts[contact_id] = {
+                "id": contact_id,
+                "externalId": f"ext-{index}",
+                "source": "mock",
+                "defaultFields": {
+                    "firstName": f"First{index}",
+                    "lastName": f"Last{index}",
+                    "phoneNumbers": [
+                        {
+                            "name": "mobile",
+                            "value": participants[index % len(participants)],
+                        }
+                    ],
+                    "emails": [],
+                },
+                "customFields": [],
+                "createdAt": _timestamp(EPOCH),
+                "updatedAt": _timestamp(EPOCH),
+            }
+
+        for index in range(size):
+            phone_number = self.phone_numbers[index % phone_numbers]
+            participant = participants[rng.randrange(len(participants))]
+            created = EPOCH + timedelta(seconds=index * 60)
+            incoming = rng.random() < 0.5
+            message_id = f"AC{index:08d}"
+            self.messages[message_id] = {
+                "id": message_id,
+                "phoneNumberId": phone_number["id"],
+                "from": participant if incoming else phone_number["number"],
+                "to": [phone_number["number"] if incoming else participant],
+                "text": f"Message {index}",
+                "direction": "incoming" if incoming else "outgoing",
+                "status": "received" if incoming else "delivered",
+                "userId": "US00000000",
+                "createdAt": _timestamp(created),
+                "updatedAt": _timestamp(created),
+            }
+            self._touch_conversation(phone_number, participant, created)
+
+        for index in range(size):
+            phone_number = self.phone_numbers[index % phone_numbers]
+            participant = participants[rng.randrange(len(participants))]
+            created = EPOCH + timedelta(seconds=index * 60 + 30)
+            duration = rng.randrange(5, 600)
+            call_id = f"CA{index:08d}"
+            self.calls[call_id] = {
+                "id": call_id,
+                "phoneNumberId": phone_number["id"],
+                "participants": [participant],
+                "direction": "incoming" if rng.random() < 0.5 else "outgoing",
+                "status": "completed",
+                "duration": duration,
+                "userId": "US00000000",
+                "createdAt": _timestamp(created),
+                "answeredAt": _timestamp(created + timedelta(seconds=2)),
+                "completedAt": _timestamp(created + timedelta(seconds=duration)),
+                "updatedAt": _timestamp(created + timedelta(seconds=duration)),
+            }
+            self._touch_conversation(phone_number, participant, created)
+
+    def _touch_conversation(
+        self, phone_number: Dict[str, Any], participant: str, at: datetime
+    ) -> None:
+        """Create or bump the conversation of a phone number and participant."""
+        key = (phone_number["id"], participant)
+        conversation = self.conversations.get(key)
+        if conversation is None:
+            conversation = self.conversations[key] = {
+                "id": f"CN{len(self.conversations):08d}",
+                "phoneNumberId": phone_number["id"],
+                "participants": [participant],
+                "createdAt": _timestamp(at),
+            }
+        conversation["updatedAt"] = _timestamp(at)
+
+    def recording(self, call: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the recording of a call."""
+        return {
+            "callId": call["id"],
+            "recordingUrl": f"https://storage.example.com/{call['id']}.mp3",
+            "duration": call["duration"],
+            "fileSize": call["duration"] * 16000,
+            "status": "completed",
+            "createdAt": call["completedAt"],
+        }
+
+    def summary(self, call: Dict[str, Any]) -> Dict[str, Any]:
+        """Summary of a call."""
+        return {
+            "callId": call["id"],
+            "summary": [f"Call {call['id']} lasted {call['duration']} seconds."],
+            "nextSteps": ["Follow up"],
+            "status": "completed",
+        }
+
+    def transcript(self, call: Dict[str, Any]) -> Dict[str, Any]:
+        """Transcript of a call."""
+        return {
+            "callId": call["id"],
+            "dialogue": [
+                {
+                    "content": "Hello",
+                    "start": 0.0,
+                    "end": 1.0,
+                    "identifier": call["participants"][0],
+                },
+                {
+                    "content": "Hi, how can I help?",
+                    "start": 1.2,
+                    "end": 3.0,
+                    "identifier": "US00000000",
+                },
+            ],
+            "duration": call["duration"],
+            "status": "completed",
+            "createdAt": call["completedAt"],
+        }
+
+
+class _Route:
+    """HTTP route with a compiled path pattern."""
+
+    def __init__(self, method: str, pattern: str, handler: _Handler, name: str):
+        self.method = method
+        self.regex = re.compile(f"^{pattern}$")
+        self.handler = handler
+        self.name = name
+
+
+class _ApiError(Exception):
+    """Error response raised by a route handler."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class MockOpenPhoneServer:
+    """
+    Threaded local HTTP server emulating the OpenPhone API.
+
+    Principles:
+    - Real sockets and HTTP/1.1 keep-alive, so the SDK's network path runs unchanged
+    - Deterministic dataset and fault injection (seeded)
+    - Per-route request and status counters for assertions and benchmarks
+
+    Failures are injected either randomly (``rate_limit_rate``,
+    ``error_rate``) or deterministically for the next requests with
+    inject().
+    """
+
+    def __init__(
+        self,
+        dataset_size: int = 1000,
+        phone_numbers: int = 3,
+        default_page_size: int = 10,
+        max_page_size: int = 100,
+        latency: Latency = 0.0,
+        rate_limit_rate: float = 0.0,
+        error_rate: float = 0.0,
+        retry_after: Optional[float] = 1,
+        api_key: Optional[str] = DEFAULT_API_KEY,
+        seed: int = 0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        """
+        Initialize mock server.
+
+        Args:
+            dataset_size: Number of contacts, messages and calls each
+            phone_numbers: Number of OpenPhone numbers in the workspace
+            default_page_size: Page size when ``maxResults`` is not sent
+            max_page_size: Largest page size honoured
+            latency: Seconds added to every response, or a callable
+                returning them (e.g. ``lambda: random.expovariate(50)``)
+            rate_limit_rate: Probability of answering 429
+            error_rate: Probability of answering 500, 502 or 503
+            retry_after: ``Retry-After`` seconds sent with 429 and 503
+                (None to omit the header)
+            api_key: Required API key (None accepts any request)
+            seed: Random seed for the dataset and injected failures
+            host: Interface to listen on
+            port: Port to listen on (0 picks a free port)
+        """
+        self.dataset = MockDataset(dataset_size, phone_numbers, seed)
+        self.default_page_size = default_page_size
+        self.max_page_size = max_page_size
+        self.latency = latency
+        self.rate_limit_rate = rate_limit_rate
+        self.error_rate = error_rate
+        self.retry_after = retry_after
+        self.api_key = api_key or DEFAULT_API_KEY
+        self._require_key = api_key is not None
+        self.host = host
+        self.port = port
+        self.requests: "Counter[str]" = Counter()
+        self.statuses: "Counter[int]" = Counter()
+        self._random = random.Random(seed)
+        self._injected: Deque[Tuple[int, Optional[float]]] = deque()
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self._routes = self._build_routes()
+
+    @property
+    def base_url(self) -> str:
+        """Base URL to pass to OpenPhoneClient."""
+        return f"http://{self.host}:{self.port}/v1"
+
+    @property
+    def request_count(self) -> int:
+        """Total number of requests served."""
+        with self._lock:
+            return sum(self.requests.values())
+
+    def start(self) -> "MockOpenPhoneServer":
+        """Start serving on a background thread."""
+        handler = type("Handler", (_RequestHandler,), {"mock": self})
+        self._server = _Server((self.host, self.port), handler)
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="openphone-mock-server", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop the server."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "MockOpenPhoneServer":
+        """Enter context manager, starting the server."""
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Exit context manager, stopping the server."""
+        self.stop()
+
+    def inject(
+        self, status: int, count: int = 1, retry_after: Optional[float] = None
+    ) -> None:
+        """
+        Answer the next ``count`` requests with an error status.
+
+        Args:
+            status: HTTP status to answer with, e.g. 429 or 503
+            count: Number of requests to fail
+            retry_after: ``Retry-After`` seconds (defaults to the server setting)
+        """
+        with self._lock:
+            self._injected.extend([(status, retry_after)] * count)
+
+    def reset_stats(self) -> None:
+        """Clear the request and status counters."""
+        with self._lock:
+            self.requests.clear()
+            self.statuses.clear()
+
+    def handle(
+        self, method: str, target: str, headers: Dict[str, str], body: bytes
+    ) -> Tuple[int, Dict[str, str], Optional[Dict[str, Any]]]:
+        """
+        Produce the response to one request.
+
+        Args:
+            method: HTTP method
+            target: Request path with query string
+            headers: Request headers (lower-case names)
+            body: Raw request body
+
+        Returns:
+            Tuple of status, response headers and JSON payload
+        """
+        split = urlsplit(target)
+        path = split.path.rstrip("/")
+        route, match = self._match(method, path)
+        name = route.name if route else f"{method} {path}"
+
+        status, response_headers, payload = self._fault()
+        if status is None:
+            if self._require_key and headers.get("authorization") != self.api_key:
+                status, payload = 401, {"message": "Unauthorized", "code": "0100401"}
+            elif route is None or match is None:
+                status, payload = 404, {"message": f"Not found: {method} {path}"}
+            else:
+                try:
+                    query = parse_qs(split.query)
+                    data = json.loads(body) if body else {}
+                    status, payload = route.handler(query, data, *match.groups())
+                except _ApiError as e:
+                    status, payload = e.status, {"message": e.message}
+                except ValueError as e:
+                    status, payload = 400, {"message": f"Invalid request: {e}"}
+                except Exception as e:
+                    # A stub bug must not look like a dropped connection
+                    status, payload = 500, {"message": f"Mock server error: {e!r}"}
+
+        with self._lock:
+            self.requests[name] += 1
+            self.statuses[status] += 1
+        return status, response_headers, payload
+
+    def _delay(self) -> float:
+        """Latency for one response."""
+        return self.latency() if callable(self.latency) else self.latency
+
+    def _fault(self) -> Tuple[Optional[int], Dict[str, str], Optional[Dict[str, Any]]]:
+        """Injected failure for this request, if any."""
+        with self._lock:
+            if self._injected:
+                status, retry_after = self._injected.popleft()
+            else:
+                roll = self._random.random()
+                if roll < self.rate_limit_rate:
+                    status, retry_after = 429, None
+                elif roll < self.rate_limit_rate + self.error_rate:
+                    status, retry_after = self._random.choice((500, 502, 503)), None
+                else:
+                    return None, {}, None
+        headers = {}
+        if retry_after is None:
+            retry_after = self.retry_after
+        if status in (429, 503) and retry_after is not None:
+            headers["Retry-After"] = f"{retry_after:g}"
+        message = "Rate limit exceeded" if status == 429 else "Injected server error"
+        return status, headers, {"message": message}
+
+    def _match(
+        self, method: str, path: str
+    ) -> Tuple[Optional[_Route], Optional["re.Match[str]"]]:
+        """Find the route of a request."""
+        for route in self._routes:
+            if route.method == method:
+                match = route.regex.match(path)
+                if match:
+                    return route, match
+        return None, None
+
+    def _build_routes(self) -> List[_Route]:
+        """Routes of the endpoints covered by the SDK."""
+        table: List[Tuple[str, str, _Handler]] = [
+            ("GET", r"/v1/phone-numbers", self._list_phone_numbers),
+            ("GET", r"/v1/messages", self._list_messages),
+            ("POST", r"/v1/messages", self._send_message),
+            ("GET", r"/v1/messages/([^/]+)", self._get_message),
+            ("GET", r"/v1/contacts", self._list_contacts),
+            ("POST", r"/v1/contacts", self._create_contact),
+            ("GET", r"/v1/contacts/([^/]+)", self._get_contact),
+            ("PATCH", r"/v1/contacts/([^/]+)", self._update_contact),
+            ("DELETE", r"/v1/contacts/([^/]+)", self._delete_contact),
+            ("GET", r"/v1/contact-custom-fields", self._list_custom_fields),
+            ("GET", r"/v1/calls", self._list_calls),
+            ("GET", r"/v1/calls/([^/]+)", self._get_call),
+            ("GET", r"/v1/call-recordings/([^/]+)", self._call_artefact("recording")),
+            ("GET", r"/v1/call-summaries/([^/]+)", self._call_artefact("summary")),
+            ("GET", r"/v1/call-transcripts/([^/]+)", self._call_artefact("transcript")),
+            ("GET", r"/v1/conversations", self._list_conversations),
+            ("GET", r"/v1/webhooks", self._list_webhooks),
+            ("POST", r"/v1/webhooks/([a-z-]+)", self._create_webhook),
+            ("GET", r"/v1/webhooks/([^/]+)", self._get_webhook),
+            ("DELETE", r"/v1/webhooks/([^/]+)", self._delete_webhook),
+        ]
+        routes = []
+        for method, pattern, handler in table:
+            name = f"{method} " + re.sub(r"\(.*?\)", "{id}", pattern)
+            routes.append(_Route(method, pattern, handler, name))
+        return routes
+
+    # Route handlers return (status, payload)
+
+    def _page(self, items: List[Dict[str, Any]], query: _Query) -> _Response:
+        """Paginate a filtered list with maxResults/pageToken."""
+        size = int(query.get("maxResults", [self.default_page_size])[0])
+        size = max(1, min(size, self.max_page_size))
+        start = int(query.get("pageToken", ["0"])[0] or 0)
+        page = items[start : start + size]
+        payload: Dict[str, Any] = {"data": page, "totalItems": len(items)}
+        if start + size < len(items):
+            payload["nextPageToken"] = str(start + size)
+        return 200, payload
+
+    @staticmethod
+    def _created_between(item: Dict[str, Any], query: _Query, field: str) -> bool:
+        """Whether a timestamp field lies within the query's after/before bounds."""
+        prefix = "created" if field == "createdAt" else "updated"
+        after = query.get(f"{prefix}After")
+        before = query.get(f"{prefix}Before")
+        value = datetime.fromisoformat(item[field])
+        if after and value <= datetime.fromisoformat(after[0]):
+            return False
+        if before and value >= datetime.fromisoformat(before[0]):
+            return False
+        return True
+
+    def _get(
+        self, collection: Dict[str, Dict[str, Any]], object_id: str
+    ) -> Dict[str, Any]:
+        """Look up an object or answer 404."""
+        item = collection.get(object_id)
+        if item is None:
+            raise _ApiError(404, f"Not found: {object_id}")
+        return item
+
+    def _snapshot(self, collection: Dict[Any, Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Objects of a collection, copied under the lock writers hold."""
+        with self._lock:
+            return list(collection.values())
+
+    def _list_phone_numbers(self, query: _Query, data: _Body) -> _Response:
+        return 200, {"data": self.dataset.phone_numbers}
+
+    def _list_messages(self, query: _Query, data: _Body) -> _Response:
+        phone_number_id = query.get("phoneNumberId", [None])[0]
+        participants = set(query.get("participants", []))
+        if not phone_number_id or not participants:
+            raise _ApiError(400, "phoneNumberId and participants are required")
+        items = [
+            message
+            for message in self._snapshot(self.dataset.messages)
+            if message["phoneNumberId"] == phone_number_id
+            and participants & {message["from"], *message["to"]}
+            and self._created_between(message, query, "createdAt")
+        ]
+        return self._page(items, query)
+
+    def _send_message(self, query: _Query, data: _Body) -> _Response:
+        if not data.get("to") or not data.get("content") or not data.get("from"):
+            raise _ApiError(400, "from, to and content are required")
+        phone_number = next(
+            (
+                number
+                for number in self.dataset.phone_numbers
+                if data["from"] in (number["id"], number["number"])
+            ),
+            None,
+        )
+        if phone_number is None:
+            raise _ApiError(400, f"Unknown phone number: {data['from']}")
+        message_id = f"AC{uuid.uuid4().hex[:24]}"
+        now = _timestamp(datetime.now(timezone.utc))
+        message = {
+            "id": message_id,
+            "phoneNumberId": phone_number["id"],
+            "from": phone_number["number"],
+            "to": data["to"],
+            "text": data["content"],
+            "direction": "outgoing",
+            "status": "queued",
+            "userId": data.get("userId", "US00000000"),
+            "createdAt": now,
+            "updatedAt": now,
+        }
+        with self._lock:
+            self.dataset.messages[message_id] = message
+        return 202, {"data": message}
+
+    def _get_message(self, query: _Query, data: _Body, message_id: str) -> _Response:
+        return 200, {"data": self._get(self.dataset.messages, message_id)}
+
+    def _list_contacts(self, query: _Query, data: _Body) -> _Response:
+        external_ids = set(query.get("externalIds", []))
+        sources = set(query.get("sources", []))
+        items = [
+            contact
+            for contact in self._snapshot(self.dataset.contacts)
+            if (not external_ids or contact.get("externalId") in external_ids)
+            and (not sources or contact.get("source") in sources)
+        ]
+        return self._page(items, query)
+
+    def _create_contact(self, query: _Query, data: _Body) -> _Response:
+        if "defaultFields" not in data:
+            raise _ApiError(400, "defaultFields is required")
+        contact_id = f"CT{uuid.uuid4().hex[:24]}"
+        now = _timestamp(datetime.now(timezone.utc))
+        contact = {
+            "customFields": [],
+            **data,
+            "id": contact_id,
+            "createdAt": now,
+            "updatedAt": now,
+        }
+        with self._lock:
+            self.dataset.contacts[contact_id] = contact
+        return 201, {"data": contact}
+
+    def _get_contact(self, query: _Query, data: _Body, contact_id: str) -> _Response:
+        return 200, {"data": self._get(self.dataset.contacts, contact_id)}
+
+    def _update_contact(self, query: _Query, data: _Body, contact_id: str) -> _Response:
+        with self._lock:
+            # Replace rather than mutate, so snapshots being serialized stay intact
+            contact = dict(self._get(self.dataset.contacts, contact_id))
+            for key, value in data.items():
+                if isinstance(value, dict) and isinstance(contact.get(key), dict):
+                    contact[key] = {**contact[key], **value}
+                else:
+                    contact[key] = value
+            contact["updatedAt"] = _timestamp(datetime.now(timezone.utc))
+            self.dataset.contacts[contact_id] = contact
+        return 200, {"data": contact}
+
+    def _delete_contact(self, query: _Query, data: _Body, contact_id: str) -> _Response:
+        with self._lock:
+            self._get(self.dataset.contacts, contact_id)
+            del self.dataset.contacts[contact_id]
+        return 204, None
+
+    def _list_custom_fields(self, query: _Query, data: _Body) -> _Response:
+        return 200, {"data": [{"key": "CF1", "name": "Plan", "type": "string"}]}
+
+    def _list_calls(self, query: _Query, data: _Body) -> _Response:
+        phone_number_id = query.get("phoneNumberId", [None])[0]
+        participants = query.get("participants", [])
+        if not phone_number_id or len(participants) != 1:
+            raise _ApiError(400, "phoneNumberId and one participant are required")
+        items = [
+            call
+            for call in self._snapshot(self.dataset.calls)
+            if call["phoneNumberId"] == phone_number_id
+            and call["participants"] == participants
+            and self._created_between(call, query, "createdAt")
+        ]
+        return self._page(items, query)
+
+    def _get_call(self, query: _Query, data: _Body, call_id: str) -> _Response:
+        return 200, {"data": self._get(self.dataset.calls, call_id)}
+
+    def _call_artefact(self, kind: str) -> _Handler:
+        """Build a handler serving one kind of call artefact."""
+        build = getattr(self.dataset, kind)
+
+        def handler(query: _Query, data: _Body, call_id: str) -> _Response:
+            return 200, {"data": build(self._get(self.dataset.calls, call_id))}
+
+        return handler
+
+    def _list_conversations(self, query: _Query, data: _Body) -> _Response:
+        numbers = set(query.get("phoneNumbers", []) + query.get("phoneNumber", []))
+        ids = {
+            number["id"]
+            for number in self.dataset.phone_numbers
+            if number["number"] in numbers
+        }
+        items = [
+            conversation
+            for conversation in self._snapshot(self.dataset.conversations)
+            if (not numbers or conversation["phoneNumberId"] in ids)
+            and self._created_between(conversation, query, "updatedAt")
+        ]
+        return self._page(items, query)
+
+    def _list_webhooks(self, query: _Query, data: _Body) -> _Response:
+        return 200, {"data": self._snapshot(self.dataset.webhooks)}
+
+    def _create_webhook(self, query: _Query, data: _Body, kind: str) -> _Response:
+        allowed = WEBHOOK_ENDPOINTS.get(kind)
+        if allowed is None:
+            raise _ApiError(404, f"Not found: webhooks/{kind}")
+        events = data.get("events") or []
+        if not data.get("url") or not events or not set(events) <= set(allowed):
+            raise _ApiError(400, f"url and events from {list(allowed)} are required")
+        webhook_id = f"WH{uuid.uuid4().hex[:24]}"
+        webhook = {
+            "id": webhook_id,
+            "url": data["url"],
+            "events": events,
+            "resourceIds": data.get("resourceIds") or ["*"],
+            "label": data.get("label", ""),
+            "status": data.get("status", "enabled"),
+            "key": uuid.uuid4().hex,
+            "createdAt": _timestamp(datetime.now(timezone.utc)),
+        }
+        with self._lock:
+            self.dataset.webhooks[webhook_id] = webhook
+        return 201, {"data": webhook}
+
+    def _get_webhook(self, query: _Query, data: _Body, webhook_id: str) -> _Response:
+        return 200, {"data": self._get(self.dataset.webhooks, webhook_id)}
+
+    def _delete_webhook(self, query: _Query, data: _Body, webhook_id: str) -> _Response:
+        with self._lock:
+            self._get(self.dataset.webhooks, webhook_id)
+            del self.dataset.webhooks[webhook_id]
+        return 204, None
+
+
+class _Server(ThreadingHTTPServer):
+    """Threaded HTTP server with a deep accept backlog."""
+
+    daemon_threads = True
+    request_queue_size = 1024
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    """HTTP/1.1 keep-alive handler delegating to MockOpenPhoneServer.handle()."""
+
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately; without TCP_NODELAY every
+    # keep-alive response waits for the client's delayed ACK (~40 ms)
+    disable_nagle_algorithm = True
+    mock: MockOpenPhoneServer
+
+    def _serve(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        headers = {key.lower(): value for key, value in self.headers.items()}
+        status, response_headers, payload = self.mock.handle(
+            self.command, self.path, headers, body
+        )
+
+        delay = self.mock._delay()
+        if delay > 0:
+            time.sleep(delay)
+
+        content = json.dumps(payload).encode() if payload is not None else b""
+        self.send_response(status)
+        for key, value in response_headers.items():
+            self.send_header(key, value)
+        if content:
+            self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    do_GET = do_POST = do_PATCH = do_PUT = do_DELETE = _serve
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """Silence per-request logging."""
@@ -0,0 +1,64 @@
+"""
+HTTP transports for the OpenPhone Python SDK.
+
+Pass a transport, or the name of one, to ``OpenPhoneClient(transport=...)``
+to change how requests are sent; the default sends them with ``requests``.
+"""
+
+from typing import Callable, Dict
+from .base import Transport, TransportRequest, TransportResponse
+from .http import RequestsTransport
+from .http2 import HTTPXTransport
+from .memory import InMemoryTransport, json_response
+from .recording import RecordingTransport
+
+# Transports that can be chosen by name, e.g. from deployment configuration;
+# each factory takes the connection pool size
+TRANSPORTS: Dict[str, Callable[[int], Transport]] = {
+    "requests": lambda pool_maxsize: RequestsTransport(pool_maxsize=pool_maxsize),
+    "httpx": lambda pool_maxsize: HTTPXTransport(
+        http2=False, max_connections=pool_maxsize
+    ),
+    "http2": lambda pool_maxsize: HTTPXTransport(
+        http2=True, max_connections=pool_maxsize
+    ),
+    "memory": lambda pool_maxsize: InMemoryTransport(),
+}
+
+
+def create_transport(name: str, pool_maxsize: int = 32) -> Transport:
+    """
+    Create a transport by name.
+
+    Args:
+        name: One of ``requests``, ``httpx``, ``http2`` or ``memory``
+        pool_maxsize: Maximum pooled connections
+
+    Returns:
+        New transport
+
+    Raises:
+        ValueError: If the name is unknown
+        ImportError: If the transport's optional dependency is missing
+    """
+    try:
+        factory = TRANSPORTS[name.lower()]
+    except KeyError:
+        raise ValueError(
+            f"Unknown transport {name!r}; expected one of {', '.join(TRANSPORTS)}"
+        ) from None
+    return factory(pool_maxsize)
+
+
+__all__ = [
+    "Transport",
+    "TransportRequest",
+    "TransportResponse",
+    "RequestsTransport",
+    "HTTPXTransport",
+    "InMemoryTransport",
+    "RecordingTransport",
+    "TRANSPORTS",
+    "create_transport",
+    "json_response",
+]
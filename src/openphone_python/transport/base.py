@@ -0,0 +1,149 @@
+"""
+Transport interface for the OpenPhone Python SDK.
+
+A transport sends one HTTP request and returns the status, headers and body.
+Resources and the raw request helpers build a TransportRequest and hand it
+to the client's transport, so the HTTP stack can be swapped without touching
+retries, validation or model parsing.
+"""
+
+import json
+from typing import Any, Dict, Mapping, Optional
+from requests.structures import CaseInsensitiveDict
+
+
+class TransportRequest:
+    """HTTP request handed to a transport."""
+
+    __slots__ = ("method", "url", "params", "json", "headers", "timeout", "options")
+
+    def __init__(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Any] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        timeout: Optional[float] = None,
+        options: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Initialize transport request.
+
+        Args:
+            method: HTTP method
+            url: Absolute URL
+            params: Query parameters
+            json: JSON body
+            headers: Request headers
+            timeout: Timeout in seconds
+            options: Transport-specific options
+        """
+        self.method = method.upper()
+        self.url = url
+        self.params = params
+        self.json = json
+        self.headers = headers or {}
+        self.timeout = timeout
+        # Extra keyword arguments understood by a specific transport
+        self.options = options or {}
+
+    def __repr__(self) -> str:
+        """Return the string representation of the request."""
+        return f"TransportRequest({self.method} {self.url})"
+
+
+class TransportResponse:
+    """
+    HTTP response returned by a transport.
+
+    Exposes the parts of ``requests.Response`` the SDK relies on
+    (``status_code``, ``headers``, ``content``, ``text``, ``json()``), so
+    code written against the raw helpers keeps working.
+    """
+
+    def __init__(
+        self,
+        status_code: int,
+        headers: Optional[Mapping[str, str]] = None,
+        content: bytes = b"",
+        elapsed: float = 0.0,
+        url: str = "",
+    ):
+        """
+        Initialize transport response.
+
+        Args:
+            status_code: HTTP status code
+            headers: Response headers
+            content: Raw response body
+            elapsed: Seconds the request took
+            url: Final URL of the request
+        """
+        self.status_code = status_code
+        self.headers = CaseInsensitiveDict(headers or {})
+        self.content = content
+        self.elapsed = elapsed
+        self.url = url
+
+    @property
+    def ok(self) -> bool:
+        """Whether the status code is below 400."""
+        return self.status_code < 400
+
+    @property
+    def text(self) -> str:
+        """Body decoded as UTF-8."""
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        """
+        Parse the body as JSON.
+
+        Raises:
+            ValueError: If the body is not valid JSON
+        """
+        return json.loads(self.content)
+
+    def __repr__(self) -> str:
+        """Return the string representation of the response."""
+        return f"TransportResponse({self.status_code})"
+
+
+class Transport:
+    """
+    Base class for HTTP transports.
+
+    Principles:
+    - One method to implement: send()
+    - Network failures are raised as ``requests.RequestException``
+      subclasses (``ConnectionError``, ``ConnectTimeout``, ``Timeout``), so
+      retry decisions stay the same for every transport
+    - Safe to share between threads and resources
+    """
+
+    def send(self, request: TransportRequest) -> TransportResponse:
+        """
+        Send a request.
+
+        Args:
+            request: Request to send
+
+        Returns:
+            TransportResponse for any HTTP status
+
+        Raises:
+            requests.RequestException: If no response was received
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Release connections held by the transport."""
+
+    def __enter__(self) -> "Transport":
+        """Enter context manager."""
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Exit context manager, closing the transport."""
+        self.close()
@@ -0,0 +1,55 @@
+"""requests-based transport for the OpenPhone Python SDK."""
+
+from typing import Optional
+import requests
+from .base import Transport, TransportRequest, TransportResponse
+
+
+class RequestsTransport(Transport):
+    """
+    Default transport sending requests through a ``requests.Session``.
+
+    Connections are pooled and kept alive by the session's adapters.
+    """
+
+    def __init__(
+        self, session: Optional[requests.Session] = None, pool_maxsize: int = 32
+    ):
+        """
+        Initialize requests transport.
+
+        Args:
+            session: Session to send through (a new pooled session when None)
+            pool_maxsize: Connection pool size of a new session
+        """
+        if session is None:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=pool_maxsize, pool_maxsize=pool_maxsize
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        self.session = session
+
+    def send(self, request: TransportRequest) -> TransportResponse:
+        """Send a request through the pooled requests session."""
+        response = self.session.request(
+            method=request.method,
+            url=request.url,
+            params=request.params,
+            json=request.json,
+            headers=request.headers,
+            timeout=request.timeout,
+            **request.options,
+        )
+        return TransportResponse(
+            response.status_code,
+            response.headers,
+            response.content,
+            response.elapsed.total_seconds(),
+            response.url,
+        )
+
+    def close(self) -> None:
+        """Close the session and its pooled connections."""
+        self.session.close()
@@ -0,0 +1,89 @@
+"""
+httpx-based transport with HTTP/2 support for the OpenPhone Python SDK.
+
+Requires the optional ``http2`` extra::
+
+    pip install "openphone-python[http2]"
+"""
+
+from typing import Any, Optional
+import requests
+from .base import Transport, TransportRequest, TransportResponse
+
+
+class HTTPXTransport(Transport):
+    """
+    Transport sending requests through an ``httpx.Client``.
+
+    With ``http2=True`` concurrent requests are multiplexed over a few
+    connections instead of one connection each, which cuts connection
+    setup and pool contention for bulk operations.
+
+    httpx errors are translated to the equivalent ``requests`` exceptions,
+    so retries behave as with the default transport.
+    """
+
+    def __init__(
+        self,
+        http2: bool = True,
+        max_connections: int = 32,
+        client: Optional[Any] = None,
+    ):
+        """
+        Initialize httpx transport.
+
+        Args:
+            http2: Negotiate HTTP/2 where the server supports it
+            max_connections: Connection pool size of a new client
+            client: Existing ``httpx.Client`` to send through
+
+        Raises:
+            ImportError: If httpx (and h2 for HTTP/2) is not installed
+        """
+        try:
+            import httpx
+        except ImportError as e:
+            raise ImportError(
+                'HTTPXTransport requires httpx: pip install "openphone-python[http2]"'
+            ) from e
+        self._httpx = httpx
+        if client is None:
+            client = httpx.Client(
+                http2=http2,
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_connections,
+                ),
+            )
+        self.client = client
+
+    def send(self, request: TransportRequest) -> TransportResponse:
+        """Send a request through the httpx client."""
+        httpx = self._httpx
+        try:
+            response = self.client.request(
+                request.method,
+                request.url,
+                params=request.params,
+                json=request.json,
+                headers=dict(request.headers),
+                timeout=request.timeout,
+                **request.options,
+            )
+        except httpx.ConnectTimeout as e:
+            raise requests.ConnectTimeout(str(e)) from e
+        except httpx.TimeoutException as e:
+            raise requests.Timeout(str(e)) from e
+        except httpx.TransportError as e:
+            raise requests.ConnectionError(str(e)) from e
+        return TransportResponse(
+            response.status_code,
+            response.headers,
+            response.content,
+            response.elapsed.total_seconds(),
+            str(response.url),
+        )
+
+    def close(self) -> None:
+        """Close the httpx client and its connections."""
+        self.client.close()
@@ -0,0 +1,88 @@
+"""In-memory transport for the OpenPhone Python SDK."""
+
+import json
+import threading
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, Union
+from urllib.parse import urlsplit
+from .base import Transport, TransportRequest, TransportResponse
+
+# A route answers with a response, or a callable building one per request
+Route = Union[TransportResponse, Callable[[TransportRequest], TransportResponse]]
+
+
+class InMemoryTransport(Transport):
+    """
+    Transport answering requests from registered routes, without sockets.
+
+    Routes match on method and the end of the URL path, so ``"contacts"``
+    answers ``GET https://api.openphone.com/v1/contacts`` whatever the
+    client's base URL. Unmatched requests get a 404 like the API would
+    return. Every request is kept in ``requests`` for assertions.
+    """
+
+    def __init__(self) -> None:
+        """Initialize in-memory transport."""
+        self._routes: Dict[Tuple[str, str], Route] = {}
+        self._lock = threading.Lock()
+        self.requests: List[TransportRequest] = []
+
+    def add(
+        self,
+        method: str,
+        path: str,
+        json_body: Any = None,
+        status: int = 200,
+        headers: Optional[Mapping[str, str]] = None,
+        handler: Optional[Callable[[TransportRequest], TransportResponse]] = None,
+    ) -> None:
+        """
+        Register a route.
+
+        Args:
+            method: HTTP method
+            path: Endpoint path, e.g. ``"contacts"`` or ``"calls/AC123"``
+            json_body: Body to return, serialized as JSON
+            status: Status code to return
+            headers: Extra response headers
+            handler: Callable building the response per request, used instead
+                of ``json_body``/``status``
+        """
+        route: Route
+        if handler is not None:
+            route = handler
+        else:
+            route = json_response(
+                json_body if json_body is not None else {}, status, headers
+            )
+        self._routes[(method.upper(), "/" + path.strip("/"))] = route
+
+    def send(self, request: TransportRequest) -> TransportResponse:
+        """Answer a request from the registered routes."""
+        with self._lock:
+            self.requests.append(request)
+        path = urlsplit(request.url).path.rstrip("/")
+        for (method, suffix), route in self._routes.items():
+            if method == request.method and path.endswith(suffix):
+                return route(request) if callable(route) else route
+        return json_response(
+            {"message": f"No route for {request.method} {path}", "code": "0000404"}, 404
+        )
+
+
+def json_response(
+    body: Any, status: int = 200, headers: Optional[Mapping[str, str]] = None
+) -> TransportResponse:
+    """
+    Build a JSON TransportResponse.
+
+    Args:
+        body: JSON-serializable body
+        status: Status code
+        headers: Extra response headers
+
+    Returns:
+        TransportResponse with a JSON content type
+    """
+    response_headers = {"Content-Type": "application/json"}
+    response_headers.update(headers or {})
+    return TransportResponse(status, response_headers, json.dumps(body).encode("utf-8"))
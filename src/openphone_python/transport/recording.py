@@ -0,0 +1,48 @@
+"""Recording transport for the OpenPhone Python SDK."""
+
+import threading
+import time
+from collections import deque
+from typing import Deque, Optional, Tuple
+from .base import Transport, TransportRequest, TransportResponse
+
+
+class RecordingTransport(Transport):
+    """
+    Transport wrapper keeping every exchange of an inner transport.
+
+    Useful for inspecting what a workload sends, or for measuring latency
+    as seen by the SDK, without changing how requests are sent.
+    """
+
+    def __init__(self, inner: Transport, max_exchanges: Optional[int] = None):
+        """
+        Initialize recording transport.
+
+        Args:
+            inner: Transport that sends the requests
+            max_exchanges: Keep only the most recent exchanges (all when None)
+        """
+        self.inner = inner
+        self._lock = threading.Lock()
+        self.exchanges: Deque[Tuple[TransportRequest, TransportResponse, float]] = (
+            deque(maxlen=max_exchanges)
+        )
+
+    def send(self, request: TransportRequest) -> TransportResponse:
+        """Send a request through the wrapped transport and record it."""
+        start = time.perf_counter()
+        response = self.inner.send(request)
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            self.exchanges.append((request, response, elapsed))
+        return response
+
+    def clear(self) -> None:
+        """Forget the recorded exchanges."""
+        with self._lock:
+            self.exchanges.clear()
+
+    def close(self) -> None:
+        """Close the wrapped transport."""
+        self.inner.close()
@@ -16,6 +16,25 @@ from .formatting import (
     extract_country_code,
     is_valid_phone_number,
 )
+from .concurrency import (
+    RateLimiter,
+    AdaptiveConcurrencyLimiter,
+    PRIORITIES,
+    request_priority,
+    current_priority,
+    BatchItemResult,
+    BatchResult,
+    run_concurrently,
+    iter_chunks,
+)
+from .polling import ArtefactWaiter
+from .metrics import MetricsRegistry, endpoint_template
+from .hooks import RequestEvent, RequestHooks
+from .tracing import InMemorySpanExporter, Span, Tracer
+from .request_log import SlowRequestLogger, response_preview
+from .rate_limit import RateLimitState, parse_retry_after
+from .circuit_breaker import CircuitBreaker
+from .hedging import HedgingPolicy
 from .raw_request import (
     raw_request,
     raw_request_with_response_object,
@@ -32,6 +51,29 @@ __all__ = [
     "format_phone_numbers_list",
     "extract_country_code",
     "is_valid_phone_number",
+    "RateLimiter",
+    "AdaptiveConcurrencyLimiter",
+    "PRIORITIES",
+    "request_priority",
+    "current_priority",
+    "BatchItemResult",
+    "BatchResult",
+    "run_concurrently",
+    "iter_chunks",
+    "ArtefactWaiter",
+    "MetricsRegistry",
+    "endpoint_template",
+    "RequestEvent",
+    "RequestHooks",
+    "InMemorySpanExporter",
+    "Span",
+    "Tracer",
+    "SlowRequestLogger",
+    "response_preview",
+    "RateLimitState",
+    "parse_retry_after",
+    "CircuitBreaker",
+    "HedgingPolicy",
     "raw_request",
     "raw_request_with_response_object",
 ]
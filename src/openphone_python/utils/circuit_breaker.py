@@ -0,0 +1,268 @@
+"""
+Per-endpoint circuit breaker for the OpenPhone Python SDK.
+
+A CircuitBreaker passed to ``OpenPhoneClient(circuit_breaker=...)`` tracks
+the recent outcome of requests per endpoint template. Once the share of
+server errors and network failures crosses a threshold, the endpoint's
+circuit opens and requests to it raise CircuitOpenError immediately instead
+of tying up worker threads. After ``reset_timeout`` a probe request is let
+through (half-open); its success closes the circuit, its failure reopens it.
+
+Example:
+    breaker = CircuitBreaker(failure_threshold=0.5, reset_timeout=30)
+    client = OpenPhoneClient(api_key=api_key, circuit_breaker=breaker)
+    try:
+        transcript = client.call_transcripts.get(call_id)
+    except CircuitOpenError as e:
+        schedule_later(call_id, delay=e.retry_after)
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+from openphone_python.utils.metrics import endpoint_template
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+CIRCUIT_STATES = (CLOSED, HALF_OPEN, OPEN)
+
+
+class _Circuit:
+    """State of one endpoint's circuit."""
+
+    __slots__ = ("state", "outcomes", "opened_at", "probes")
+
+    def __init__(self) -> None:
+        self.state = CLOSED
+        # (monotonic time, failed) within the window
+        self.outcomes: Deque[Tuple[float, bool]] = deque()
+        self.opened_at = 0.0
+        self.probes = 0
+
+
+class CircuitBreaker:
+    """
+    Closed/open/half-open circuit per endpoint template.
+
+    Principles:
+    - Only server errors (5xx) and network failures count; 4xx and 429 are
+      answers from a healthy endpoint
+    - Error rate over a sliding time window, with a minimum request count
+      so a single failure never opens a quiet endpoint
+    - Limited probes while half-open, so recovery is tested, not stampeded
+    - One lock, a deque append per request
+
+    Listeners registered with subscribe() are called with the endpoint
+    template and the new state on every transition; the client uses this
+    to report states to its MetricsRegistry.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: float = 0.5,
+        min_requests: int = 10,
+        window: float = 30.0,
+        reset_timeout: float = 30.0,
+        half_open_probes: int = 1,
+    ):
+        """
+        Initialize circuit breaker.
+
+        Args:
+            failure_threshold: Share of failed requests within the window
+                that opens the circuit
+            min_requests: Requests within the window before the error rate
+                is judged
+            window: Seconds of history the error rate is computed over
+            reset_timeout: Seconds an open circuit waits before probing
+            half_open_probes: Requests let through at once while half-open
+
+        Raises:
+            ValueError: If a setting is out of range
+        """
+        if not 0 < failure_threshold <= 1:
+            raise ValueError("failure_threshold must be between 0 and 1")
+        if min_requests < 1 or half_open_probes < 1:
+            raise ValueError("min_requests and half_open_probes must be at least 1")
+        self.failure_threshold = failure_threshold
+        self.min_requests = min_requests
+        self.window = window
+        self.reset_timeout = reset_timeout
+        self.half_open_probes = half_open_probes
+        self._lock = threading.Lock()
+        self._circuits: Dict[str, _Circuit] = {}
+        self._listeners: List[Callable[[str, str], Any]] = []
+
+    def subscribe(self, listener: Callable[[str, str], Any]) -> None:
+        """
+        Call a listener on every state transition.
+
+        Args:
+            listener: Callable invoked with the endpoint template and new state
+        """
+        with self._lock:
+            self._listeners = [*self._listeners, listener]
+
+    def allow(self, endpoint: str) -> bool:
+        """
+        Whether a request to an endpoint may be sent now.
+
+        A True answer while half-open takes one of the probe slots, which
+        is given back by the record() call for that request.
+
+        Args:
+            endpoint: Endpoint path (IDs are templated)
+
+        Returns:
+            False if the circuit is open
+        """
+        key = endpoint_template(endpoint)
+        circuit = self._circuits.get(key)
+        if circuit is None or circuit.state == CLOSED:
+            return True
+        with self._lock:
+            if circuit.state == OPEN:
+                if time.monotonic() - circuit.opened_at < self.reset_timeout:
+                    return False
+                self._transition(key, circuit, HALF_OPEN)
+            if circuit.state == HALF_OPEN:
+                if circuit.probes >= self.half_open_probes:
+                    return False
+                circuit.probes += 1
+            return True
+
+    def record(self, endpoint: str, success: bool) -> None:
+        """
+        Record the outcome of a request allowed by allow().
+
+        Args:
+            endpoint: Endpoint path (IDs are templated)
+            success: False for a 5xx response or a network failure
+        """
+        key = endpoint_template(endpoint)
+        now = time.monotonic()
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is None:
+                circuit = self._circuits[key] = _Circuit()
+            if circuit.state == HALF_OPEN:
+                circuit.probes = max(0, circuit.probes - 1)
+                if success:
+                    circuit.outcomes.clear()
+                    self._transition(key, circuit, CLOSED)
+                else:
+                    circuit.opened_at = now
+                    self._transition(key, circuit, OPEN)
+                return
+            if circuit.state == OPEN:
+                # A request sent before the circuit opened
+                return
+            outcomes = circuit.outcomes
+            outcomes.append((now, not success))
+            oldest = now - self.window
+            while outcomes and outcomes[0][0] < oldest:
+                outcomes.popleft()
+            if success or len(outcomes) < self.min_requests:
+                return
+            failures = sum(1 for _, failed in outcomes if failed)
+            if failures / len(outcomes) >= self.failure_threshold:
+                circuit.opened_at = now
+                self._transition(key, circuit, OPEN)
+                logger.warning(
+                    "Circuit opened for %s after %d failures in %d requests",
+                    key,
+                    failures,
+                    len(outcomes),
+                )
+
+    def retry_after(self, endpoint: str) -> Optional[float]:
+        """
+        Seconds until an open circuit lets a probe through.
+
+        Args:
+            endpoint: Endpoint path (IDs are templated)
+
+        Returns:
+            Seconds, or None if the circuit is not open
+        """
+        circuit = self._circuits.get(endpoint_template(endpoint))
+        if circuit is None or circuit.state != OPEN:
+            return None
+        return max(0.0, circuit.opened_at + self.reset_timeout - time.monotonic())
+
+    def state(self, endpoint: str) -> str:
+        """
+        Return the current state of an endpoint's circuit.
+
+        Args:
+            endpoint: Endpoint path (IDs are templated)
+
+        Returns:
+            ``closed``, ``open`` or ``half_open``
+        """
+        circuit = self._circuits.get(endpoint_template(endpoint))
+        return circuit.state if circuit is not None else CLOSED
+
+    def reset(self, endpoint: Optional[str] = None) -> None:
+        """
+        Close one endpoint's circuit, or all of them.
+
+        Args:
+            endpoint: Endpoint path (all endpoints when None)
+        """
+        with self._lock:
+            if endpoint is None:
+                keys = list(self._circuits)
+            else:
+                keys = [endpoint_template(endpoint)]
+            for key in keys:
+                circuit = self._circuits.pop(key, None)
+                if circuit is not None and circuit.state != CLOSED:
+                    self._notify(key, CLOSED)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        State of every endpoint seen.
+
+        Returns:
+            Dict keyed by endpoint template with state, requests and
+            failures within the window, and retry_after
+        """
+        with self._lock:
+            items = list(self._circuits.items())
+        return {
+            key: {
+                "state": circuit.state,
+                "requests": len(circuit.outcomes),
+                "failures": sum(1 for _, failed in list(circuit.outcomes) if failed),
+                "retry_after": self.retry_after(key),
+            }
+            for key, circuit in sorted(items)
+        }
+
+    def _transition(self, key: str, circuit: _Circuit, state: str) -> None:
+        """Change a circuit's state; caller holds the lock."""
+        circuit.state = state
+        if state != HALF_OPEN:
+            circuit.probes = 0
+        self._notify(key, state)
+
+    def _notify(self, key: str, state: str) -> None:
+        """Call the listeners of a transition."""
+        for listener in self._listeners:
+            try:
+                listener(key, state)
+            except Exception as e:
+                logger.error("Circuit breaker listener failed: %s", e, exc_info=True)
+
+    def __repr__(self) -> str:
+        """Return the string representation of the breaker."""
+        opened = sum(
+            1 for circuit in self._circuits.values() if circuit.state != CLOSED
+        )
+        return f"CircuitBreaker(endpoints={len(self._circuits)}, open={opened})"
@@ -0,0 +1,671 @@
+"""
+Concurrency utilities for the OpenPhone Python SDK.
+
+Building blocks for the bulk and fan-out operations on resources: a
+thread-safe token bucket for pacing requests, an adaptive limit on
+requests in flight with priority classes, and a bounded, cancellable
+thread pool runner that streams per-item results.
+"""
+
+import contextvars
+import math
+import threading
+import time
+from contextlib import contextmanager
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+)
+from openphone_python.exceptions import OperationCancelledError
+from openphone_python.utils.metrics import endpoint_template
+from openphone_python.utils.rate_limit import RateLimitState
+
+# OpenPhone allows 10 requests per second per API key
+DEFAULT_REQUESTS_PER_SECOND = 10.0
+
+# Request priority classes, highest first
+INTERACTIVE = "interactive"
+DEFAULT = "default"
+BULK = "bulk"
+PRIORITIES = (INTERACTIVE, DEFAULT, BULK)
+_PRIORITY_RANKS = {name: rank for rank, name in enumerate(PRIORITIES)}
+
+_priority: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
+    "openphone_priority", default=None
+)
+
+
+def request_priority(priority: str) -> ContextManager[str]:
+    """
+    Run the requests made in a block under a priority class.
+
+    The class follows the context, so it also applies to the worker threads
+    of bulk operations started in the block.
+
+    Args:
+        priority: ``interactive``, ``default`` or ``bulk``
+
+    Returns:
+        Context manager yielding the priority
+
+    Raises:
+        ValueError: If the priority is unknown
+    """
+    if priority not in _PRIORITY_RANKS:
+        raise ValueError(f"priority must be one of {', '.join(PRIORITIES)}")
+    return _priority_scope(priority)
+
+
+@contextmanager
+def _priority_scope(priority: str) -> Iterator[str]:
+    """Set the priority class for the duration of a block."""
+    token = _priority.set(priority)
+    try:
+        yield priority
+    finally:
+        _priority.reset(token)
+
+
+def current_priority() -> str:
+    """Priority class of requests made in the current context."""
+    return _priority.get() or DEFAULT
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket limiting how often work may start.
+
+    Principles:
+    - Shared between worker threads
+    - Smooth pacing with a small configurable burst
+    - Blocking acquire, no busy waiting
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[int] = None,
+        state: Optional[RateLimitState] = None,
+    ):
+        """
+        Initialize rate limiter.
+
+        Args:
+            rate: Sustained number of acquisitions allowed per second
+            burst: Maximum number of tokens that can accumulate (default: rate)
+            state: Optional rate-limit state from API responses; acquire()
+                also waits out its suggested delay, e.g. after a 429
+
+        Raises:
+            ValueError: If rate is not positive
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.burst = float(burst if burst is not None else max(1, int(rate)))
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self.state = state
+
+    def acquire(self, cancel_event: Optional[threading.Event] = None) -> bool:
+        """
+        Block until a token is available.
+
+        Args:
+            cancel_event: Optional event that aborts the wait when set
+
+        Returns:
+            True if a token was acquired, False if the wait was cancelled
+        """
+        if self.state is not None and not self.state.wait(cancel_event):
+            return False
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.burst, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return True
+                wait_time = (1 - self._tokens) / self.rate
+
+            if cancel_event is not None:
+                if cancel_event.wait(wait_time):
+                    return False
+            else:
+                time.sleep(wait_time)
+
+    def __repr__(self) -> str:
+        """Return the string representation of rate limiter."""
+        return f"RateLimiter(rate={self.rate}, burst={self.burst})"
+
+
+class ConcurrencyPermit:
+    """A slot held by one in-flight request of an AdaptiveConcurrencyLimiter."""
+
+    __slots__ = ("generation", "priority", "waited", "started")
+
+    def __init__(self, generation: int, priority: str = DEFAULT, waited: float = 0.0):
+        """
+        Initialize concurrency permit.
+
+        Args:
+            generation: Limiter generation when the slot was taken
+            priority: Priority class of the request
+            waited: Seconds spent waiting for the slot
+        """
+        # Decrease round the request started in; signals from an older
+        # round are not counted twice
+        self.generation = generation
+        self.priority = priority
+        # Seconds spent queued for the slot
+        self.waited = waited
+        self.started = time.perf_counter()
+
+
+class _LatencyBaseline:
+    """Lowest recent latency of one endpoint template."""
+
+    __slots__ = ("latency", "samples")
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.samples = 1
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD limit on the number of requests in flight.
+
+    Principles:
+    - Additive increase: about one more slot per limit's worth of healthy
+      responses, and only while at least half of it is in use
+    - Multiplicative decrease on 429, 5xx, network errors and latency
+      beyond ``latency_tolerance`` times the endpoint's observed baseline
+    - One decrease per round of in-flight requests, so a burst of 429s
+      from the same window halves the limit once, not to the floor
+    - Priority classes: a free slot goes to the highest class waiting, and
+      bulk requests leave ``reserve`` of the limit to the other classes
+    - Thread-safe and shared by every resource of a client
+
+    Passed as ``OpenPhoneClient(concurrency_limiter=...)``, it gates every
+    HTTP attempt made by resources, so bulk operations settle at the
+    concurrency the API currently sustains and their ``concurrency``
+    argument becomes an upper bound rather than a guess.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        backoff: float = 0.5,
+        latency_tolerance: Optional[float] = 3.0,
+        min_samples: int = 10,
+        reserve: float = 0.25,
+    ):
+        """
+        Initialize adaptive concurrency limiter.
+
+        Args:
+            initial_limit: Requests allowed in flight at start
+            min_limit: Lowest limit backoff can reach
+            max_limit: Highest limit growth can reach
+            backoff: Factor applied to the limit on an overload signal
+            latency_tolerance: Latency above this multiple of the baseline
+                (the lowest recent latency of the same endpoint template)
+                counts as overload; None only reacts to errors
+            min_samples: Responses of an endpoint observed before its
+                latency is judged
+            reserve: Fraction of the limit bulk requests may not use, kept
+                free for interactive and default requests
+
+        Raises:
+            ValueError: If the limits, backoff factor or reserve are invalid
+        """
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError(
+                "Limits must satisfy 1 <= min_limit <= initial_limit <= max_limit"
+            )
+        if not 0 < backoff < 1:
+            raise ValueError("backoff must be between 0 and 1")
+        if not 0 <= reserve < 1:
+            raise ValueError("reserve must be between 0 and 1")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff = backoff
+        self.latency_tolerance = latency_tolerance
+        self.min_samples = min_samples
+        self.reserve = reserve
+        self._waiting = [0] * len(PRIORITIES)
+        self._limit = float(initial_limit)
+        self._in_flight = 0
+        self._generation = 0
+        # Endpoints differ in latency, so each template has its own baseline
+        self._baselines: Dict[str, _LatencyBaseline] = {}
+        self._condition = threading.Condition()
+        self.increases = 0
+        self.decreases = 0
+        self.max_in_flight = 0
+
+    @property
+    def limit(self) -> int:
+        """Requests currently allowed in flight."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """Requests currently holding a slot."""
+        return self._in_flight
+
+    def acquire(
+        self,
+        cancel_event: Optional[threading.Event] = None,
+        priority: Optional[str] = None,
+    ) -> Optional[ConcurrencyPermit]:
+        """
+        Block until a slot is free for the priority class and take it.
+
+        Args:
+            cancel_event: Optional event that aborts the wait when set
+            priority: Priority class (the current context's when None)
+
+        Returns:
+            Permit to hand back to release(), or None if cancelled
+
+        Raises:
+            ValueError: If the priority is unknown
+        """
+        if priority is None:
+            priority = current_priority()
+        rank = _PRIORITY_RANKS.get(priority)
+        if rank is None:
+            raise ValueError(f"priority must be one of {', '.join(PRIORITIES)}")
+        started = time.perf_counter()
+        with self._condition:
+            if not self._admits(rank):
+                self._waiting[rank] += 1
+                try:
+                    while not self._admits(rank):
+                        if cancel_event is not None and cancel_event.is_set():
+                            return None
+                        # Wake up now and then to notice cancellation
+                        self._condition.wait(0.1 if cancel_event is not None else None)
+                finally:
+                    self._waiting[rank] -= 1
+                    # Lower classes may have been held back by this waiter
+                    self._condition.notify_all()
+            self._in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self._in_flight)
+            return ConcurrencyPermit(
+                self._generation, priority, time.perf_counter() - started
+            )
+
+    def _admits(self, rank: int) -> bool:
+        """Whether a request of a class may start now; caller holds the lock."""
+        if any(self._waiting[:rank]):
+            return False
+        return self._in_flight < self._capacity(rank)
+
+    def _capacity(self, rank: int) -> int:
+        """Slots a class may fill; caller holds the lock."""
+        limit = int(self._limit)
+        if rank == _PRIORITY_RANKS[BULK]:
+            return max(1, limit - math.ceil(limit * self.reserve))
+        return limit
+
+    def release(
+        self,
+        permit: ConcurrencyPermit,
+        status_code: Optional[int],
+        latency: Optional[float] = None,
+        endpoint: Optional[str] = None,
+    ) -> None:
+        """
+        Free a slot and adjust the limit from the request's outcome.
+
+        Args:
+            permit: Permit returned by acquire()
+            status_code: Response status, None if no response arrived
+            latency: Seconds the request took (measured from acquire()
+                when None)
+            endpoint: Endpoint path the latency is compared within (IDs
+                are templated); None shares one baseline
+        """
+        if latency is None:
+            latency = time.perf_counter() - permit.started
+        overloaded = status_code is None or status_code == 429 or status_code >= 500
+        with self._condition:
+            # Not app-limited: at least half of the class's slots were in use
+            busy = self._in_flight * 2 >= self._capacity(
+                _PRIORITY_RANKS[permit.priority]
+            )
+            self._in_flight -= 1
+            if not overloaded:
+                overloaded = self._slow(latency, endpoint)
+            if overloaded:
+                if permit.generation == self._generation:
+                    self._limit = max(float(self.min_limit), self._limit * self.backoff)
+                    self._generation += 1
+                    self.decreases += 1
+            elif busy and self._limit < self.max_limit:
+                # One slot per limit's worth of healthy responses
+                self._limit = min(
+                    float(self.max_limit), self._limit + 1.0 / self._limit
+                )
+                self.increases += 1
+            self._condition.notify_all()
+
+    def _slow(self, latency: float, endpoint: Optional[str]) -> bool:
+        """Fold a healthy latency into its endpoint's baseline (lock held)."""
+        if self.latency_tolerance is None:
+            return False
+        key = endpoint_template(endpoint) if endpoint else "*"
+        entry = self._baselines.get(key)
+        if entry is None:
+            self._baselines[key] = _LatencyBaseline(latency)
+            return False
+        entry.samples += 1
+        baseline = entry.latency
+        if latency < baseline:
+            entry.latency = latency
+            return False
+        # Let the baseline drift up so it follows a slower API over time
+        entry.latency = baseline * 1.01
+        return (
+            entry.samples > self.min_samples
+            and latency > baseline * self.latency_tolerance
+        )
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Return the current state as a dict.
+
+        Returns:
+            Dict with limit, in_flight, waiting (by priority class),
+            max_in_flight, increases, decreases and baseline_latency (by
+            endpoint template)
+        """
+        with self._condition:
+            return {
+                "limit": self.limit,
+                "in_flight": self._in_flight,
+                "waiting": dict(zip(PRIORITIES, self._waiting)),
+                "max_in_flight": self.max_in_flight,
+                "increases": self.increases,
+                "decreases": self.decreases,
+                "baseline_latency": {
+                    key: entry.latency for key, entry in self._baselines.items()
+                },
+            }
+
+    def __repr__(self) -> str:
+        """Return the string representation of the limiter."""
+        return (
+            f"AdaptiveConcurrencyLimiter(limit={self.limit}, "
+            f"in_flight={self._in_flight}, max_limit={self.max_limit})"
+        )
+
+
+class BatchItemResult:
+    """
+    Outcome of a single item processed by a bulk operation.
+
+    Exactly one of ``value`` and ``error`` is meaningful: ``value`` holds the
+    returned object on success, ``error`` the exception raised on failure.
+    """
+
+    def __init__(
+        self,
+        index: int,
+        item: Any,
+        value: Any = None,
+        error: Optional[BaseException] = None,
+    ):
+        """
+        Initialize batch item result.
+
+        Args:
+            index: Position of the item in the input
+            item: The input item
+            value: Returned object on success
+            error: Exception raised on failure
+        """
+        self.index = index
+        self.item = item
+        self.value = value
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        """Whether the item was processed successfully."""
+        return self.error is None
+
+    def __repr__(self) -> str:
+        """Return the string representation of the result."""
+        if self.ok:
+            return f"BatchItemResult(index={self.index}, value={self.value!r})"
+        return f"BatchItemResult(index={self.index}, error={self.error!r})"
+
+
+class BatchResult:
+    """
+    Collected results of a batch operation keyed by input item.
+
+    Principles:
+    - Input order preserved
+    - Per-item errors kept alongside successes
+    - Never raises for individual failures
+    """
+
+    def __init__(self, items: List[BatchItemResult]):
+        """
+        Initialize batch result.
+
+        Args:
+            items: Per-item results in input order
+        """
+        self.items = items
+
+    @property
+    def results(self) -> Dict[Any, Any]:
+        """Successful values keyed by input item, in input order."""
+        return {result.item: result.value for result in self.items if result.ok}
+
+    @property
+    def errors(self) -> Dict[Any, BaseException]:
+        """Exceptions keyed by input item, in input order."""
+        return {
+            result.item: result.error
+            for result in self.items
+            if result.error is not None
+        }
+
+    @property
+    def values(self) -> List[Any]:
+        """Successful values in input order."""
+        return [result.value for result in self.items if result.ok]
+
+    def __iter__(self) -> Iterator[BatchItemResult]:
+        """Iterate over per-item results."""
+        return iter(self.items)
+
+    def __len__(self) -> int:
+        """Return the number of items in the batch."""
+        return len(self.items)
+
+    def __repr__(self) -> str:
+        """Return the string representation of the batch result."""
+        failed = sum(1 for result in self.items if not result.ok)
+        return f"BatchResult(items={len(self.items)}, errors={failed})"
+
+
+def run_concurrently(
+    func: Callable[[Any], Any],
+    items: Iterable[Any],
+    max_workers: int = 8,
+    rate_limiter: Optional[RateLimiter] = None,
+    cancel_event: Optional[threading.Event] = None,
+    ordered: bool = False,
+    executor: Optional[Executor] = None,
+) -> Iterator[BatchItemResult]:
+    """
+    Apply ``func`` to every item on a thread pool, streaming the results.
+
+    Items are pulled from ``items`` lazily so at most ``2 * max_workers``
+    are in flight at once, which keeps memory flat for very large inputs.
+    Exceptions raised by ``func`` are captured on the corresponding result
+    instead of aborting the batch. Every item gets exactly one result: once
+    ``cancel_event`` is set, items not yet started (including the rest of
+    ``items``) get an OperationCancelledError result. Calls run in the
+    ``bulk`` priority class unless the caller set one with request_priority().
+
+    Args:
+        func: Callable invoked once per item
+        items: Iterable of items to process
+        max_workers: Maximum number of concurrent calls
+        rate_limiter: Optional limiter acquired before each call
+        cancel_event: Optional event; once set no new items are started
+        ordered: Yield results in input order instead of completion order
+        executor: Long-lived executor to run the calls on, left running
+            afterwards; a pool of ``max_workers`` threads is created and
+            shut down per call when None
+
+    Returns:
+        Iterator yielding BatchItemResult instances
+
+    Raises:
+        ValueError: If max_workers is less than 1
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+    # Validated above, before the generator below is first iterated
+    return _run_concurrently(
+        func, items, max_workers, rate_limiter, cancel_event, ordered, executor
+    )
+
+
+def _cancelled(index: int, item: Any) -> BatchItemResult:
+    """Build the result of an item skipped because its operation was cancelled."""
+    error = OperationCancelledError("Operation cancelled before it started")
+    return BatchItemResult(index, item, error=error)
+
+
+def _run_concurrently(
+    func: Callable[[Any], Any],
+    items: Iterable[Any],
+    max_workers: int,
+    rate_limiter: Optional[RateLimiter],
+    cancel_event: Optional[threading.Event],
+    ordered: bool,
+    executor: Optional[Executor],
+) -> Iterator[BatchItemResult]:
+    """Yield the results of run_concurrently() once its arguments are validated."""
+
+    def _call(index: int, item: Any) -> BatchItemResult:
+        # Each task runs in its own copy of the context
+        if _priority.get() is None:
+            _priority.set(BULK)
+        cancelled = cancel_event is not None and cancel_event.is_set()
+        if not cancelled and rate_limiter is not None:
+            cancelled = not rate_limiter.acquire(cancel_event)
+        if cancelled:
+            return _cancelled(index, item)
+        try:
+            return BatchItemResult(index, item, value=func(item))
+        except Exception as e:
+            return BatchItemResult(index, item, error=e)
+
+    window = max_workers * 2
+    owned = executor is None
+    pool = ThreadPoolExecutor(max_workers=max_workers) if executor is None else executor
+    pending: Dict["Future[Any]", int] = {}
+    buffered: Dict[int, BatchItemResult] = {}
+    next_to_yield = 0
+    source = iter(enumerate(items))
+    exhausted = False
+    cancelled = False
+
+    try:
+        while True:
+            while not exhausted and len(pending) + len(buffered) < window:
+                if cancel_event is not None and cancel_event.is_set():
+                    exhausted = cancelled = True
+                    break
+                try:
+                    index, item = next(source)
+                except StopIteration:
+                    exhausted = True
+                    break
+                # Run in a copy of the caller's context so tracing spans nest
+                context = contextvars.copy_context()
+                pending[pool.submit(context.run, _call, index, item)] = index
+
+            if not pending:
+                break
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                del pending[future]
+                result = future.result()
+                if not ordered:
+                    yield result
+                    continue
+                buffered[result.index] = result
+
+            while next_to_yield in buffered:
+                yield buffered.pop(next_to_yield)
+                next_to_yield += 1
+
+        if cancelled:
+            # Everything before these has been yielded, so order holds
+            for index, item in source:
+                yield _cancelled(index, item)
+    finally:
+        for future in pending:
+            future.cancel()
+        if owned:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+def iter_chunks(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """
+    Split an iterable into lists of at most ``size`` items.
+
+    Args:
+        items: Iterable to split, consumed lazily
+        size: Maximum chunk length
+
+    Returns:
+        Iterator yielding lists of items
+
+    Raises:
+        ValueError: If size is less than 1
+    """
+    if size < 1:
+        raise ValueError("size must be at least 1")
+
+    chunk: List[Any] = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
@@ -0,0 +1,281 @@
+"""
+Hedged GET requests for the OpenPhone Python SDK.
+
+With ``OpenPhoneClient(hedging=HedgingPolicy(...))``, a GET sent by a
+resource that has not answered within a high percentile of the endpoint's
+recent latency is sent a second time, and whichever response arrives first
+is used. This trims the tail latency caused by an occasional slow response
+at the cost of a few extra requests, capped at ``max_hedge_rate`` of the
+traffic so hedging cannot eat the rate limit.
+
+Only GETs are hedged: they are idempotent, so the losing request is
+harmless. Its response is not returned, but it is still reported to the
+caller's ``on_discard`` callback so metrics, rate-limit state and circuit
+breakers count every request that was actually sent.
+"""
+
+import contextvars
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Deque, Dict, Optional, TypeVar
+from openphone_python.utils.metrics import endpoint_template
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Samples between recomputations of an endpoint's hedge delay
+_RECOMPUTE_EVERY = 16
+
+
+class _EndpointLatency:
+    """Recent latencies of one endpoint template and the derived delay."""
+
+    __slots__ = ("samples", "pending", "delay")
+
+    def __init__(self, size: int):
+        self.samples: Deque[float] = deque(maxlen=size)
+        self.pending = 0
+        self.delay: Optional[float] = None
+
+
+class HedgingPolicy:
+    """
+    When and how often to hedge idempotent GETs.
+
+    Principles:
+    - Per-endpoint delay at a percentile of recent latency, so only the
+      slow tail is hedged
+    - Token bucket cap: every request earns ``max_hedge_rate`` of a hedge,
+      up to ``burst`` saved, so the extra load stays a bounded fraction
+    - Latency samples come from first attempts whether they win or not,
+      so hedging does not hide a slowing endpoint
+    - No thread hop until an endpoint has ``min_samples`` latencies
+    """
+
+    def __init__(
+        self,
+        percentile: float = 0.95,
+        max_hedge_rate: float = 0.05,
+        burst: float = 10.0,
+        min_delay: float = 0.005,
+        min_samples: int = 20,
+        sample_size: int = 256,
+        max_workers: int = 32,
+    ):
+        """
+        Initialize hedging policy.
+
+        Args:
+            percentile: Latency percentile after which a hedge is sent
+            max_hedge_rate: Largest fraction of GETs that may be hedged
+            burst: Hedges that may be saved up for a burst of slow responses
+            min_delay: Shortest wait before hedging, in seconds
+            min_samples: Latencies observed per endpoint before hedging it
+            sample_size: Recent latencies kept per endpoint
+            max_workers: Threads sending hedged requests
+
+        Raises:
+            ValueError: If percentile or max_hedge_rate is out of range
+        """
+        if not 0 < percentile < 1:
+            raise ValueError("percentile must be between 0 and 1")
+        if not 0 <= max_hedge_rate <= 1:
+            raise ValueError("max_hedge_rate must be between 0 and 1")
+        self.percentile = percentile
+        self.max_hedge_rate = max_hedge_rate
+        self.burst = burst
+        self.min_delay = min_delay
+        self.min_samples = min_samples
+        self.sample_size = sample_size
+        self.max_workers = max_workers
+        self._lock = threading.Lock()
+        self._latency: Dict[str, _EndpointLatency] = {}
+        self._tokens = 0.0
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.requests = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+
+    def delay(self, endpoint: str) -> Optional[float]:
+        """
+        Seconds to wait for a GET before hedging it.
+
+        Args:
+            endpoint: Endpoint path (IDs are templated)
+
+        Returns:
+            Delay, or None while the endpoint has too few samples
+        """
+        latency = self._latency.get(endpoint_template(endpoint))
+        return latency.delay if latency is not None else None
+
+    def observe(self, endpoint: str, seconds: float) -> None:
+        """
+        Record the latency of a first attempt.
+
+        Args:
+            endpoint: Endpoint path (IDs are templated)
+            seconds: Time until its response (or failure)
+        """
+        key = endpoint_template(endpoint)
+        with self._lock:
+            latency = self._latency.get(key)
+            if latency is None:
+                latency = self._latency[key] = _EndpointLatency(self.sample_size)
+            latency.samples.append(seconds)
+            latency.pending += 1
+            if len(latency.samples) < self.min_samples:
+                return
+            if latency.delay is None or latency.pending >= _RECOMPUTE_EVERY:
+                ordered = sorted(latency.samples)
+                index = int(self.percentile * (len(ordered) - 1))
+                latency.delay = max(self.min_delay, ordered[index])
+                latency.pending = 0
+
+    def run(
+        self,
+        send: Callable[[], T],
+        endpoint: str,
+        metrics: Any = None,
+        on_discard: Optional[Callable[["Future[T]", float], None]] = None,
+    ) -> T:
+        """
+        Send a GET, hedging it if it is slow and the budget allows.
+
+        Args:
+            send: Callable sending the request once and returning the response
+            endpoint: Endpoint path (IDs are templated)
+            metrics: Optional MetricsRegistry recording hedges
+            on_discard: Optional callable invoked with the losing request's
+                future and its duration once it completes; not called if
+                the loser never started
+
+        Returns:
+            The first response to arrive
+
+        Raises:
+            Exception: Whatever ``send`` raised, if every request failed
+        """
+        with self._lock:
+            self.requests += 1
+            self._tokens = min(self.burst, self._tokens + self.max_hedge_rate)
+        delay = self.delay(endpoint)
+        if delay is None:
+            started = time.perf_counter()
+            try:
+                return send()
+            finally:
+                self.observe(endpoint, time.perf_counter() - started)
+
+        primary_started = time.perf_counter()
+        primary = self._submit(send, endpoint, observe=True)
+        done, _ = wait((primary,), timeout=delay)
+        if done or not self._take_token():
+            return primary.result()
+
+        hedge_started = time.perf_counter()
+        hedge = self._submit(send, endpoint, observe=False)
+        if metrics is not None:
+            metrics.record_hedge(endpoint)
+        done, _ = wait((primary, hedge), return_when=FIRST_COMPLETED)
+        first = hedge if hedge in done and primary not in done else primary
+        second = primary if first is hedge else hedge
+        if first.exception() is not None:
+            # Fall back to the other request before giving up
+            if second.exception() is None:
+                first, second = second, first
+            else:
+                first, second = primary, hedge
+        if on_discard is not None:
+            started = primary_started if second is primary else hedge_started
+            self._discard(second, started, on_discard)
+        if first is hedge:
+            with self._lock:
+                self.hedge_wins += 1
+            if metrics is not None:
+                metrics.record_hedge_win(endpoint)
+        return first.result()
+
+    @staticmethod
+    def _discard(
+        future: "Future[T]",
+        started: float,
+        on_discard: Callable[["Future[T]", float], None],
+    ) -> None:
+        """Report the losing request once it completes, unless it never started."""
+        if future.cancel():
+            return
+        future.add_done_callback(
+            lambda done: on_discard(done, time.perf_counter() - started)
+        )
+
+    def _take_token(self) -> bool:
+        """Spend one hedge from the budget if there is one."""
+        with self._lock:
+            if self._tokens < 1.0:
+                return False
+            self._tokens -= 1.0
+            self.hedges += 1
+            return True
+
+    def _submit(
+        self, send: Callable[[], T], endpoint: str, observe: bool
+    ) -> "Future[T]":
+        """Run ``send`` on the hedging pool in a copy of the caller's context."""
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix="openphone-hedge",
+                    )
+        started = time.perf_counter()
+        future = self._executor.submit(contextvars.copy_context().run, send)
+        if observe:
+            future.add_done_callback(
+                lambda _: self.observe(endpoint, time.perf_counter() - started)
+            )
+        return future
+
+    @property
+    def hedge_rate(self) -> float:
+        """Fraction of GETs that were hedged."""
+        return self.hedges / self.requests if self.requests else 0.0
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Return the current statistics.
+
+        Returns:
+            Dict with requests, hedges, hedge_wins, hedge_rate and the
+            hedge delay per endpoint template
+        """
+        with self._lock:
+            delays = {
+                key: latency.delay for key, latency in sorted(self._latency.items())
+            }
+            return {
+                "requests": self.requests,
+                "hedges": self.hedges,
+                "hedge_wins": self.hedge_wins,
+                "hedge_rate": self.hedges / self.requests if self.requests else 0.0,
+                "delays": delays,
+            }
+
+    def close(self) -> None:
+        """Shut down the hedging threads; requests in flight finish."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def __repr__(self) -> str:
+        """Return the string representation of the policy."""
+        return (
+            f"HedgingPolicy(percentile={self.percentile}, "
+            f"max_hedge_rate={self.max_hedge_rate}, hedge_rate={self.hedge_rate:.3f})"
+        )
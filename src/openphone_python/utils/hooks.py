@@ -0,0 +1,173 @@
+"""
+Request lifecycle hooks for the OpenPhone Python SDK.
+
+Callbacks registered on ``client.hooks`` are called at each stage of every
+HTTP attempt made by resources, pagination and the raw request helpers:
+
+- ``before_send``: the request is about to be sent
+- ``after_response``: a response arrived (any status)
+- ``on_retry``: an attempt failed and will be retried after ``delay``
+- ``on_error``: the request failed for good
+
+Example:
+    def log_slow(event):
+        if event.elapsed > 1.0:
+            print("slow", event.request.method, event.endpoint, event.elapsed)
+
+    client.hooks.register("after_response", log_slow)
+"""
+
+import logging
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+HOOK_EVENTS = ("before_send", "after_response", "on_retry", "on_error")
+
+
+class RequestEvent:
+    """What a hook callback gets to see about one HTTP attempt."""
+
+    __slots__ = (
+        "name",
+        "request",
+        "endpoint",
+        "attempt",
+        "response",
+        "elapsed",
+        "error",
+        "delay",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        request: Any,
+        endpoint: str,
+        attempt: int,
+        response: Any = None,
+        elapsed: Optional[float] = None,
+        error: Optional[BaseException] = None,
+        delay: Optional[float] = None,
+    ):
+        """
+        Initialize hook event.
+
+        Args:
+            name: Hook name
+            request: The transport request
+            endpoint: Endpoint path
+            attempt: Attempt number, starting at 1
+            response: Response, for after_response and HTTP errors
+            elapsed: Seconds the attempt took
+            error: Exception, for on_retry and on_error
+            delay: Seconds before the retry, for on_retry
+        """
+        self.name = name
+        self.request = request
+        self.endpoint = endpoint
+        # 1 for the first attempt
+        self.attempt = attempt
+        self.response = response
+        self.elapsed = elapsed
+        self.error = error
+        self.delay = delay
+
+    def __repr__(self) -> str:
+        """Return the string representation of the event."""
+        return (
+            f"RequestEvent({self.name}, {self.request.method} {self.endpoint}, "
+            f"attempt={self.attempt})"
+        )
+
+
+class RequestHooks:
+    """
+    Registry of request lifecycle callbacks.
+
+    Principles:
+    - No work on the request path for events without callbacks
+    - A failing callback is logged and never breaks the request
+    - Registration is thread-safe; callbacks run on the requesting thread
+    """
+
+    def __init__(self) -> None:
+        """Initialize hooks with no callbacks registered."""
+        self._lock = threading.Lock()
+        self._callbacks: Dict[str, List[Callable[[RequestEvent], Any]]] = {
+            event: [] for event in HOOK_EVENTS
+        }
+
+    def register(
+        self, event: str, callback: Callable[[RequestEvent], Any]
+    ) -> Callable[[RequestEvent], Any]:
+        """
+        Register a callback.
+
+        Args:
+            event: One of ``before_send``, ``after_response``, ``on_retry``,
+                ``on_error``
+            callback: Callable invoked with a RequestEvent
+
+        Returns:
+            The callback
+
+        Raises:
+            ValueError: If the event is unknown
+        """
+        if event not in self._callbacks:
+            raise ValueError(
+                f"Unknown hook event {event!r}; "
+                f"expected one of {', '.join(HOOK_EVENTS)}"
+            )
+        with self._lock:
+            # Copy on write so emit() can iterate without the lock
+            self._callbacks[event] = [*self._callbacks[event], callback]
+        return callback
+
+    def unregister(self, event: str, callback: Callable[[RequestEvent], Any]) -> None:
+        """
+        Remove a callback registered with register().
+
+        Args:
+            event: Event the callback was registered for
+            callback: Callback to remove
+        """
+        with self._lock:
+            self._callbacks[event] = [
+                c for c in self._callbacks.get(event, []) if c is not callback
+            ]
+
+    def has(self, event: str) -> bool:
+        """Whether any callback is registered for an event."""
+        return bool(self._callbacks[event])
+
+    def emit(
+        self, event: str, request: Any, endpoint: str, attempt: int, **fields: Any
+    ) -> None:
+        """
+        Call the callbacks of an event.
+
+        Args:
+            event: Event name
+            request: TransportRequest being sent
+            endpoint: Endpoint path relative to the base URL
+            attempt: Attempt number, starting at 1
+            **fields: ``response``, ``elapsed``, ``error`` or ``delay``
+        """
+        callbacks = self._callbacks[event]
+        if not callbacks:
+            return
+        payload = RequestEvent(event, request, endpoint, attempt, **fields)
+        for callback in callbacks:
+            try:
+                callback(payload)
+            except Exception as e:
+                logger.error(
+                    "Request hook %r for %s failed: %s",
+                    callback,
+                    event,
+                    e,
+                    exc_info=True,
+                )
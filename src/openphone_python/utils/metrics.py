@@ -0,0 +1,537 @@
+"""
+Request metrics for the OpenPhone Python SDK.
+
+A MetricsRegistry passed to ``OpenPhoneClient(metrics=...)`` records every
+API request made by resources, pagination and the raw request helpers:
+counts per endpoint and status, latency histograms, retries, rate limiting,
+bytes sent and received, and pages fetched. Read it as a snapshot dict or
+in the Prometheus text exposition format.
+
+Without a registry the request path only pays for one ``is None`` check.
+"""
+
+import bisect
+import json
+import re
+import threading
+from collections import Counter
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# Upper bounds in seconds of the request latency buckets
+DEFAULT_LATENCY_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+# Upper bounds in seconds of the Retry-After buckets
+RETRY_AFTER_BUCKETS = (1.0, 2.0, 5.0, 10.0, 30.0, 60.0, 300.0)
+
+# Status label of requests that got no response
+NETWORK_ERROR_STATUS = "error"
+
+# Gauge values of circuit breaker states
+CIRCUIT_STATE_VALUES = {"closed": 0, "half_open": 1, "open": 2}
+
+_ID_SEGMENT = re.compile(r"\d")
+
+
+@lru_cache(maxsize=4096)
+def endpoint_template(endpoint: str) -> str:
+    """
+    Metric label of an endpoint, with object IDs replaced by ``{id}``.
+
+    Keeps the number of label values bounded: ``calls/AC123`` and
+    ``calls/AC456`` are both recorded as ``calls/{id}``.
+
+    Args:
+        endpoint: Endpoint path relative to the API base URL
+
+    Returns:
+        Endpoint template
+    """
+    segments = endpoint.split("?", 1)[0].strip("/").split("/")
+    return "/".join(
+        "{id}" if position and _ID_SEGMENT.search(segment) else segment
+        for position, segment in enumerate(segments)
+    )
+
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus style."""
+
+    __slots__ = ("bounds", "counts", "count", "sum")
+
+    def __init__(self, bounds: Sequence[float]):
+        """
+        Initialize histogram.
+
+        Args:
+            bounds: Ascending upper bounds of the buckets
+        """
+        self.bounds = tuple(bounds)
+        # One count per bound plus the +Inf bucket, not cumulative
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """Add an observation."""
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        """(upper bound label, cumulative count) pairs ending with +Inf."""
+        pairs = []
+        total = 0
+        for bound, count in zip((*self.bounds, None), self.counts):
+            total += count
+            pairs.append(("+Inf" if bound is None else _format_number(bound), total))
+        return pairs
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimate a quantile by linear interpolation within its bucket.
+
+        Args:
+            q: Quantile between 0 and 1
+
+        Returns:
+            Estimated value, or None without observations
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        total = 0
+        for index, count in enumerate(self.counts):
+            if total + count >= rank and count:
+                if index == len(self.bounds):
+                    # Beyond the last bound all we know is the lower edge
+                    return self.bounds[-1] if self.bounds else None
+                lower = self.bounds[index - 1] if index else 0.0
+                upper = self.bounds[index]
+                return lower + (upper - lower) * (rank - total) / count
+            total += count
+        return self.bounds[-1] if self.bounds else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Snapshot of the histogram."""
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "buckets": dict(self.cumulative()),
+            "p50": self.quantile(0.5),
+            "p90": self.quantile(0.9),
+            "p99": self.quantile(0.99),
+        }
+
+
+def _format_number(value: float) -> str:
+    """Prometheus-style number without a trailing ``.0``."""
+    return repr(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def _escape(value: str) -> str:
+    """Escape a Prometheus label value."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels: str) -> str:
+    """Render a Prometheus label set."""
+    return (
+        "{"
+        + ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items())
+        + "}"
+    )
+
+
+class MetricsRegistry:
+    """
+    Thread-safe registry of SDK request metrics.
+
+    Principles:
+    - Low-cardinality labels: method, endpoint template, status
+    - One short critical section per request, no background threads
+    - Shareable by several clients, e.g. one per API key
+
+    Metrics are labelled by endpoint template (see endpoint_template()).
+    """
+
+    def __init__(self, latency_buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        """
+        Initialize metrics registry.
+
+        Args:
+            latency_buckets: Upper bounds in seconds of the latency histogram
+        """
+        self.latency_buckets = tuple(sorted(latency_buckets))
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear every metric."""
+        with self._lock:
+            self._requests: Counter[Tuple[str, ...]] = Counter()
+            self._latency: Dict[Tuple[str, str], Histogram] = {}
+            self._retries: Counter[Tuple[str, ...]] = Counter()
+            self._rate_limited: Counter[str] = Counter()
+            self._retry_after: Dict[str, Histogram] = {}
+            self._bytes_sent: Counter[Tuple[str, ...]] = Counter()
+            self._bytes_received: Counter[Tuple[str, ...]] = Counter()
+            self._pages: Counter[str] = Counter()
+            self._page_items: Counter[str] = Counter()
+            self._queue_wait: Dict[str, Histogram] = {}
+            self._circuit_states: Dict[str, str] = {}
+            self._circuit_rejections: Counter[str] = Counter()
+            self._hedges: Counter[str] = Counter()
+            self._hedge_wins: Counter[str] = Counter()
+
+    def record_request(
+        self,
+        method: str,
+        endpoint: str,
+        status: Optional[int],
+        seconds: float,
+        bytes_sent: int = 0,
+        bytes_received: int = 0,
+        retry_after: Optional[float] = None,
+    ) -> None:
+        """
+        Record one HTTP attempt.
+
+        Args:
+            method: HTTP method
+            endpoint: Endpoint path (IDs are templated)
+            status: Response status code, or None if no response arrived
+            seconds: Time until the response (or failure)
+            bytes_sent: Size of the request body
+            bytes_received: Size of the response body
+            retry_after: Retry-After seconds of a 429 response
+        """
+        endpoint = endpoint_template(endpoint)
+        key = (method, endpoint)
+        status_label = NETWORK_ERROR_STATUS if status is None else str(status)
+        with self._lock:
+            self._requests[(method, endpoint, status_label)] += 1
+            histogram = self._latency.get(key)
+            if histogram is None:
+                histogram = self._latency[key] = Histogram(self.latency_buckets)
+            histogram.observe(seconds)
+            self._bytes_sent[key] += bytes_sent
+            self._bytes_received[key] += bytes_received
+            if status == 429:
+                self._rate_limited[endpoint] += 1
+                if retry_after is not None:
+                    waits = self._retry_after.get(endpoint)
+                    if waits is None:
+                        waits = self._retry_after[endpoint] = Histogram(
+                            RETRY_AFTER_BUCKETS
+                        )
+                    waits.observe(retry_after)
+
+    def record_response(
+        self,
+        method: str,
+        endpoint: str,
+        response: Any,
+        seconds: float,
+        body: Optional[Any] = None,
+    ) -> None:
+        """
+        Record one HTTP attempt from its response.
+
+        Args:
+            method: HTTP method
+            endpoint: Endpoint path (IDs are templated)
+            response: Response with ``status_code``, ``headers`` and ``content``
+            seconds: Time until the response
+            body: JSON request body, measured by its serialized size
+        """
+        retry_after = None
+        if response.status_code == 429:
+            try:
+                retry_after = float(response.headers.get("Retry-After"))
+            except (TypeError, ValueError):
+                pass
+        self.record_request(
+            method,
+            endpoint,
+            response.status_code,
+            seconds,
+            len(json.dumps(body)) if body is not None else 0,
+            len(response.content or b""),
+            retry_after,
+        )
+
+    def record_retry(self, method: str, endpoint: str) -> None:
+        """
+        Record that a failed attempt is being retried.
+
+        Args:
+            method: HTTP method
+            endpoint: Endpoint path (IDs are templated)
+        """
+        with self._lock:
+            self._retries[(method, endpoint_template(endpoint))] += 1
+
+    def record_page(self, endpoint: str, items: int) -> None:
+        """
+        Record one fetched page of a paginated listing.
+
+        Args:
+            endpoint: Endpoint path (IDs are templated)
+            items: Number of items on the page
+        """
+        endpoint = endpoint_template(endpoint)
+        with self._lock:
+            self._pages[endpoint] += 1
+            self._page_items[endpoint] += items
+
+    def record_queue_wait(self, priority: str, seconds: float) -> None:
+        """
+        Record the time a request waited for a concurrency slot.
+
+        Args:
+            priority: Priority class of the request
+            seconds: Time spent queued
+        """
+        with self._lock:
+            histogram = self._queue_wait.get(priority)
+            if histogram is None:
+                histogram = self._queue_wait[priority] = Histogram(self.latency_buckets)
+            histogram.observe(seconds)
+
+    def record_circuit_state(self, endpoint: str, state: str) -> None:
+        """
+        Record a circuit breaker transition.
+
+        Args:
+            endpoint: Endpoint path (IDs are templated)
+            state: ``closed``, ``half_open`` or ``open``
+        """
+        with self._lock:
+            self._circuit_states[endpoint_template(endpoint)] = state
+
+    def record_circuit_rejection(self, endpoint: str) -> None:
+        """
+        Record a request refused by an open circuit.
+
+        Args:
+            endpoint: Endpoint path (IDs are templated)
+        """
+        with self._lock:
+            self._circuit_rejections[endpoint_template(endpoint)] += 1
+
+    def record_hedge(self, endpoint: str) -> None:
+        """
+        Record a hedged (duplicate) GET.
+
+        Args:
+            endpoint: Endpoint path (IDs are templated)
+        """
+        with self._lock:
+            self._hedges[endpoint_template(endpoint)] += 1
+
+    def record_hedge_win(self, endpoint: str) -> None:
+        """
+        Record a hedged GET that answered before the original.
+
+        Args:
+            endpoint: Endpoint path (IDs are templated)
+        """
+        with self._lock:
+            self._hedge_wins[endpoint_template(endpoint)] += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Return the current metric values.
+
+        Returns:
+            Dict keyed by metric, with ``"METHOD endpoint"`` or endpoint keys:
+            ``requests`` (counts by status), ``latency`` (histogram with
+            count, sum, cumulative buckets and p50/p90/p99 estimates),
+            ``retries``, ``rate_limited``, ``retry_after``, ``bytes_sent``,
+            ``bytes_received``, ``pages``, ``page_items``, ``queue_wait``
+            (histograms by priority class), ``circuit_states``,
+            ``circuit_rejections``, ``hedges`` and ``hedge_wins``
+        """
+        with self._lock:
+            requests: Dict[str, Dict[str, int]] = {}
+            for (method, endpoint, status), count in sorted(self._requests.items()):
+                requests.setdefault(f"{method} {endpoint}", {})[status] = count
+            return {
+                "requests": requests,
+                "latency": {
+                    f"{method} {endpoint}": histogram.to_dict()
+                    for (method, endpoint), histogram in sorted(self._latency.items())
+                },
+                "retries": {
+                    f"{m} {e}": n for (m, e), n in sorted(self._retries.items())
+                },
+                "rate_limited": dict(sorted(self._rate_limited.items())),
+                "retry_after": {
+                    endpoint: histogram.to_dict()
+                    for endpoint, histogram in sorted(self._retry_after.items())
+                },
+                "bytes_sent": {
+                    f"{m} {e}": n for (m, e), n in sorted(self._bytes_sent.items())
+                },
+                "bytes_received": {
+                    f"{m} {e}": n for (m, e), n in sorted(self._bytes_received.items())
+                },
+                "pages": dict(sorted(self._pages.items())),
+                "page_items": dict(sorted(self._page_items.items())),
+                "queue_wait": {
+                    priority: histogram.to_dict()
+                    for priority, histogram in sorted(self._queue_wait.items())
+                },
+                "circuit_states": dict(sorted(self._circuit_states.items())),
+                "circuit_rejections": dict(sorted(self._circuit_rejections.items())),
+                "hedges": dict(sorted(self._hedges.items())),
+                "hedge_wins": dict(sorted(self._hedge_wins.items())),
+            }
+
+    def to_prometheus(self, prefix: str = "openphone") -> str:
+        """
+        Render the metrics in the Prometheus text exposition format.
+
+        Args:
+            prefix: Metric name prefix
+
+        Returns:
+            Exposition text, ending with a newline
+        """
+        lines: List[str] = []
+
+        def family(name: str, kind: str, help_text: str) -> str:
+            full = f"{prefix}_{name}"
+            lines.append(f"# HELP {full} {help_text}")
+            lines.append(f"# TYPE {full} {kind}")
+            return full
+
+        def histogram(
+            name: str, histograms: Dict[Any, Histogram], label_names: Sequence[str]
+        ) -> None:
+            for key, values in sorted(histograms.items()):
+                labels = dict(
+                    zip(label_names, key if isinstance(key, tuple) else (key,))
+                )
+                for bound, count in values.cumulative():
+                    lines.append(f"{name}_bucket{_labels(**labels, le=bound)} {count}")
+                lines.append(f"{name}_sum{_labels(**labels)} {values.sum!r}")
+                lines.append(f"{name}_count{_labels(**labels)} {values.count}")
+
+        with self._lock:
+            name = family(
+                "requests_total", "counter", "API requests by endpoint and status."
+            )
+            for (method, endpoint, status), count in sorted(self._requests.items()):
+                labels = _labels(method=method, endpoint=endpoint, status=status)
+                lines.append(f"{name}{labels} {count}")
+
+            name = family(
+                "request_duration_seconds", "histogram", "API request latency."
+            )
+            histogram(name, self._latency, ("method", "endpoint"))
+
+            name = family(
+                "request_retries_total", "counter", "Retried API request attempts."
+            )
+            for (method, endpoint), count in sorted(self._retries.items()):
+                lines.append(
+                    f"{name}{_labels(method=method, endpoint=endpoint)} {count}"
+                )
+
+            name = family("rate_limited_total", "counter", "Responses with status 429.")
+            for endpoint, count in sorted(self._rate_limited.items()):
+                lines.append(f"{name}{_labels(endpoint=endpoint)} {count}")
+
+            name = family(
+                "retry_after_seconds", "histogram", "Retry-After of 429 responses."
+            )
+            histogram(name, self._retry_after, ("endpoint",))
+
+            for metric, counter, help_text in (
+                ("request_bytes_total", self._bytes_sent, "Request body bytes sent."),
+                (
+                    "response_bytes_total",
+                    self._bytes_received,
+                    "Response body bytes received.",
+                ),
+            ):
+                name = family(metric, "counter", help_text)
+                for (method, endpoint), count in sorted(counter.items()):
+                    lines.append(
+                        f"{name}{_labels(method=method, endpoint=endpoint)} {count}"
+                    )
+
+            for metric, counts, help_text in (
+                (
+                    "pages_fetched_total",
+                    self._pages,
+                    "Pages fetched by paginated listings.",
+                ),
+                ("page_items_total", self._page_items, "Items on fetched pages."),
+            ):
+                name = family(metric, "counter", help_text)
+                for endpoint, count in sorted(counts.items()):
+                    lines.append(f"{name}{_labels(endpoint=endpoint)} {count}")
+
+            name = family(
+                "queue_wait_seconds",
+                "histogram",
+                "Time requests waited for a concurrency slot.",
+            )
+            histogram(name, self._queue_wait, ("priority",))
+
+            name = family(
+                "circuit_state",
+                "gauge",
+                "Circuit breaker state (0 closed, 1 half-open, 2 open).",
+            )
+            for endpoint, state in sorted(self._circuit_states.items()):
+                lines.append(
+                    f"{name}{_labels(endpoint=endpoint)} {CIRCUIT_STATE_VALUES[state]}"
+                )
+
+            name = family(
+                "circuit_rejections_total",
+                "counter",
+                "Requests refused by an open circuit.",
+            )
+            for endpoint, count in sorted(self._circuit_rejections.items()):
+                lines.append(f"{name}{_labels(endpoint=endpoint)} {count}")
+
+            for metric, counts, help_text in (
+                (
+                    "hedged_requests_total",
+                    self._hedges,
+                    "Duplicate GETs sent by hedging.",
+                ),
+                (
+                    "hedge_wins_total",
+                    self._hedge_wins,
+                    "Hedged GETs that answered first.",
+                ),
+            ):
+                name = family(metric, "counter", help_text)
+                for endpoint, count in sorted(counts.items()):
+                    lines.append(f"{name}{_labels(endpoint=endpoint)} {count}")
+
+        return "\n".join(lines) + "\n"
+
+    def __repr__(self) -> str:
+        """Return the string representation of the registry."""
+        with self._lock:
+            total = sum(self._requests.values())
+        return f"MetricsRegistry(requests={total})"
@@ -7,6 +7,7 @@ from typing import Iterator, Dict, Any, Optional, Type, TYPE_CHECKING
 if TYPE_CHECKING:
     from openphone_python.resources.base import BaseResource
     from openphone_python.models.base import BaseModel
+    from openphone_python.utils.tracing import Span, Tracer
 
 
 class PaginatedResult:
@@ -17,6 +18,10 @@ class PaginatedResult:
     - Lazy loading of pages
     - Iterator interface for easy consumption
     - Automatic page token management
+
+    When tracing, the pages of one listing share a ``<resource>.list``
+    span that ends once the last page is loaded, an error occurs, a
+    ``for`` loop over the result stops early or close() is called.
     """
 
     def __init__(
@@ -35,10 +40,25 @@ class PaginatedResult:
         self._next_page_token: Optional[str] = None
         self._has_more = True
         self._total_items: Optional[int] = None
+        client = getattr(resource, "client", None)
+        self._metrics = getattr(client, "metrics", None)
+        self._tracer: Optional["Tracer"] = getattr(client, "tracer", None)
+        self._pages_loaded = 0
+        self._items_loaded = 0
+        self._span: Optional["Span"] = None
 
     def __iter__(self) -> Iterator["BaseModel"]:
-        """Return iterator."""
-        return self
+        """Iterate over the items, ending the listing span when stopped early."""
+        # The generator is closed when a loop breaks out and drops it
+        try:
+            while True:
+                try:
+                    item = next(self)
+                except StopIteration:
+                    return
+                yield item
+        finally:
+            self.close()
 
     def __next__(self) -> "BaseModel":
         """Get next item."""
@@ -68,11 +88,20 @@ class PaginatedResult:
             request_params["pageToken"] = self._next_page_token
 
         # Make the API call
-        response = self.resource._request("GET", self.endpoint, params=request_params)
+        self._pages_loaded += 1
+        if self._tracer is None:
+            response = self.resource._request(
+                "GET", self.endpoint, params=request_params
+            )
+        else:
+            response = self._traced_request(self._tracer, request_params)
 
         # Extract data
         data = response.get("data", [])
         self._current_items.extend(data)
+        self._items_loaded += len(data)
+        if self._metrics is not None:
+            self._metrics.record_page(self.endpoint, len(data))
 
         # Update pagination state
         self._next_page_token = response.get("nextPageToken")
@@ -82,6 +111,46 @@ class PaginatedResult:
         if "totalItems" in response:
             self._total_items = response["totalItems"]
 
+        if not self._has_more:
+            self.close()
+
+    def _traced_request(
+        self, tracer: "Tracer", params: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Fetch a page in a span parented by the listing span."""
+        if self._span is None:
+            self._span = tracer.start_span(
+                self.resource._operation_name("list"),
+                {"openphone.endpoint": self.endpoint},
+            )
+        try:
+            with (
+                tracer.use_span(self._span),
+                tracer.span(
+                    f"openphone page {self.endpoint}",
+                    {"openphone.page": self._pages_loaded},
+                ) as span,
+            ):
+                response = self.resource._request("GET", self.endpoint, params=params)
+                span.set_attribute("openphone.items", len(response.get("data", [])))
+        except BaseException as e:
+            self.close(e)
+            raise
+        return response
+
+    def close(self, error: Optional[BaseException] = None) -> None:
+        """
+        End the listing span when iteration stops before the last page.
+
+        Args:
+            error: Exception that stopped the listing, if any
+        """
+        span, self._span = self._span, None
+        if span is not None and self._tracer is not None:
+            span.set_attribute("openphone.pages", self._pages_loaded)
+            span.set_attribute("openphone.items", self._items_loaded)
+            self._tracer.end_span(span, error)
+
     @property
     def total_items(self) -> Optional[int]:
         """Get total number of items if available."""
@@ -105,6 +174,7 @@ class PaginatedResult:
             count += 1
 
             if limit is not None and count >= limit:
+                self.close()
                 break
 
         return items
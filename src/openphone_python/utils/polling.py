@@ -0,0 +1,306 @@
+"""
+Polling utilities for the OpenPhone Python SDK.
+
+Call summaries and transcripts are generated asynchronously and report a
+``processing`` status until they are ready. ArtefactWaiter tracks many
+pending call IDs on a single scheduler thread instead of one sleeping
+thread per call.
+"""
+
+import heapq
+import itertools
+import logging
+import random
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from openphone_python.exceptions import NotFoundError
+from openphone_python.models.enriched_call import PENDING_STATUSES
+from openphone_python.utils.concurrency import (
+    DEFAULT_REQUESTS_PER_SECOND,
+    RateLimiter,
+    run_concurrently,
+)
+from openphone_python.utils.rate_limit import RateLimitState
+
+logger = logging.getLogger(__name__)
+
+
+class _PendingItem:
+    """Polling state of one tracked ID."""
+
+    def __init__(self, key: str, future: "Future[Any]", deadline: Optional[float]):
+        self.key = key
+        self.future = future
+        self.deadline = deadline
+        self.attempts = 0
+
+
+class ArtefactWaiter:
+    """
+    Wait for many asynchronously generated artefacts at once.
+
+    Principles:
+    - One scheduler thread for any number of pending IDs
+    - Per-item exponential backoff with jitter
+    - Polling rounds paced by a rate limiter that also honours the
+      client's rate-limit state
+    - Results delivered through futures and callbacks
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[str], Any],
+        initial_delay: float = 2.0,
+        max_delay: float = 60.0,
+        multiplier: float = 2.0,
+        jitter: float = 0.25,
+        timeout: Optional[float] = 900.0,
+        max_workers: int = 4,
+        rate_limit: Optional[float] = DEFAULT_REQUESTS_PER_SECOND,
+        max_round_size: int = 50,
+        rate_limit_state: Optional[RateLimitState] = None,
+    ):
+        """
+        Initialize waiter.
+
+        Args:
+            fetch: Getter returning the artefact for an ID, e.g.
+                ``client.call_summaries.get``
+            initial_delay: Seconds before the first poll of a new ID
+            max_delay: Upper bound for the delay between polls of one ID
+            multiplier: Backoff growth factor between polls of one ID
+            jitter: Random spread applied to each delay, as a fraction
+            timeout: Seconds after which an ID is given up with TimeoutError
+                (None waits forever)
+            max_workers: Maximum concurrent polls within a round
+            rate_limit: Maximum polls started per second (None disables pacing)
+            max_round_size: Maximum number of IDs polled in one round
+            rate_limit_state: Client rate-limit state slowing the polls
+                down, e.g. ``client.rate_limit``
+        """
+        self.fetch = fetch
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.timeout = timeout
+        self.max_workers = max_workers
+        self.max_round_size = max_round_size
+        self._rate_limiter = (
+            RateLimiter(rate_limit, state=rate_limit_state) if rate_limit else None
+        )
+        # Reused by every polling round instead of a new pool per round
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="openphone-artefact-poll"
+        )
+
+        self._items: Dict[str, _PendingItem] = {}
+        self._schedule: List[Tuple[float, int, str]] = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+    def submit(
+        self, key: str, callback: Optional[Callable[["Future[Any]"], None]] = None
+    ) -> "Future[Any]":
+        """
+        Start waiting for the artefact of an ID.
+
+        Submitting an ID that is already pending returns the same future.
+
+        Args:
+            key: ID passed to ``fetch``, usually a call ID
+            callback: Optional callable invoked with the future once resolved
+
+        Returns:
+            Future resolving to the artefact once it is no longer processing,
+            or failing with the fetch error or TimeoutError
+
+        Raises:
+            RuntimeError: If the waiter has been closed
+        """
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("ArtefactWaiter is closed")
+
+            item = self._items.get(key)
+            if item is None:
+                deadline = None
+                if self.timeout is not None:
+                    deadline = time.monotonic() + self.timeout
+                item = _PendingItem(key, Future(), deadline)
+                self._items[key] = item
+                self._schedule_poll(item, self.initial_delay)
+                self._ensure_thread()
+
+        if callback is not None:
+            item.future.add_done_callback(callback)
+        return item.future
+
+    def submit_many(
+        self,
+        keys: Iterable[str],
+        callback: Optional[Callable[["Future[Any]"], None]] = None,
+    ) -> Dict[str, "Future[Any]"]:
+        """
+        Start waiting for several IDs.
+
+        Args:
+            keys: IDs passed to ``fetch``
+            callback: Optional callable invoked with each future once resolved
+
+        Returns:
+            Dictionary mapping each ID to its future
+        """
+        return {key: self.submit(key, callback) for key in keys}
+
+    @property
+    def pending_count(self) -> int:
+        """Number of IDs still being waited for."""
+        with self._condition:
+            return len(self._items)
+
+    def close(self, cancel_pending: bool = True) -> None:
+        """
+        Stop accepting IDs and stop the scheduler thread and its pool.
+
+        Args:
+            cancel_pending: Cancel the futures of IDs still pending; when
+                False, block until every pending ID has resolved (or timed out)
+        """
+        items: List[_PendingItem] = []
+        with self._condition:
+            self._closed = True
+            if cancel_pending:
+                items = list(self._items.values())
+                self._items.clear()
+                self._schedule.clear()
+            self._condition.notify_all()
+
+        for item in items:
+            item.future.cancel()
+        if self._thread is threading.current_thread():
+            # Called from a callback; _run() shuts the pool down on exit
+            return
+        if self._thread is not None:
+            self._thread.join()
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> "ArtefactWaiter":
+        """Enter context manager."""
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Exit context manager, closing the waiter."""
+        self.close()
+
+    def _schedule_poll(self, item: _PendingItem, delay: float) -> None:
+        """Queue the next poll of an item; caller holds the condition."""
+        spread = 1 + random.uniform(-self.jitter, self.jitter)
+        heapq.heappush(
+            self._schedule,
+            (time.monotonic() + delay * spread, next(self._sequence), item.key),
+        )
+        self._condition.notify()
+
+    def _next_delay(self, item: _PendingItem) -> float:
+        """Backoff delay before the next poll of an item."""
+        return min(self.max_delay, self.initial_delay * self.multiplier**item.attempts)
+
+    def _ensure_thread(self) -> None:
+        """Start the scheduler thread if needed; caller holds the condition."""
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._run, name="openphone-artefact-waiter", daemon=True
+            )
+            self._thread.start()
+
+    def _take_due(self) -> Optional[List[_PendingItem]]:
+        """Block until some items are due; returns None once closed."""
+        with self._condition:
+            while True:
+                if self._closed and not self._items:
+                    return None
+                if not self._schedule:
+                    self._condition.wait()
+                    continue
+
+                wait_time = self._schedule[0][0] - time.monotonic()
+                if wait_time > 0:
+                    self._condition.wait(wait_time)
+                    continue
+
+                due: List[_PendingItem] = []
+                now = time.monotonic()
+                while (
+                    self._schedule
+                    and self._schedule[0][0] <= now
+                    and len(due) < self.max_round_size
+                ):
+                    _, _, key = heapq.heappop(self._schedule)
+                    item = self._items.get(key)
+                    if item is not None:
+                        due.append(item)
+                if due:
+                    return due
+
+    def _run(self) -> None:
+        """Scheduler loop: poll due items in rounds until closed."""
+        while True:
+            due = self._take_due()
+            if due is None:
+                self._executor.shutdown(wait=False)
+                return
+
+            results = run_concurrently(
+                lambda item: self.fetch(item.key),
+                due,
+                max_workers=self.max_workers,
+                rate_limiter=self._rate_limiter,
+                executor=self._executor,
+            )
+            for result in results:
+                self._handle(result.item, result.value, result.error)
+
+    def _handle(
+        self, item: _PendingItem, value: Any, error: Optional[BaseException]
+    ) -> None:
+        """Resolve or reschedule an item after a poll."""
+        item.attempts += 1
+        still_pending = isinstance(error, NotFoundError) or (
+            error is None and _status(value) in PENDING_STATUSES
+        )
+
+        if still_pending and (
+            item.deadline is None or time.monotonic() < item.deadline
+        ):
+            with self._condition:
+                if item.key in self._items:
+                    self._schedule_poll(item, self._next_delay(item))
+            return
+
+        with self._condition:
+            self._items.pop(item.key, None)
+            # A draining close() waits for the last item
+            self._condition.notify_all()
+
+        if item.future.done():
+            return
+        if still_pending:
+            logger.debug(
+                "Gave up waiting for %s after %d polls", item.key, item.attempts
+            )
+            error = TimeoutError(f"Timed out waiting for {item.key}")
+        if error is not None:
+            item.future.set_exception(error)
+        else:
+            item.future.set_result(value)
+
+
+def _status(artefact: Any) -> Optional[str]:
+    """Status of a fetched artefact, if it reports one."""
+    data = getattr(artefact, "_data", None)
+    return data.get("status") if isinstance(data, dict) else None
@@ -0,0 +1,258 @@
+"""
+Rate-limit state tracking for the OpenPhone Python SDK.
+
+Every response's rate-limit headers (``X-RateLimit-*``/``RateLimit-*`` and
+``Retry-After``) are folded into a RateLimitState shared by the client, so
+schedulers can see how close they are to the limit before a 429 arrives,
+and the SDK's own pacing can slow down in time.
+"""
+
+import threading
+import time
+from collections import deque
+from email.utils import parsedate_to_datetime
+from typing import Any, Deque, Dict, Iterable, List, Mapping, Optional
+
+# Header names, most specific first
+LIMIT_HEADERS = ("X-RateLimit-Limit", "RateLimit-Limit")
+REMAINING_HEADERS = ("X-RateLimit-Remaining", "RateLimit-Remaining")
+RESET_HEADERS = ("X-RateLimit-Reset", "RateLimit-Reset")
+
+# Reset values above this are UNIX timestamps, below it seconds from now
+_EPOCH_THRESHOLD = 1_000_000_000
+
+
+def _header_number(headers: Mapping[str, str], names: Iterable[str]) -> Optional[float]:
+    """First of the named headers that holds a number."""
+    for name in names:
+        value = headers.get(name)
+        if value is not None:
+            try:
+                return float(value)
+            except ValueError:
+                continue
+    return None
+
+
+def parse_retry_after(
+    value: Optional[str], now: Optional[float] = None
+) -> Optional[float]:
+    """
+    Seconds to wait according to a ``Retry-After`` header.
+
+    Args:
+        value: Header value, in seconds or as an HTTP date
+        now: Current UNIX time (defaults to now)
+
+    Returns:
+        Non-negative seconds, or None if the header is absent or invalid
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        moment = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if now is None:
+        now = time.time()
+    return max(0.0, moment.timestamp() - now)
+
+
+class RateLimitState:
+    """
+    Live, thread-safe view of the API rate limit.
+
+    Principles:
+    - Updated from every response, a few header lookups each
+    - Wall-clock reset times, so the state can be shared and inspected
+    - Stale windows are ignored once their reset time has passed
+
+    Available as ``client.rate_limit``.
+    """
+
+    def __init__(self, window: float = 60.0, low_watermark: float = 0.1):
+        """
+        Initialize rate-limit state.
+
+        Args:
+            window: Seconds over which the recent 429 rate is measured
+            low_watermark: Fraction of the limit below which
+                suggested_delay() starts spreading the remaining requests
+                over the rest of the window
+        """
+        self.window = window
+        self.low_watermark = low_watermark
+        self._lock = threading.Lock()
+        self.limit: Optional[int] = None
+        self._remaining: Optional[int] = None
+        self._reset_at: Optional[float] = None
+        self._blocked_until: Optional[float] = None
+        self.last_retry_after: Optional[float] = None
+        self.updated_at: Optional[float] = None
+        # [second, responses, 429s] per second of the window
+        self._buckets: Deque[List[int]] = deque()
+
+    def update(
+        self, status_code: int, headers: Mapping[str, str], now: Optional[float] = None
+    ) -> None:
+        """
+        Fold one response into the state.
+
+        Args:
+            status_code: Response status
+            headers: Response headers (case-insensitive mapping)
+            now: Current UNIX time (defaults to now)
+        """
+        if now is None:
+            now = time.time()
+        limit = _header_number(headers, LIMIT_HEADERS)
+        remaining = _header_number(headers, REMAINING_HEADERS)
+        reset = _header_number(headers, RESET_HEADERS)
+        retry_after = parse_retry_after(headers.get("Retry-After"), now)
+        limited = status_code == 429
+
+        with self._lock:
+            self.updated_at = now
+            if limit is not None:
+                self.limit = int(limit)
+            if remaining is not None:
+                self._remaining = int(remaining)
+            if reset is not None:
+                self._reset_at = reset if reset > _EPOCH_THRESHOLD else now + reset
+            if retry_after is not None and (limited or status_code == 503):
+                self.last_retry_after = retry_after
+                self._blocked_until = max(self._blocked_until or 0.0, now + retry_after)
+            elif limited:
+                # No Retry-After: wait for the window to reset, if known
+                if self._reset_at is not None and self._reset_at > now:
+                    self._blocked_until = self._reset_at
+                self._remaining = 0
+
+            second = int(now)
+            if self._buckets and self._buckets[-1][0] == second:
+                bucket = self._buckets[-1]
+            else:
+                bucket = [second, 0, 0]
+                self._buckets.append(bucket)
+            bucket[1] += 1
+            bucket[2] += limited
+            self._expire(now)
+
+    def _expire(self, now: float) -> None:
+        """Drop buckets older than the window; caller holds the lock."""
+        oldest = now - self.window
+        while self._buckets and self._buckets[0][0] < oldest:
+            self._buckets.popleft()
+
+    @property
+    def remaining(self) -> Optional[int]:
+        """Requests left in the current window, None if unknown or expired."""
+        with self._lock:
+            if self._reset_at is not None and self._reset_at <= time.time():
+                return None
+            return self._remaining
+
+    @property
+    def reset_at(self) -> Optional[float]:
+        """UNIX time at which the current window resets, if known."""
+        return self._reset_at
+
+    @property
+    def blocked_until(self) -> Optional[float]:
+        """UNIX time until which the API asked us to wait, if in the future."""
+        blocked = self._blocked_until
+        return blocked if blocked is not None and blocked > time.time() else None
+
+    def recent_429_rate(self, now: Optional[float] = None) -> float:
+        """
+        Fraction of responses within the window that were 429.
+
+        Args:
+            now: Current UNIX time (defaults to now)
+
+        Returns:
+            Rate between 0 and 1 (0 without responses)
+        """
+        if now is None:
+            now = time.time()
+        with self._lock:
+            self._expire(now)
+            total = sum(bucket[1] for bucket in self._buckets)
+            limited = sum(bucket[2] for bucket in self._buckets)
+        return limited / total if total else 0.0
+
+    def suggested_delay(self, now: Optional[float] = None) -> float:
+        """
+        Seconds to wait before the next request to stay under the limit.
+
+        Waits out a ``Retry-After``, and once fewer than ``low_watermark``
+        of the limit remain, spreads the remaining requests evenly until
+        the window resets.
+
+        Args:
+            now: Current UNIX time (defaults to now)
+
+        Returns:
+            Non-negative seconds (0 when no slowdown is needed)
+        """
+        if now is None:
+            now = time.time()
+        with self._lock:
+            if self._blocked_until is not None and self._blocked_until > now:
+                return self._blocked_until - now
+            if (
+                self._remaining is None
+                or self._reset_at is None
+                or self._reset_at <= now
+            ):
+                return 0.0
+            threshold = max(1.0, (self.limit or 0) * self.low_watermark)
+            if self._remaining >= threshold:
+                return 0.0
+            return (self._reset_at - now) / (self._remaining + 1)
+
+    def wait(self, cancel_event: Optional[threading.Event] = None) -> bool:
+        """
+        Sleep for suggested_delay().
+
+        Args:
+            cancel_event: Optional event that aborts the wait when set
+
+        Returns:
+            True once waited, False if the wait was cancelled
+        """
+        delay = self.suggested_delay()
+        if delay <= 0:
+            return True
+        if cancel_event is not None:
+            return not cancel_event.wait(delay)
+        time.sleep(delay)
+        return True
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Return the current state as a dict.
+
+        Returns:
+            Dict with limit, remaining, reset_at, blocked_until,
+            last_retry_after, recent_429_rate, suggested_delay and updated_at
+        """
+        now = time.time()
+        return {
+            "limit": self.limit,
+            "remaining": self.remaining,
+            "reset_at": self.reset_at,
+            "blocked_until": self.blocked_until,
+            "last_retry_after": self.last_retry_after,
+            "recent_429_rate": self.recent_429_rate(now),
+            "suggested_delay": self.suggested_delay(now),
+            "updated_at": self.updated_at,
+        }
+
+    def __repr__(self) -> str:
+        """Return the string representation of the state."""
+        return f"RateLimitState(limit={self.limit}, remaining={self.remaining})"
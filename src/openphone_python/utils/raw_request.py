@@ -4,15 +4,119 @@ Raw API request utility for the OpenPhone Python SDK.
 Simple utility for making direct API calls when you need raw responses.
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Union, cast
 import requests
 import logging
+import time
 from openphone_python.auth.api_key import ApiKeyAuth
+from openphone_python.exceptions import OpenPhoneError
+from openphone_python.transport import Transport, TransportRequest, TransportResponse
+from openphone_python.utils.hooks import RequestHooks
+from openphone_python.utils.metrics import MetricsRegistry, endpoint_template
+from openphone_python.utils.rate_limit import RateLimitState
+from openphone_python.utils.request_log import response_preview
+from openphone_python.utils.tracing import Tracer
 from openphone_python.utils.validation import validate_api_response
 
 logger = logging.getLogger(__name__)
 
 
+def _send(
+    request: TransportRequest,
+    endpoint: str,
+    transport: Optional[Transport],
+    metrics: Optional[MetricsRegistry],
+    hooks: Optional[RequestHooks],
+    tracer: Optional[Tracer],
+    rate_limit_state: Optional[RateLimitState],
+    validate: bool,
+) -> Any:
+    """Send a raw request, reporting to metrics, hooks and tracing."""
+    if tracer is None:
+        return _send_once(
+            request, endpoint, transport, metrics, hooks, rate_limit_state, validate
+        )
+    template = endpoint_template(endpoint)
+    with tracer.span(
+        f"openphone {request.method} {template}",
+        {
+            "http.method": request.method,
+            "openphone.endpoint": template,
+            "http.url": request.url,
+        },
+    ) as span:
+        result = _send_once(
+            request, endpoint, transport, metrics, hooks, rate_limit_state, validate
+        )
+        if not validate:
+            span.set_attribute("http.status_code", result.status_code)
+        return result
+
+
+def _send_once(
+    request: TransportRequest,
+    endpoint: str,
+    transport: Optional[Transport],
+    metrics: Optional[MetricsRegistry],
+    hooks: Optional[RequestHooks],
+    rate_limit_state: Optional[RateLimitState],
+    validate: bool,
+) -> Any:
+    """Send a raw request directly or through a transport, validating if asked."""
+    if hooks is not None:
+        hooks.emit("before_send", request, endpoint, 1)
+    started = time.perf_counter()
+    response: Union[requests.Response, TransportResponse]
+    try:
+        if transport is None:
+            response = requests.request(
+                method=request.method,
+                url=request.url,
+                params=request.params,
+                json=request.json,
+                headers=request.headers,
+                timeout=request.timeout,
+            )
+        else:
+            response = transport.send(request)
+    except requests.RequestException as e:
+        if metrics is not None:
+            metrics.record_request(
+                request.method, endpoint, None, time.perf_counter() - started
+            )
+        if hooks is not None:
+            hooks.emit("on_error", request, endpoint, 1, error=e)
+        raise
+    elapsed = time.perf_counter() - started
+    if rate_limit_state is not None:
+        rate_limit_state.update(response.status_code, response.headers)
+    if metrics is not None:
+        metrics.record_response(
+            request.method, endpoint, response, elapsed, request.json
+        )
+    if hooks is not None:
+        hooks.emit(
+            "after_response", request, endpoint, 1, response=response, elapsed=elapsed
+        )
+    if not validate:
+        return response
+
+    # Log the response (only built when enabled)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Raw API Response: %s | Content: %s",
+            response.status_code,
+            response_preview(response.content),
+        )
+
+    try:
+        return validate_api_response(response)
+    except Exception as e:
+        if hooks is not None:
+            hooks.emit("on_error", request, endpoint, 1, response=response, error=e)
+        raise
+
+
 def raw_request(
     api_key: str,
     endpoint: str,
@@ -20,7 +124,12 @@ def raw_request(
     params: Optional[Dict[str, Any]] = None,
     data: Optional[Dict[str, Any]] = None,
     base_url: str = "https://api.openphone.com/v1",
-    timeout: int = 30
+    timeout: int = 30,
+    transport: Optional[Transport] = None,
+    metrics: Optional[MetricsRegistry] = None,
+    hooks: Optional[RequestHooks] = None,
+    tracer: Optional[Tracer] = None,
+    rate_limit_state: Optional[RateLimitState] = None,
 ) -> Dict[str, Any]:
     """
     Make a raw API request to OpenPhone with authentication.
@@ -36,6 +145,11 @@ def raw_request(
         data: Request body data as dictionary (for POST/PUT/PATCH)
         base_url: OpenPhone API base URL
         timeout: Request timeout in seconds (default: 30)
+        transport: Optional transport to send the request through
+        metrics: Optional registry recording the request
+        hooks: Optional request lifecycle callbacks
+        tracer: Optional tracer opening a span for the request
+        rate_limit_state: Optional state updated from the response headers
 
     Returns:
         Parsed JSON response as dictionary
@@ -66,35 +180,44 @@ def raw_request(
 
     # Set up headers
     headers = auth.get_headers()
-    headers.update({
-        "Content-Type": "application/json",
-        "User-Agent": "openphone-python-raw-util/1.0"
-    })
+    headers.update(
+        {
+            "Content-Type": "application/json",
+            "User-Agent": "openphone-python-raw-util/1.0",
+        }
+    )
 
     # Log the request
-    logger.debug("Raw API Request: %s %s | Params: %s | Data: %s", method, url, params, data)
+    logger.debug(
+        "Raw API Request: %s %s | Params: %s | Data: %s", method, url, params, data
+    )
+
+    request = TransportRequest(
+        method, url, params=params, json=data, headers=headers, timeout=timeout
+    )
 
     try:
-        # Make the request
-        response = requests.request(
-            method=method.upper(),
-            url=url,
-            params=params,
-            json=data,
-            headers=headers,
-            timeout=timeout
+        # Make the request, then validate and return the parsed response
+        return cast(
+            Dict[str, Any],
+            _send(
+                request,
+                endpoint,
+                transport,
+                metrics,
+                hooks,
+                tracer,
+                rate_limit_state,
+                validate=True,
+            ),
         )
 
-        # Log the response
-        content_preview = response.text[:500] + "..." if len(response.text) > 500 else response.text
-        logger.debug("Raw API Response: %s | Content: %s", response.status_code, content_preview)
-
-        # Validate and return parsed response
-        return validate_api_response(response)
-
     except requests.RequestException as e:
         logger.error("Raw API request failed: %s", e)
         raise
+    except OpenPhoneError as e:
+        logger.debug("Raw API request returned an error: %s", e)
+        raise
     except Exception as e:
         logger.error("Unexpected error in raw API request: %s", e)
         raise
@@ -107,8 +230,13 @@ def raw_request_with_response_object(
     params: Optional[Dict[str, Any]] = None,
     data: Optional[Dict[str, Any]] = None,
     base_url: str = "https://api.openphone.com/v1",
-    timeout: int = 30
-) -> requests.Response:
+    timeout: int = 30,
+    transport: Optional[Transport] = None,
+    metrics: Optional[MetricsRegistry] = None,
+    hooks: Optional[RequestHooks] = None,
+    tracer: Optional[Tracer] = None,
+    rate_limit_state: Optional[RateLimitState] = None,
+) -> Union[requests.Response, TransportResponse]:
     """
     Make a raw API request and return the full Response object.
 
@@ -124,9 +252,15 @@ def raw_request_with_response_object(
         data: Request body data as dictionary (for POST/PUT/PATCH)
         base_url: OpenPhone API base URL
         timeout: Request timeout in seconds (default: 30)
+        transport: Optional transport to send the request through
+        metrics: Optional registry recording the request
+        hooks: Optional request lifecycle callbacks
+        tracer: Optional tracer opening a span for the request
+        rate_limit_state: Optional state updated from the response headers
 
     Returns:
-        Full requests.Response object
+        Full requests.Response object (a TransportResponse with the same
+        attributes when a transport is given)
 
     Examples:
         # Get response object
@@ -143,24 +277,40 @@ def raw_request_with_response_object(
 
     # Set up headers
     headers = auth.get_headers()
-    headers.update({
-        "Content-Type": "application/json",
-        "User-Agent": "openphone-python-raw-util/1.0"
-    })
+    headers.update(
+        {
+            "Content-Type": "application/json",
+            "User-Agent": "openphone-python-raw-util/1.0",
+        }
+    )
 
     # Log the request
-    logger.debug("Raw API Request (response object): %s %s | Params: %s | Data: %s",
-                method, url, params, data)
+    logger.debug(
+        "Raw API Request (response object): %s %s | Params: %s | Data: %s",
+        method,
+        url,
+        params,
+        data,
+    )
+
+    request = TransportRequest(
+        method, url, params=params, json=data, headers=headers, timeout=timeout
+    )
 
     try:
         # Make the request and return full response object
-        response = requests.request(
-            method=method.upper(),
-            url=url,
-            params=params,
-            json=data,
-            headers=headers,
-            timeout=timeout
+        response = cast(
+            Union[requests.Response, TransportResponse],
+            _send(
+                request,
+                endpoint,
+                transport,
+                metrics,
+                hooks,
+                tracer,
+                rate_limit_state,
+                validate=False,
+            ),
         )
 
         # Log the response
@@ -0,0 +1,104 @@
+"""
+Request logging helpers for the OpenPhone Python SDK.
+
+Everything here is built to cost nothing unless the corresponding log
+level is enabled: response previews decode at most a few hundred bytes,
+and slow requests are only measured against the threshold on the hot path.
+"""
+
+import json
+import logging
+import random
+from typing import Any, Optional
+from .hooks import RequestEvent
+
+logger = logging.getLogger(__name__)
+
+PREVIEW_BYTES = 500
+
+
+def response_preview(content: Optional[bytes], limit: int = PREVIEW_BYTES) -> str:
+    """
+    First ``limit`` bytes of a response body as text, for debug logs.
+
+    Args:
+        content: Raw response body
+        limit: Maximum number of bytes to decode
+
+    Returns:
+        Decoded preview, with ``...`` appended when truncated
+    """
+    content = content or b""
+    preview = content[:limit].decode("utf-8", errors="replace")
+    return preview + "..." if len(content) > limit else preview
+
+
+def _body_size(body: Any) -> int:
+    """Return the serialized size of a JSON request body."""
+    return len(json.dumps(body)) if body is not None else 0
+
+
+class SlowRequestLogger:
+    """
+    ``after_response`` hook logging requests slower than a threshold.
+
+    Principles:
+    - One comparison per request below the threshold
+    - Sampling bounds log volume during a latency incident
+    - Structured fields in ``extra["openphone"]`` for JSON log formatters
+
+    Installed by ``OpenPhoneClient(slow_request_threshold=...)``.
+    """
+
+    def __init__(
+        self,
+        threshold: float,
+        sample_rate: float = 1.0,
+        log: Optional[logging.Logger] = None,
+    ):
+        """
+        Initialize slow request logger.
+
+        Args:
+            threshold: Seconds above which a request is logged
+            sample_rate: Fraction of slow requests to log, between 0 and 1
+            log: Logger to write to (this module's logger when None)
+
+        Raises:
+            ValueError: If the sample rate is outside [0, 1]
+        """
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError("sample_rate must be between 0 and 1")
+        self.threshold = threshold
+        self.sample_rate = sample_rate
+        self.log = log or logger
+
+    def __call__(self, event: RequestEvent) -> None:
+        """Log the event's request if it was slow (and sampled)."""
+        if event.elapsed is None or event.elapsed < self.threshold:
+            return
+        if self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+            return
+        if not self.log.isEnabledFor(logging.WARNING):
+            return
+        fields = {
+            "method": event.request.method,
+            "endpoint": event.endpoint,
+            "status": event.response.status_code,
+            "attempt": event.attempt,
+            "elapsed": event.elapsed,
+            "bytes_sent": _body_size(event.request.json),
+            "bytes_received": len(event.response.content or b""),
+        }
+        self.log.warning(
+            "Slow OpenPhone API request: %s %s took %.3fs "
+            "(status %s, attempt %d, %d bytes sent, %d bytes received)",
+            fields["method"],
+            fields["endpoint"],
+            fields["elapsed"],
+            fields["status"],
+            fields["attempt"],
+            fields["bytes_sent"],
+            fields["bytes_received"],
+            extra={"openphone": fields},
+        )
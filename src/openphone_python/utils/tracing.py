@@ -0,0 +1,270 @@
+"""
+Tracing spans for the OpenPhone Python SDK.
+
+A Tracer passed to ``OpenPhoneClient(tracer=...)`` opens a span per SDK
+operation (one API call including its retries, or a bulk operation), with
+child spans per HTTP attempt and per page fetched. Finished spans go to an
+exporter; InMemorySpanExporter keeps them for tests and ad-hoc analysis,
+and any object with an ``export(span)`` method can forward them elsewhere.
+
+The active span is held in a context variable, so spans opened by your own
+code with ``tracer.span(...)`` become parents of the SDK's spans, including
+those made on the worker threads of bulk operations.
+
+Example:
+    exporter = InMemorySpanExporter()
+    client = OpenPhoneClient(api_key=api_key, tracer=Tracer(exporter))
+    with client.tracer.span("nightly-sync"):
+        client.calls.get_many(call_ids)
+    slowest = max(exporter.spans, key=lambda span: span.duration)
+"""
+
+import contextvars
+import logging
+import random
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Deque, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Spans kept by the exporter a Tracer creates when none is given
+DEFAULT_MAX_SPANS = 10_000
+
+_current_span: contextvars.ContextVar[Optional["Span"]] = contextvars.ContextVar(
+    "openphone_current_span", default=None
+)
+
+
+class Span:
+    """A timed, attributed unit of work within a trace."""
+
+    __slots__ = (
+        "name",
+        "trace_id",
+        "span_id",
+        "parent_id",
+        "start_time",
+        "end_time",
+        "attributes",
+        "error",
+        "_started",
+        "_duration",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        parent: Optional["Span"] = None,
+        attributes: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        Initialize span.
+
+        Args:
+            name: Span name
+            parent: Parent span (starts a new trace when None)
+            attributes: Initial attributes
+        """
+        self.name = name
+        self.trace_id: str = (
+            parent.trace_id if parent else f"{random.getrandbits(128):032x}"
+        )
+        self.span_id = f"{random.getrandbits(64):016x}"
+        self.parent_id = parent.span_id if parent else None
+        # Wall clock for export, monotonic clock for the duration
+        self.start_time = time.time()
+        self.end_time: Optional[float] = None
+        self.attributes: Dict[str, Any] = dict(attributes or {})
+        self.error: Optional[str] = None
+        self._started = time.perf_counter()
+        self._duration: Optional[float] = None
+
+    @property
+    def duration(self) -> Optional[float]:
+        """Seconds between start and end, None while the span is open."""
+        return self._duration
+
+    @property
+    def ok(self) -> bool:
+        """Whether the span finished without an error."""
+        return self.error is None
+
+    def set_attribute(self, name: str, value: Any) -> None:
+        """Set an attribute."""
+        self.attributes[name] = value
+
+    def end(self, error: Optional[BaseException] = None) -> None:
+        """
+        Finish the span.
+
+        Args:
+            error: Exception that ended the work, if any
+        """
+        self._duration = time.perf_counter() - self._started
+        self.end_time = self.start_time + self._duration
+        if error is not None:
+            self.error = f"{type(error).__name__}: {error}"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Span as a JSON-serializable dict."""
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start_time": self.start_time,
+            "end_time": self.end_time,
+            "duration": self._duration,
+            "attributes": dict(self.attributes),
+            "error": self.error,
+        }
+
+    def __repr__(self) -> str:
+        """Return the string representation of the span."""
+        duration = (
+            f"{self._duration * 1000:.1f}ms" if self._duration is not None else "open"
+        )
+        return f"Span({self.name!r}, {duration})"
+
+
+class InMemorySpanExporter:
+    """Thread-safe exporter keeping finished spans in a list."""
+
+    def __init__(self, max_spans: Optional[int] = None):
+        """
+        Initialize in-memory exporter.
+
+        Args:
+            max_spans: Keep only the most recent spans (all when None)
+        """
+        self.max_spans = max_spans
+        self._lock = threading.Lock()
+        self._spans: Deque[Span] = deque(maxlen=max_spans)
+
+    def export(self, span: Span) -> None:
+        """Store a finished span."""
+        with self._lock:
+            self._spans.append(span)
+
+    @property
+    def spans(self) -> List[Span]:
+        """Finished spans in the order they ended."""
+        with self._lock:
+            return list(self._spans)
+
+    def children(self, span: Span) -> List[Span]:
+        """Finished direct children of a span."""
+        return [child for child in self.spans if child.parent_id == span.span_id]
+
+    def clear(self) -> None:
+        """Forget the stored spans."""
+        with self._lock:
+            self._spans.clear()
+
+
+class Tracer:
+    """
+    Creates spans and hands finished ones to an exporter.
+
+    Principles:
+    - Parenting follows the active span of the current context
+    - Exporter failures are logged, never raised into SDK calls
+    """
+
+    def __init__(self, exporter: Any = None):
+        """
+        Initialize tracer.
+
+        Args:
+            exporter: Object with an ``export(span)`` method (a new
+                InMemorySpanExporter keeping the last DEFAULT_MAX_SPANS
+                spans when None)
+        """
+        self.exporter = (
+            exporter
+            if exporter is not None
+            else InMemorySpanExporter(max_spans=DEFAULT_MAX_SPANS)
+        )
+
+    @contextmanager
+    def span(
+        self, name: str, attributes: Optional[Dict[str, Any]] = None
+    ) -> Iterator[Span]:
+        """
+        Open a span as a child of the active one for the duration of a block.
+
+        Args:
+            name: Span name
+            attributes: Initial attributes
+
+        Returns:
+            Context manager yielding the Span
+        """
+        span = Span(name, _current_span.get(), attributes)
+        token = _current_span.set(span)
+        error: Optional[BaseException] = None
+        try:
+            yield span
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            _current_span.reset(token)
+            self.end_span(span, error)
+
+    def start_span(
+        self, name: str, attributes: Optional[Dict[str, Any]] = None
+    ) -> Span:
+        """
+        Open a span as a child of the active one without activating it.
+
+        For work spread over several calls, such as iterating a paginated
+        listing. Activate it with use_span() and finish it with end_span().
+
+        Args:
+            name: Span name
+            attributes: Initial attributes
+
+        Returns:
+            Open Span
+        """
+        return Span(name, _current_span.get(), attributes)
+
+    @contextmanager
+    def use_span(self, span: Span) -> Iterator[Span]:
+        """
+        Make an open span the active one for a block, without ending it.
+
+        Args:
+            span: Span returned by start_span()
+
+        Returns:
+            Context manager yielding the Span
+        """
+        token = _current_span.set(span)
+        try:
+            yield span
+        finally:
+            _current_span.reset(token)
+
+    def end_span(self, span: Span, error: Optional[BaseException] = None) -> None:
+        """
+        Finish a span and hand it to the exporter.
+
+        Args:
+            span: Open span
+            error: Exception that ended the work, if any
+        """
+        span.end(error)
+        try:
+            self.exporter.export(span)
+        except Exception as e:
+            logger.error("Span exporter failed: %s", e, exc_info=True)
+
+    @staticmethod
+    def current_span() -> Optional[Span]:
+        """Return the active span of the current context, if any."""
+        return _current_span.get()
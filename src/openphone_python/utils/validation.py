@@ -7,6 +7,7 @@ from typing import Union
 import phonenumbers
 import requests
 from openphone_python.exceptions import ValidationError
+from openphone_python.transport.base import TransportResponse
 
 
 def validate_phone_number(phone_number: str) -> str:
@@ -52,7 +53,9 @@ def validate_email(email: str) -> bool:
     return bool(re.match(pattern, email))
 
 
-def validate_api_response(response: requests.Response) -> dict:
+def validate_api_response(
+    response: Union[requests.Response, TransportResponse],
+) -> dict:
     """
     Validate API response and handle errors based on OpenAPI specification.
 
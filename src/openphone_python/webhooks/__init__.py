@@ -0,0 +1,47 @@
+"""
+Webhook receiving for the OpenPhone Python SDK.
+
+Subscriptions are managed through ``client.webhooks``; this package covers
+the receiving side: signature verification, event parsing, dispatch and
+backfilling events missed while the receiver was down.
+"""
+
+from .signature import (
+    SIGNATURE_HEADER,
+    SignatureVerifier,
+    compute_signature,
+    verify_signature,
+)
+from .receiver import WebhookReceiver, get_header, parse_event
+from .router import ANY_EVENT, WebhookRouter
+from .dedup import BaseDeduplicator, BloomDeduplicator, LRUDeduplicator
+from .app import IngestionStats, WebhookASGIApp, WebhookWSGIApp
+from .event_log import EventLog, EventLogReader
+from .batching import BatchingSink, BatchStats, conversation_key
+from .reconcile import RECONCILED_EVENTS, ReconcileReport, WebhookReconciler
+
+__all__ = [
+    "SIGNATURE_HEADER",
+    "SignatureVerifier",
+    "compute_signature",
+    "verify_signature",
+    "WebhookReceiver",
+    "get_header",
+    "parse_event",
+    "ANY_EVENT",
+    "WebhookRouter",
+    "BaseDeduplicator",
+    "BloomDeduplicator",
+    "LRUDeduplicator",
+    "IngestionStats",
+    "WebhookASGIApp",
+    "WebhookWSGIApp",
+    "EventLog",
+    "EventLogReader",
+    "BatchingSink",
+    "BatchStats",
+    "conversation_key",
+    "RECONCILED_EVENTS",
+    "ReconcileReport",
+    "WebhookReconciler",
+]
@@ -0,0 +1,515 @@
+"""
+WSGI and ASGI webhook ingestion applications for the OpenPhone Python SDK.
+
+Both applications verify a delivery, acknowledge it immediately and hand
+the event to a bounded in-process queue drained by a worker pool, so the
+endpoint answers within OpenPhone's delivery timeout no matter how slow
+the handlers are. When the queue is full the delivery is refused with 503
+and OpenPhone retries it later, instead of memory growing without bound.
+"""
+
+import asyncio
+import inspect
+import logging
+import queue
+import threading
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, Union
+from openphone_python.exceptions import (
+    ValidationError,
+    WebhookKeyUnavailableError,
+    WebhookVerificationError,
+)
+from openphone_python.models.webhook_event import WebhookEvent
+from .receiver import WebhookReceiver
+from .router import WebhookRouter
+
+logger = logging.getLogger(__name__)
+
+EventHandler = Union[WebhookRouter, Callable[[WebhookEvent], Any]]
+
+# Seconds OpenPhone is asked to wait before retrying a refused delivery
+RETRY_AFTER_SECONDS = 1
+
+# Webhook payloads are a few kilobytes; larger bodies are refused unread
+DEFAULT_MAX_BODY_SIZE = 1024 * 1024
+
+
+class IngestionStats:
+    """Thread-safe counters describing an ingestion app."""
+
+    FIELDS: Tuple[str, ...] = (
+        "accepted",
+        "duplicate",
+        "rejected",
+        "unavailable",
+        "invalid",
+        "processed",
+        "failed",
+    )
+
+    def __init__(self) -> None:
+        """Initialize every counter at zero."""
+        self._lock = threading.Lock()
+        self._counts = dict.fromkeys(self.FIELDS, 0)
+
+    def increment(self, field: str) -> None:
+        """Increment a counter."""
+        with self._lock:
+            self._counts[field] += 1
+
+    def snapshot(self) -> Dict[str, int]:
+        """Return the current counter values."""
+        with self._lock:
+            return dict(self._counts)
+
+    def __repr__(self) -> str:
+        """Return the string representation of the stats."""
+        return f"IngestionStats({self.snapshot()})"
+
+
+class _WebhookApp:
+    """Verification and response logic shared by the WSGI and ASGI apps."""
+
+    def __init__(
+        self,
+        receiver: WebhookReceiver,
+        handler: EventHandler,
+        queue_size: int,
+        workers: int,
+        webhook_id: Optional[str],
+        max_body_size: int,
+    ):
+        if queue_size < 1 or workers < 1:
+            raise ValueError("queue_size and workers must be at least 1")
+        if max_body_size < 1:
+            raise ValueError("max_body_size must be at least 1")
+        self.receiver = receiver
+        self.handler = handler
+        self.queue_size = queue_size
+        self.workers = workers
+        self.webhook_id = webhook_id
+        self.max_body_size = max_body_size
+        self.stats = IngestionStats()
+        self._admission = threading.Lock()
+
+    def _too_large(self, length: int) -> bool:
+        """Whether a body of ``length`` bytes must be refused with 413."""
+        if length <= self.max_body_size:
+            return False
+        logger.warning("Refused webhook delivery of %d bytes", length)
+        self.stats.increment("invalid")
+        return True
+
+    def _verify(
+        self, method: str, body: bytes, headers: Mapping[str, str]
+    ) -> Tuple[Optional[WebhookEvent], int]:
+        """
+        Verify a delivery; returns the event to queue (or None) and the HTTP status.
+
+        Deliveries whose signing key could not be loaded are refused with
+        503 so OpenPhone retries them.
+        """
+        if method != "POST":
+            return None, 405
+        try:
+            return self.receiver.receive(body, headers, self.webhook_id), 202
+        except WebhookKeyUnavailableError as e:
+            logger.error("Could not verify webhook delivery: %s", e)
+            self.stats.increment("unavailable")
+            return None, 503
+        except WebhookVerificationError as e:
+            logger.warning("Rejected webhook delivery: %s", e)
+            self.stats.increment("invalid")
+            return None, 401
+        except ValidationError as e:
+            logger.warning("Malformed webhook delivery: %s", e)
+            self.stats.increment("invalid")
+            return None, 400
+
+    def _ingest(
+        self,
+        method: str,
+        body: bytes,
+        headers: Mapping[str, str],
+        enqueue: Callable[[WebhookEvent], bool],
+    ) -> int:
+        """Verify a delivery and queue its event; returns the HTTP status."""
+        event, status = self._verify(method, body, headers)
+        if event is not None:
+            status = self._admit(event, body, enqueue)
+        return status
+
+    def _admit(
+        self,
+        event: WebhookEvent,
+        body: bytes,
+        enqueue: Callable[[WebhookEvent], bool],
+    ) -> int:
+        """
+        Queue a verified event unless it is a duplicate; returns the HTTP status.
+
+        Duplicates are acknowledged with 200 but not queued again. The
+        duplicate check and the record are one atomic step, so concurrent
+        deliveries of an event queue it once. Deduplicators that can forget
+        record the ID first and forget it when the queue is full; the others
+        are checked and recorded under a lock held across the enqueue, so a
+        refused event is never recorded and its retry is processed.
+        """
+        deduplicator = self.receiver.deduplicator
+        if deduplicator is None or deduplicator.supports_forget:
+            if self.receiver.is_duplicate(event):
+                self.stats.increment("duplicate")
+                return 200
+            if not enqueue(event):
+                self.receiver.forget(event)
+                self.stats.increment("rejected")
+                return 503
+        else:
+            with self._admission:
+                if self.receiver.is_duplicate(event, record=False):
+                    self.stats.increment("duplicate")
+                    return 200
+                if not enqueue(event):
+                    self.stats.increment("rejected")
+                    return 503
+                self.receiver.accept(event)
+        self._accept(event, body)
+        return 202
+
+    def _accept(self, event: WebhookEvent, body: bytes) -> None:
+        """Record a queued event and log its delivery."""
+        self.receiver.accept(event, body)
+        self.stats.increment("accepted")
+
+    def _handle_failed(self, event: WebhookEvent, error: BaseException) -> None:
+        """Record a handler failure."""
+        self.stats.increment("failed")
+        logger.error(
+            "Webhook handler failed for event %s: %s", event.id, error, exc_info=error
+        )
+
+
+class WebhookWSGIApp(_WebhookApp):
+    """
+    WSGI application ingesting webhooks into a bounded queue and thread pool.
+
+    Works with any WSGI server (gunicorn, uWSGI, waitress, wsgiref) and can
+    be mounted inside Flask or Django through their WSGI middleware hooks.
+    """
+
+    def __init__(
+        self,
+        receiver: WebhookReceiver,
+        handler: EventHandler,
+        queue_size: int = 1000,
+        workers: int = 4,
+        webhook_id: Optional[str] = None,
+        max_body_size: int = DEFAULT_MAX_BODY_SIZE,
+    ):
+        """
+        Initialize WSGI webhook app.
+
+        Args:
+            receiver: Receiver verifying and parsing deliveries
+            handler: WebhookRouter or callable invoked with each event
+            queue_size: Maximum number of events waiting for a worker
+            workers: Number of worker threads processing events
+            webhook_id: Webhook the endpoint belongs to, if known
+            max_body_size: Largest request body in bytes; larger deliveries
+                are refused with 413 before they are read
+        """
+        super().__init__(
+            receiver, handler, queue_size, workers, webhook_id, max_body_size
+        )
+        self._queue: "queue.Queue[Optional[WebhookEvent]]" = queue.Queue(queue_size)
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        """Start the worker threads (called automatically on first request)."""
+        with self._lock:
+            if self._threads:
+                return
+            for index in range(self.workers):
+                thread = threading.Thread(
+                    target=self._work,
+                    name=f"openphone-webhook-worker-{index}",
+                    daemon=True,
+                )
+                thread.start()
+                self._threads.append(thread)
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop the workers after the queued events have been processed.
+
+        Args:
+            timeout: Maximum seconds to wait for each worker
+        """
+        with self._lock:
+            threads, self._threads = self._threads, []
+        for _ in threads:
+            self._queue.put(None)
+        for thread in threads:
+            thread.join(timeout)
+
+    def join(self) -> None:
+        """Block until every queued event has been processed."""
+        self._queue.join()
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of events waiting for a worker."""
+        return self._queue.qsize()
+
+    def _offer(self, event: WebhookEvent) -> bool:
+        """Queue an event unless the queue is full."""
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            return False
+        return True
+
+    def _work(self) -> None:
+        """Worker loop processing queued events."""
+        dispatch = (
+            self.handler.dispatch
+            if isinstance(self.handler, WebhookRouter)
+            else self.handler
+        )
+        while True:
+            event = self._queue.get()
+            if event is None:
+                self._queue.task_done()
+                return
+            try:
+                dispatch(event)
+                self.stats.increment("processed")
+            except Exception as e:
+                self._handle_failed(event, e)
+            finally:
+                self._queue.task_done()
+
+    def __call__(
+        self, environ: Dict[str, Any], start_response: Callable[..., Any]
+    ) -> List[bytes]:
+        """Handle a WSGI request."""
+        if not self._threads:
+            self.start()
+
+        try:
+            length = int(environ.get("CONTENT_LENGTH") or 0)
+        except ValueError:
+            length = 0
+        if self._too_large(length):
+            start_response(_status_line(413), [("Content-Length", "0")])
+            return [b""]
+        body = environ["wsgi.input"].read(length) if length > 0 else b""
+
+        status = self._ingest(
+            environ.get("REQUEST_METHOD", "GET"), body, environ, self._offer
+        )
+        headers = [("Content-Length", "0")]
+        if status == 503:
+            headers.append(("Retry-After", str(RETRY_AFTER_SECONDS)))
+
+        start_response(_status_line(status), headers)
+        return [b""]
+
+
+class WebhookASGIApp(_WebhookApp):
+    """
+    ASGI application ingesting webhooks into a bounded queue and task pool.
+
+    Works with any ASGI server (uvicorn, hypercorn, daphne). Coroutine
+    handlers run on the event loop; plain handlers run in the loop's default
+    thread pool.
+    """
+
+    def __init__(
+        self,
+        receiver: WebhookReceiver,
+        handler: EventHandler,
+        queue_size: int = 1000,
+        workers: int = 4,
+        webhook_id: Optional[str] = None,
+        max_body_size: int = DEFAULT_MAX_BODY_SIZE,
+    ):
+        """
+        Initialize ASGI webhook app.
+
+        Args:
+            receiver: Receiver verifying and parsing deliveries
+            handler: WebhookRouter, coroutine function or callable invoked
+                with each event
+            queue_size: Maximum number of events waiting for a worker
+            workers: Number of worker tasks processing events
+            webhook_id: Webhook the endpoint belongs to, if known
+            max_body_size: Largest request body in bytes; larger deliveries
+                are refused with 413 before they are read
+        """
+        super().__init__(
+            receiver, handler, queue_size, workers, webhook_id, max_body_size
+        )
+        self._queue: Optional["asyncio.Queue[Optional[WebhookEvent]]"] = None
+        self._tasks: List["asyncio.Task[None]"] = []
+
+    async def start(self) -> None:
+        """Start the worker tasks (called on lifespan startup or first request)."""
+        if self._tasks:
+            return
+        self._queue = asyncio.Queue(self.queue_size)
+        self._tasks = [asyncio.create_task(self._work()) for _ in range(self.workers)]
+
+    async def close(self) -> None:
+        """Stop the workers after the queued events have been processed."""
+        tasks, self._tasks = self._tasks, []
+        if not tasks:
+            return
+        assert self._queue is not None
+        for _ in tasks:
+            await self._queue.put(None)
+        await asyncio.gather(*tasks)
+
+    async def join(self) -> None:
+        """Wait until every queued event has been processed."""
+        if self._queue is not None:
+            await self._queue.join()
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of events waiting for a worker."""
+        return self._queue.qsize() if self._queue is not None else 0
+
+    async def _dispatch(self, event: WebhookEvent) -> None:
+        """Run the handler for one event."""
+        if isinstance(self.handler, WebhookRouter):
+            await self.handler.dispatch_async(event)
+        elif inspect.iscoroutinefunction(self.handler):
+            await self.handler(event)
+        else:
+            await asyncio.get_running_loop().run_in_executor(None, self.handler, event)
+
+    async def _offer(self, event: WebhookEvent) -> bool:
+        """Queue an event unless the queue is full."""
+        assert self._queue is not None
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            return False
+        return True
+
+    async def _work(self) -> None:
+        """Worker loop processing queued events."""
+        assert self._queue is not None
+        while True:
+            event = await self._queue.get()
+            if event is None:
+                self._queue.task_done()
+                return
+            try:
+                await self._dispatch(event)
+                self.stats.increment("processed")
+            except Exception as e:
+                self._handle_failed(event, e)
+            finally:
+                self._queue.task_done()
+
+    async def __call__(
+        self,
+        scope: Dict[str, Any],
+        receive: Callable[..., Any],
+        send: Callable[..., Any],
+    ) -> None:
+        """Handle an ASGI connection."""
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            return
+        if not self._tasks:
+            await self.start()
+
+        headers = {
+            key.decode("latin-1"): value.decode("latin-1")
+            for key, value in scope["headers"]
+        }
+        try:
+            length = int(headers.get("content-length") or 0)
+        except ValueError:
+            length = 0
+        body = await self._read_body(receive, length)
+        if body is None:
+            await self._respond(send, 413)
+            return
+        loop = asyncio.get_running_loop()
+
+        def enqueue(event: WebhookEvent) -> bool:
+            # asyncio queues are not thread-safe, so only the put returns to the loop
+            return asyncio.run_coroutine_threadsafe(self._offer(event), loop).result()
+
+        # Verification may call a blocking key_loader and accepting may sync
+        # the event log to disk, so both run in a thread off the loop
+        status = await loop.run_in_executor(
+            None, self._ingest, scope["method"], body, headers, enqueue
+        )
+        await self._respond(send, status)
+
+    async def _read_body(
+        self, receive: Callable[..., Any], length: int
+    ) -> Optional[bytes]:
+        """Read the request body, or return None once it exceeds max_body_size."""
+        if self._too_large(length):
+            return None
+        chunks = []
+        size = 0
+        more_body = True
+        while more_body:
+            message = await receive()
+            chunk = message.get("body", b"")
+            size += len(chunk)
+            if self._too_large(size):
+                return None
+            chunks.append(chunk)
+            more_body = message.get("more_body", False)
+        return b"".join(chunks)
+
+    async def _respond(self, send: Callable[..., Any], status: int) -> None:
+        """Send an empty response with the given status."""
+        headers = [(b"content-length", b"0")]
+        if status == 503:
+            headers.append((b"retry-after", str(RETRY_AFTER_SECONDS).encode()))
+        await send(
+            {"type": "http.response.start", "status": status, "headers": headers}
+        )
+        await send({"type": "http.response.body", "body": b""})
+
+    async def _lifespan(
+        self, receive: Callable[..., Any], send: Callable[..., Any]
+    ) -> None:
+        """Start and stop the workers with the server."""
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await self.start()
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await self.close()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+
+_REASONS = {
+    200: "OK",
+    202: "Accepted",
+    400: "Bad Request",
+    401: "Unauthorized",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    503: "Service Unavailable",
+}
+
+
+def _status_line(status: int) -> str:
+    """WSGI status line for a status code."""
+    return f"{status} {_REASONS.get(status, '')}".rstrip()
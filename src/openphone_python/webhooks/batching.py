@@ -0,0 +1,276 @@
+"""
+Micro-batching of webhook events for the OpenPhone Python SDK.
+
+Writing every event to a database on its own caps ingestion at the
+database's per-statement latency. BatchingSink collects events and hands
+them to a batch handler in lists, flushed once enough events arrived or
+the oldest one waited long enough, so the handler can use bulk inserts.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import Any, Callable, Deque, Dict, List, Mapping, Optional, Tuple
+from openphone_python.models.webhook_event import WebhookEvent
+from .app import IngestionStats
+
+logger = logging.getLogger(__name__)
+
+# Batch handlers may return a mapping of event ID to the error of that event
+BatchHandler = Callable[[List[WebhookEvent]], Optional[Mapping[str, BaseException]]]
+
+
+def conversation_key(event: WebhookEvent) -> str:
+    """
+    Ordering key of an event: its call, its conversation, or its participants.
+
+    Call events are keyed by the call ID, because only some of them carry
+    the conversation ID (``call.summary.completed`` and
+    ``call.transcript.completed`` only name the call). Every event of one
+    call therefore shares a key; a call and the messages of the same
+    conversation may be handled in parallel.
+
+    Args:
+        event: Webhook event
+
+    Returns:
+        Key shared by every event of the same call or conversation
+    """
+    obj = event.object
+    if event.type.startswith("call."):
+        key = obj.get("callId") or obj.get("id")
+    else:
+        key = obj.get("conversationId") or obj.get("callId")
+    if key:
+        return str(key)
+    participants = obj.get("participants") or [obj.get("from"), *(obj.get("to") or [])]
+    numbers = ",".join(sorted(p for p in participants if p))
+    return f"{obj.get('phoneNumberId', '')}:{numbers}"
+
+
+class BatchStats(IngestionStats):
+    """Thread-safe counters describing a batching sink."""
+
+    FIELDS: Tuple[str, ...] = ("submitted", "batches", "acked", "failed")
+
+
+class _Lane:
+    """Buffer and flusher thread for one partition of the conversations."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.pending: Deque[Tuple[WebhookEvent, "Future[None]", float]] = deque()
+        self.condition = threading.Condition()
+        self.thread: Optional[threading.Thread] = None
+
+
+class BatchingSink:
+    """
+    Collect webhook events into batches for a bulk handler.
+
+    Principles:
+    - Flush on size or on the age of the oldest buffered event
+    - Per-event acknowledgement through futures
+    - Events of one call or conversation are handled in arrival order
+    - Bounded buffers; submitters block when the handler falls behind
+
+    Events are partitioned into ``workers`` lanes by conversation_key(),
+    each flushed by its own thread, so conversations are handled in
+    parallel while the order within a call or conversation is preserved.
+
+    The sink is itself an event handler and can be passed to
+    WebhookWSGIApp/WebhookASGIApp or registered on a WebhookRouter.
+    """
+
+    def __init__(
+        self,
+        handler: BatchHandler,
+        max_batch_size: int = 500,
+        max_latency: float = 0.05,
+        workers: int = 1,
+        max_pending: int = 10_000,
+        key: Callable[[WebhookEvent], str] = conversation_key,
+    ):
+        """
+        Initialize batching sink.
+
+        Args:
+            handler: Callable invoked with each list of events. It may
+                return a mapping of event ID to exception for the events
+                that failed; raising fails the whole batch.
+            max_batch_size: Maximum events per batch
+            max_latency: Maximum seconds an event waits for its batch
+            workers: Number of lanes flushed in parallel
+            max_pending: Maximum buffered events per lane
+            key: Callable returning the ordering key of an event
+
+        Raises:
+            ValueError: If a size or count is less than 1
+        """
+        if max_batch_size < 1 or workers < 1 or max_pending < 1:
+            raise ValueError(
+                "max_batch_size, workers and max_pending must be at least 1"
+            )
+        self.handler = handler
+        self.max_batch_size = max_batch_size
+        self.max_latency = max_latency
+        self.max_pending = max_pending
+        self.key = key
+        self.stats = BatchStats()
+        self._lanes = [
+            _Lane(f"openphone-webhook-batch-{index}") for index in range(workers)
+        ]
+        self._closed = False
+        self._unfinished = 0
+        self._idle = threading.Condition()
+        self._start_lock = threading.Lock()
+        self._started = False
+
+    def start(self) -> None:
+        """Start the flusher threads (called automatically on first submit)."""
+        with self._start_lock:
+            if self._started:
+                return
+            for lane in self._lanes:
+                lane.thread = threading.Thread(
+                    target=self._work, args=(lane,), name=lane.name, daemon=True
+                )
+                lane.thread.start()
+            self._started = True
+
+    def submit(self, event: WebhookEvent) -> "Future[None]":
+        """
+        Buffer an event for the next batch of its lane.
+
+        Blocks while the lane holds ``max_pending`` events.
+
+        Args:
+            event: Webhook event
+
+        Returns:
+            Future resolved when the event was handled, or failed with its error
+
+        Raises:
+            RuntimeError: If the sink was closed
+        """
+        if not self._started:
+            self.start()
+        lane = self._lanes[hash(self.key(event)) % len(self._lanes)]
+        future: "Future[None]" = Future()
+        # Counted before it is visible to the flusher so join() cannot miss it
+        with self._idle:
+            self._unfinished += 1
+        with lane.condition:
+            while len(lane.pending) >= self.max_pending and not self._closed:
+                lane.condition.wait()
+            if self._closed:
+                self._settle(1)
+                raise RuntimeError("BatchingSink is closed")
+            lane.pending.append((event, future, time.monotonic()))
+            if len(lane.pending) == 1 or len(lane.pending) >= self.max_batch_size:
+                lane.condition.notify_all()
+        self.stats.increment("submitted")
+        return future
+
+    def __call__(self, event: WebhookEvent) -> "Future[None]":
+        """Submit an event; lets the sink be used as an event handler."""
+        return self.submit(event)
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every submitted event was handled.
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if the sink is idle, False on timeout
+        """
+        with self._idle:
+            return self._idle.wait_for(lambda: self._unfinished == 0, timeout)
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Flush the buffered events and stop the flusher threads.
+
+        Args:
+            timeout: Maximum seconds to wait for each thread
+        """
+        self._closed = True
+        for lane in self._lanes:
+            with lane.condition:
+                lane.condition.notify_all()
+        for lane in self._lanes:
+            if lane.thread is not None:
+                lane.thread.join(timeout)
+
+    @property
+    def pending_count(self) -> int:
+        """Number of buffered events not yet handed to the handler."""
+        return sum(len(lane.pending) for lane in self._lanes)
+
+    def __enter__(self) -> "BatchingSink":
+        """Enter context manager."""
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Exit context manager, flushing the buffered events."""
+        self.close()
+
+    def _work(self, lane: _Lane) -> None:
+        """Flusher loop of one lane."""
+        while True:
+            with lane.condition:
+                while not lane.pending and not self._closed:
+                    lane.condition.wait()
+                if not lane.pending:
+                    return
+                deadline = lane.pending[0][2] + self.max_latency
+                while len(lane.pending) < self.max_batch_size and not self._closed:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    lane.condition.wait(remaining)
+                size = min(len(lane.pending), self.max_batch_size)
+                batch = [lane.pending.popleft() for _ in range(size)]
+                lane.condition.notify_all()
+            self._flush(batch)
+
+    def _flush(self, batch: List[Tuple[WebhookEvent, "Future[None]", float]]) -> None:
+        """Hand one batch to the handler and settle its futures."""
+        events = [event for event, _, _ in batch]
+        failures: Dict[str, Any] = {}
+        batch_error: Optional[BaseException] = None
+        try:
+            failures = dict(self.handler(events) or {})
+        except Exception as e:
+            batch_error = e
+            logger.error(
+                "Webhook batch handler failed for %d events: %s",
+                len(events),
+                e,
+                exc_info=e,
+            )
+        self.stats.increment("batches")
+
+        for event, future, _ in batch:
+            error = batch_error or failures.get(event.id)
+            if error is None:
+                self.stats.increment("acked")
+                future.set_result(None)
+            else:
+                if not isinstance(error, BaseException):
+                    error = RuntimeError(str(error))
+                self.stats.increment("failed")
+                future.set_exception(error)
+
+        self._settle(len(batch))
+
+    def _settle(self, count: int) -> None:
+        """Mark events as finished and wake join() once none are left."""
+        with self._idle:
+            self._unfinished -= count
+            if self._unfinished == 0:
+                self._idle.notify_all()
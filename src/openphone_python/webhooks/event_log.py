@@ -0,0 +1,382 @@
+"""
+Append-only local log of webhook events for the OpenPhone Python SDK.
+
+Verified deliveries are appended as raw bytes to segment files, each with
+a dense offset index, so traffic can be replayed later for debugging or to
+rebuild downstream state. Segments are rotated by size and read back
+through memory maps.
+
+On disk a log is a directory of segment pairs named after the offset of
+their first record::
+
+    00000000000000000000.log    records: <length, crc32, received ms> + body
+    00000000000000000000.index  one little-endian uint64 file position per record
+"""
+
+import bisect
+import logging
+import mmap
+import os
+import struct
+import threading
+import time
+import zlib
+from typing import Any, Iterator, List, Optional, Tuple
+from openphone_python.models.webhook_event import WebhookEvent
+from .receiver import parse_event
+from .router import WebhookRouter
+
+logger = logging.getLogger(__name__)
+
+_RECORD_HEADER = struct.Struct("<IIq")
+_POSITION = struct.Struct("<Q")
+_LOG_SUFFIX = ".log"
+_INDEX_SUFFIX = ".index"
+
+
+def _segment_bases(directory: str) -> List[int]:
+    """Sorted first offsets of the segments in a log directory."""
+    bases = []
+    for name in os.listdir(directory):
+        stem, suffix = os.path.splitext(name)
+        if suffix == _LOG_SUFFIX and stem.isdigit():
+            bases.append(int(stem))
+    return sorted(bases)
+
+
+def _segment_path(directory: str, base: int, suffix: str) -> str:
+    """Path of a segment file."""
+    return os.path.join(directory, f"{base:020d}{suffix}")
+
+
+class EventLog:
+    """
+    Segmented append-only writer for raw webhook events.
+
+    Principles:
+    - One sequential write per event; no reads on the write path
+    - fsync batched by record count and elapsed time, also while idle
+    - Torn writes at the tail are detected by checksum and truncated on open
+
+    Every record gets a monotonically increasing offset that stays valid
+    across segment rotation and restarts.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        segment_bytes: int = 64 * 1024 * 1024,
+        fsync_records: int = 1000,
+        fsync_interval: float = 1.0,
+        max_segments: Optional[int] = None,
+    ):
+        """
+        Initialize event log.
+
+        Args:
+            directory: Directory holding the segments (created if missing)
+            segment_bytes: Size after which a new segment is started
+            fsync_records: Unsynced records that trigger an fsync (1 syncs
+                every event)
+            fsync_interval: Maximum seconds an appended record stays
+                unsynced; a background thread syncs while no events arrive
+            max_segments: Optional number of segments to keep; older ones
+                are deleted on rotation
+        """
+        self.directory = directory
+        self.segment_bytes = segment_bytes
+        self.fsync_records = fsync_records
+        self.fsync_interval = fsync_interval
+        self.max_segments = max_segments
+        self._lock = threading.Lock()
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+        self._closed = threading.Event()
+        os.makedirs(directory, exist_ok=True)
+        bases = _segment_bases(directory)
+        self._open_segment(bases[-1] if bases else 0, recover=bool(bases))
+        self._syncer: Optional[threading.Thread] = None
+        if fsync_records > 1 and fsync_interval > 0:
+            self._syncer = threading.Thread(
+                target=self._sync_idle, name="openphone-event-log-sync", daemon=True
+            )
+            self._syncer.start()
+
+    @property
+    def next_offset(self) -> int:
+        """Offset the next appended record will get."""
+        return self._base + self._count
+
+    def append(self, payload: bytes, received_at: Optional[float] = None) -> int:
+        """
+        Append a raw event.
+
+        Args:
+            payload: Raw request body
+            received_at: Receive time as a UNIX timestamp (defaults to now)
+
+        Returns:
+            Offset of the record
+        """
+        if received_at is None:
+            received_at = time.time()
+        header = _RECORD_HEADER.pack(
+            len(payload), zlib.crc32(payload), int(received_at * 1000)
+        )
+        record_size = len(header) + len(payload)
+        with self._lock:
+            if self._size and self._size + record_size > self.segment_bytes:
+                self._rotate()
+            offset = self._base + self._count
+            self._log.write(header)
+            self._log.write(payload)
+            self._index.write(_POSITION.pack(self._size))
+            self._size += record_size
+            self._count += 1
+            self._unsynced += 1
+            if (
+                self._unsynced >= self.fsync_records
+                or time.monotonic() - self._last_sync >= self.fsync_interval
+            ):
+                self._sync()
+        return offset
+
+    def flush(self) -> None:
+        """Make appended records visible to readers without waiting for fsync."""
+        with self._lock:
+            self._log.flush()
+            self._index.flush()
+
+    def sync(self) -> None:
+        """Flush and fsync appended records."""
+        with self._lock:
+            self._sync()
+
+    def close(self) -> None:
+        """Sync and close the current segment."""
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        if self._syncer is not None:
+            self._syncer.join()
+        with self._lock:
+            self._sync()
+            self._log.close()
+            self._index.close()
+
+    def reader(self) -> "EventLogReader":
+        """Reader over this log, including every record appended so far."""
+        self.flush()
+        return EventLogReader(self.directory)
+
+    def __enter__(self) -> "EventLog":
+        """Enter context manager."""
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Exit context manager."""
+        self.close()
+
+    def _sync(self) -> None:
+        """Flush and fsync; caller holds the lock."""
+        # Log before index, so an index entry never points at unwritten bytes
+        self._log.flush()
+        os.fsync(self._log.fileno())
+        self._index.flush()
+        os.fsync(self._index.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def _sync_idle(self) -> None:
+        """Sync records left unsynced because no further event arrived."""
+        while not self._closed.wait(self.fsync_interval):
+            with self._lock:
+                if self._unsynced and not self._closed.is_set():
+                    self._sync()
+
+    def _rotate(self) -> None:
+        """Close the current segment and start the next one; caller holds the lock."""
+        self._sync()
+        self._log.close()
+        self._index.close()
+        self._open_segment(self._base + self._count, recover=False)
+        if self.max_segments:
+            for base in _segment_bases(self.directory)[: -self.max_segments]:
+                for suffix in (_LOG_SUFFIX, _INDEX_SUFFIX):
+                    try:
+                        os.remove(_segment_path(self.directory, base, suffix))
+                    except FileNotFoundError:
+                        pass
+
+    def _open_segment(self, base: int, recover: bool) -> None:
+        """Open a segment for appending, recovering its tail if it exists."""
+        log_path = _segment_path(self.directory, base, _LOG_SUFFIX)
+        index_path = _segment_path(self.directory, base, _INDEX_SUFFIX)
+        count, size = self._recover(log_path, index_path) if recover else (0, 0)
+        self._log = open(log_path, "ab")
+        self._index = open(index_path, "ab")
+        self._base = base
+        self._count = count
+        self._size = size
+
+    def _recover(self, log_path: str, index_path: str) -> Tuple[int, int]:
+        """
+        Validate a segment, truncate a torn tail and rebuild its index.
+
+        Returns:
+            Number of valid records and the valid log size
+        """
+        positions = bytearray()
+        size = 0
+        with open(log_path, "r+b") as f:
+            data = f.read()
+            while size + _RECORD_HEADER.size <= len(data):
+                length, crc, _ = _RECORD_HEADER.unpack_from(data, size)
+                start = size + _RECORD_HEADER.size
+                end = start + length
+                if end > len(data) or zlib.crc32(data[start:end]) != crc:
+                    break
+                positions += _POSITION.pack(size)
+                size = end
+            if size != len(data):
+                logger.warning(
+                    "Truncating %d bytes of incomplete records from %s",
+                    len(data) - size,
+                    log_path,
+                )
+                f.truncate(size)
+        with open(index_path, "wb") as f:
+            f.write(positions)
+        return len(positions) // _POSITION.size, size
+
+
+class EventLogReader:
+    """
+    Memory-mapped reader of an event log directory.
+
+    Safe to use while another process appends; records that are not fully
+    flushed yet are not returned.
+    """
+
+    def __init__(self, directory: str):
+        """
+        Initialize event log reader.
+
+        Args:
+            directory: Directory written by an EventLog
+        """
+        self.directory = directory
+
+    def read(
+        self, start: int = 0, stop: Optional[int] = None
+    ) -> Iterator[Tuple[int, bytes]]:
+        """
+        Iterate over records in offset order.
+
+        Args:
+            start: First offset to return
+            stop: Offset to stop before (end of the log when None)
+
+        Returns:
+            Iterator yielding (offset, raw body) tuples
+        """
+        bases = _segment_bases(self.directory)
+        for position, base in enumerate(bases):
+            next_base = bases[position + 1] if position + 1 < len(bases) else None
+            if next_base is not None and next_base <= start:
+                continue
+            if stop is not None and base >= stop:
+                break
+            yield from self._read_segment(base, start, stop)
+
+    def get(self, offset: int) -> bytes:
+        """
+        Read one record.
+
+        Args:
+            offset: Record offset
+
+        Returns:
+            Raw body of the record
+
+        Raises:
+            KeyError: If no record has that offset
+        """
+        bases = _segment_bases(self.directory)
+        position = bisect.bisect_right(bases, offset) - 1
+        if position >= 0:
+            for _, payload in self._read_segment(bases[position], offset, offset + 1):
+                return payload
+        raise KeyError(offset)
+
+    def replay(
+        self,
+        handler: Any,
+        start: int = 0,
+        stop: Optional[int] = None,
+    ) -> int:
+        """
+        Parse records and pass them to a router or handler.
+
+        Args:
+            handler: WebhookRouter or callable invoked with each event
+            start: First offset to replay
+            stop: Offset to stop before (end of the log when None)
+
+        Returns:
+            Number of events replayed
+
+        Raises:
+            Exception: Whatever the handler raises
+        """
+        dispatch = handler.dispatch if isinstance(handler, WebhookRouter) else handler
+        count = 0
+        for _, payload in self.read(start, stop):
+            dispatch(parse_event(payload))
+            count += 1
+        return count
+
+    def events(
+        self, start: int = 0, stop: Optional[int] = None
+    ) -> Iterator[Tuple[int, WebhookEvent]]:
+        """
+        Iterate over parsed events.
+
+        Args:
+            start: First offset to return
+            stop: Offset to stop before (end of the log when None)
+
+        Returns:
+            Iterator yielding (offset, WebhookEvent) tuples
+        """
+        for offset, payload in self.read(start, stop):
+            yield offset, parse_event(payload)
+
+    def _read_segment(
+        self, base: int, start: int, stop: Optional[int]
+    ) -> Iterator[Tuple[int, bytes]]:
+        """Read the records of one segment within [start, stop)."""
+        try:
+            with open(_segment_path(self.directory, base, _INDEX_SUFFIX), "rb") as f:
+                index = f.read()
+            log = open(_segment_path(self.directory, base, _LOG_SUFFIX), "rb")
+        except FileNotFoundError:
+            # Removed by retention while we were reading
+            return
+        with log:
+            size = os.fstat(log.fileno()).st_size
+            if size == 0:
+                return
+            with mmap.mmap(log.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                count = len(index) // _POSITION.size
+                first = max(start - base, 0)
+                last = count if stop is None else min(count, stop - base)
+                for number in range(first, last):
+                    (position,) = _POSITION.unpack_from(index, number * _POSITION.size)
+                    body_start = position + _RECORD_HEADER.size
+                    if body_start > size:
+                        return
+                    length, _, _ = _RECORD_HEADER.unpack_from(data, position)
+                    if body_start + length > size:
+                        return
+                    yield base + number, data[body_start : body_start + length]
@@ -0,0 +1,195 @@
+"""Webhook receiver for the OpenPhone Python SDK."""
+
+import json
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Mapping, Optional
+from openphone_python.exceptions import ValidationError
+from openphone_python.models.webhook import Webhook
+from openphone_python.models.webhook_event import WebhookEvent
+from .dedup import BaseDeduplicator
+from .signature import DEFAULT_TOLERANCE, SIGNATURE_HEADER, SignatureVerifier
+
+if TYPE_CHECKING:
+    from .event_log import EventLog
+
+
+def get_header(headers: Mapping[str, str], name: str) -> Optional[str]:
+    """
+    Look up a header case-insensitively.
+
+    Accepts plain dictionaries, framework header objects and WSGI environs
+    (``HTTP_OPENPHONE_SIGNATURE``).
+
+    Args:
+        headers: Request headers
+        name: Lower-case header name
+
+    Returns:
+        Header value or None
+    """
+    value = headers.get(name)
+    if value is not None:
+        return value
+
+    environ_key = "HTTP_" + name.upper().replace("-", "_")
+    value = headers.get(environ_key)
+    if value is not None:
+        return value
+
+    for key, value in headers.items():
+        if isinstance(key, str) and key.lower() == name:
+            return value
+    return None
+
+
+class WebhookReceiver:
+    """
+    Verify and parse incoming webhook deliveries.
+
+    Principles:
+    - Signature verified on the raw body before any parsing
+    - Framework agnostic: bytes and headers in, typed event out
+    - Safe to share between threads
+    """
+
+    def __init__(
+        self,
+        signing_keys: Optional[Dict[str, str]] = None,
+        key_loader: Optional[Callable[[str], str]] = None,
+        tolerance: Optional[float] = DEFAULT_TOLERANCE,
+        verify: bool = True,
+        deduplicator: Optional[BaseDeduplicator] = None,
+        event_log: Optional["EventLog"] = None,
+    ):
+        """
+        Initialize webhook receiver.
+
+        Args:
+            signing_keys: Signing keys keyed by webhook ID
+            key_loader: Optional callable returning the signing key of an
+                unknown webhook ID
+            tolerance: Maximum age in seconds of a signature timestamp
+            verify: Verify signatures (disable only for local testing)
+            deduplicator: Optional deduplicator suppressing redelivered events
+            event_log: Optional log every accepted delivery is appended to
+        """
+        self.verifier = SignatureVerifier(signing_keys, key_loader, tolerance)
+        self.verify = verify
+        self.deduplicator = deduplicator
+        self.event_log = event_log
+
+    @classmethod
+    def from_webhooks(
+        cls, webhooks: Iterable[Webhook], **kwargs: Any
+    ) -> "WebhookReceiver":
+        """
+        Create a receiver for webhooks returned by the API.
+
+        Args:
+            webhooks: Webhook instances, e.g. ``client.webhooks.get_all()``
+            **kwargs: Additional WebhookReceiver arguments
+
+        Returns:
+            WebhookReceiver instance
+        """
+        keys = {webhook.id: webhook.key for webhook in webhooks if webhook.key}
+        return cls(signing_keys=keys, **kwargs)
+
+    def receive(
+        self,
+        body: bytes,
+        headers: Mapping[str, str],
+        webhook_id: Optional[str] = None,
+    ) -> WebhookEvent:
+        """
+        Verify a delivery and parse it into an event.
+
+        Args:
+            body: Raw request body
+            headers: Request headers
+            webhook_id: Webhook the delivery belongs to, if known from the URL
+
+        Returns:
+            WebhookEvent instance
+
+        Raises:
+            WebhookVerificationError: If the signature is not valid
+            ValidationError: If the body is not a JSON event object
+        """
+        if self.verify:
+            self.verifier.verify(
+                body, get_header(headers, SIGNATURE_HEADER), webhook_id
+            )
+        return parse_event(body)
+
+    def is_duplicate(self, event: WebhookEvent, record: bool = True) -> bool:
+        """
+        Report whether an event was already received, recording it by default.
+
+        Always False when no deduplicator is configured. Pass
+        ``record=False`` when the event may still be refused, and call
+        accept() once it has been taken on, so a redelivery of a refused
+        event is processed.
+
+        Args:
+            event: Verified webhook event
+            record: Record the event ID as seen
+
+        Returns:
+            True if the event ID was seen before
+        """
+        if self.deduplicator is None or not event.id:
+            return False
+        if record:
+            return self.deduplicator.seen(event.id)
+        return self.deduplicator.contains(event.id)
+
+    def accept(self, event: WebhookEvent, body: Optional[bytes] = None) -> None:
+        """
+        Record an event that was taken on, so redeliveries are duplicates.
+
+        Also appends the raw delivery to the event log, if one is
+        configured, so refused and duplicate deliveries are not logged.
+
+        Args:
+            event: Verified webhook event
+            body: Raw request body the event was parsed from
+        """
+        if self.deduplicator is not None and event.id:
+            self.deduplicator.add(event.id)
+        if self.event_log is not None and body is not None:
+            self.event_log.append(body)
+
+    def forget(self, event: WebhookEvent) -> None:
+        """
+        Forget an event so a redelivery is processed.
+
+        Only effective with deduplicators that can forget; prefer
+        ``is_duplicate(event, record=False)`` followed by accept().
+
+        Args:
+            event: Webhook event that was not processed
+        """
+        if self.deduplicator is not None and event.id:
+            self.deduplicator.forget(event.id)
+
+
+def parse_event(body: bytes) -> WebhookEvent:
+    """
+    Parse a raw webhook body into an event without verifying it.
+
+    Args:
+        body: Raw request body
+
+    Returns:
+        WebhookEvent instance
+
+    Raises:
+        ValidationError: If the body is not a JSON event object
+    """
+    try:
+        data = json.loads(body)
+    except ValueError as e:
+        raise ValidationError(f"Webhook payload is not valid JSON: {e}") from e
+    if not isinstance(data, dict):
+        raise ValidationError("Webhook payload must be a JSON object")
+    return WebhookEvent(data)
@@ -0,0 +1,416 @@
+"""
+Webhook gap reconciliation for the OpenPhone Python SDK.
+
+Events that arrive while the receiver is down are lost once OpenPhone stops
+retrying them. The reconciler closes such gaps by polling the API for
+messages and calls created since the last reconciled point of each phone
+number, and feeds them to the same handlers as live webhooks. Objects that
+were already handled, live or by an earlier pass, are suppressed.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple, cast
+from openphone_python.models.base import BaseModel
+from openphone_python.models.conversation import Conversation
+from openphone_python.models.phone_number import PhoneNumber
+from openphone_python.models.webhook_event import WebhookEvent
+from openphone_python.utils.concurrency import (
+    DEFAULT_REQUESTS_PER_SECOND,
+    RateLimiter,
+    run_concurrently,
+)
+from .dedup import BaseDeduplicator, LRUDeduplicator
+from .router import WebhookRouter
+
+if TYPE_CHECKING:
+    from openphone_python.client import OpenPhoneClient
+
+logger = logging.getLogger(__name__)
+
+# Event types that can be rebuilt from the list endpoints
+RECONCILED_EVENTS = ("message.received", "call.completed")
+
+# Calls in these states have not completed yet
+ACTIVE_CALL_STATUSES = frozenset({"queued", "initiated", "ringing", "in-progress"})
+
+
+class ReconcileReport:
+    """Outcome of one reconciliation pass."""
+
+    def __init__(self) -> None:
+        """Initialize an empty report."""
+        self.dispatched = 0
+        self.duplicates = 0
+        self.failed = 0
+        self.errors: List[Exception] = []
+        self.watermarks: Dict[str, str] = {}
+
+    @property
+    def ok(self) -> bool:
+        """Whether every object was fetched and handled."""
+        return not self.errors and not self.failed
+
+    def __repr__(self) -> str:
+        """Return the string representation of the report."""
+        return (
+            f"ReconcileReport(dispatched={self.dispatched}, "
+            f"duplicates={self.duplicates}, failed={self.failed}, "
+            f"errors={len(self.errors)})"
+        )
+
+
+class WebhookReconciler:
+    """
+    Backfill webhook events missed while the receiver was unavailable.
+
+    Principles:
+    - One watermark per phone number, persisted to a small JSON file
+    - Only conversations updated since the watermark are crawled
+    - Live and backfilled events share one deduplicator keyed by object ID
+    - A watermark never moves past an object that was not handled
+
+    Route live events through handle() so the reconciler knows what was
+    already processed; reconcile() then only dispatches what is missing.
+    """
+
+    def __init__(
+        self,
+        client: "OpenPhoneClient",
+        handler: Any,
+        phone_numbers: Optional[Iterable[PhoneNumber]] = None,
+        deduplicator: Optional[BaseDeduplicator] = None,
+        state_path: Optional[str] = None,
+        events: Iterable[str] = RECONCILED_EVENTS,
+        initial_lookback: float = 86400.0,
+        overlap: float = 60.0,
+        max_workers: int = 4,
+        rate_limit: Optional[float] = DEFAULT_REQUESTS_PER_SECOND,
+    ):
+        """
+        Initialize webhook reconciler.
+
+        Args:
+            client: OpenPhone client used for the list endpoints
+            handler: WebhookRouter or callable invoked with each event
+            phone_numbers: Phone numbers to reconcile (all workspace numbers
+                when None)
+            deduplicator: Deduplicator of handled object IDs (an in-memory
+                LRUDeduplicator when None)
+            state_path: Optional JSON file the watermarks are kept in
+            events: Event types to reconcile
+            initial_lookback: Seconds to look back for a phone number
+                without a watermark
+            overlap: Seconds each pass re-reads before the watermark, to
+                absorb clock skew between this host and the API
+            max_workers: Maximum number of conversations fetched concurrently
+            rate_limit: Maximum conversation fetches per second (None to disable)
+        """
+        self.client = client
+        self.handler = handler
+        self.deduplicator = (
+            deduplicator if deduplicator is not None else LRUDeduplicator()
+        )
+        self.state_path = state_path
+        self.events = frozenset(events)
+        self.initial_lookback = initial_lookback
+        self.overlap = overlap
+        self.max_workers = max_workers
+        self.rate_limit = rate_limit
+        self._phone_numbers = list(phone_numbers) if phone_numbers is not None else None
+        self._watermarks: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        if state_path and os.path.exists(state_path):
+            self._load(state_path)
+
+    def handle(self, event: WebhookEvent) -> int:
+        """
+        Handle a live event, recording it so reconciliation skips it.
+
+        Use this as the handler of a WebhookWSGIApp/WebhookASGIApp or call
+        it from your own endpoint.
+
+        Args:
+            event: Verified webhook event
+
+        Returns:
+            Number of handlers called (0 if the object was already handled)
+
+        Raises:
+            Exception: Whatever the handler raises
+        """
+        key = self._key(event)
+        if key is None:
+            return self._dispatch(event)
+        if not self._claim(key):
+            return 0
+        try:
+            handled = self._dispatch(event)
+        except Exception:
+            self._release(key)
+            raise
+        self._commit(key)
+        return handled
+
+    def watermark(self, phone_number_id: str) -> Optional[str]:
+        """
+        Point up to which a phone number has been reconciled.
+
+        Args:
+            phone_number_id: OpenPhone number ID
+
+        Returns:
+            ISO 8601 timestamp, or None if it was never reconciled
+        """
+        with self._lock:
+            return self._watermarks.get(phone_number_id)
+
+    def reconcile(
+        self, cancel_event: Optional[threading.Event] = None
+    ) -> ReconcileReport:
+        """
+        Fetch and dispatch events missed since the last pass.
+
+        Args:
+            cancel_event: Optional event; once set no new conversations are fetched
+
+        Returns:
+            ReconcileReport describing the pass
+        """
+        report = ReconcileReport()
+        if self._phone_numbers is None:
+            self._phone_numbers = list(self.client.phone_numbers.list())
+        for phone_number in self._phone_numbers:
+            if cancel_event is not None and cancel_event.is_set():
+                break
+            self._reconcile_number(phone_number, report, cancel_event)
+        if self.state_path:
+            self.save()
+        return report
+
+    def run(self, interval: float, stop_event: threading.Event) -> None:
+        """
+        Reconcile immediately and then every ``interval`` seconds.
+
+        Args:
+            interval: Seconds between passes
+            stop_event: Event that ends the loop once set
+        """
+        while not stop_event.is_set():
+            try:
+                report = self.reconcile(stop_event)
+                logger.info("Webhook reconciliation finished: %s", report)
+            except Exception as e:
+                logger.error("Webhook reconciliation failed: %s", e, exc_info=e)
+            stop_event.wait(interval)
+
+    def save(self, path: Optional[str] = None) -> None:
+        """
+        Persist the watermarks.
+
+        Args:
+            path: File to write (defaults to ``state_path``)
+
+        Raises:
+            ValueError: If no path is configured
+        """
+        target = path or self.state_path
+        if not target:
+            raise ValueError("No path given to persist reconciler state")
+        with self._lock:
+            payload = json.dumps(self._watermarks, indent=2, sort_keys=True)
+        tmp = f"{target}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(payload)
+        os.replace(tmp, target)
+
+    def _load(self, path: str) -> None:
+        """Restore watermarks written by save()."""
+        try:
+            with open(path, encoding="utf-8") as f:
+                self._watermarks = {str(k): str(v) for k, v in json.load(f).items()}
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning("Ignoring unreadable reconciler state %s: %s", path, e)
+
+    def _reconcile_number(
+        self,
+        phone_number: PhoneNumber,
+        report: ReconcileReport,
+        cancel_event: Optional[threading.Event],
+    ) -> None:
+        """Reconcile one phone number and advance its watermark."""
+        started = time.time()
+        watermark = self.watermark(phone_number.id)
+        if watermark is None:
+            since = started - self.initial_lookback
+        else:
+            since = _parse_timestamp(watermark) - self.overlap
+        since_text = _format_timestamp(since)
+
+        conversations = self.client.conversations.list(
+            phone_numbers=[phone_number.number],
+            updated_after=since_text,
+            max_results=100,
+        )
+        limiter = (
+            RateLimiter(self.rate_limit, state=self.client.rate_limit)
+            if self.rate_limit
+            else None
+        )
+        events: List[Tuple[float, WebhookEvent]] = []
+        complete = True
+        for result in run_concurrently(
+            lambda conversation: self._fetch_conversation(
+                phone_number.id, conversation, since_text
+            ),
+            conversations,
+            max_workers=self.max_workers,
+            rate_limiter=limiter,
+            cancel_event=cancel_event,
+        ):
+            if result.ok:
+                events.extend(result.value)
+            else:
+                complete = False
+                report.errors.append(cast(Exception, result.error))
+                logger.warning(
+                    "Could not reconcile conversation %s: %s",
+                    result.item.id,
+                    result.error,
+                )
+
+        events.sort(key=lambda pair: pair[0])
+        first_failure: Optional[float] = None
+        for created, event in events:
+            key = self._key(event)
+            if key is None or not self._claim(key):
+                report.duplicates += 1
+                continue
+            try:
+                self._dispatch(event)
+                self._commit(key)
+                report.dispatched += 1
+            except Exception as e:
+                self._release(key)
+                report.failed += 1
+                logger.error(
+                    "Webhook handler failed for %s: %s", event.id, e, exc_info=e
+                )
+                if first_failure is None:
+                    first_failure = created
+
+        # Only move forward past objects that were all fetched and handled
+        if not complete:
+            return
+        target = started if first_failure is None else first_failure
+        with self._lock:
+            current = self._watermarks.get(phone_number.id)
+            if current is None or _parse_timestamp(current) < target:
+                self._watermarks[phone_number.id] = _format_timestamp(target)
+            report.watermarks[phone_number.id] = self._watermarks[phone_number.id]
+
+    def _fetch_conversation(
+        self, phone_number_id: str, conversation: Conversation, since: str
+    ) -> List[Tuple[float, WebhookEvent]]:
+        """Rebuild the events of one conversation created after ``since``."""
+        participants = conversation.participants
+        events = []
+        if "message.received" in self.events or "message.delivered" in self.events:
+            for message in self.client.messages.list(
+                phone_number_id, participants, created_after=since, max_results=100
+            ):
+                if message.direction == "incoming":
+                    event_type = "message.received"
+                elif message.status == "delivered":
+                    event_type = "message.delivered"
+                else:
+                    continue
+                if event_type in self.events:
+                    events.append(_backfill_event(event_type, message))
+
+        if "call.completed" in self.events:
+            if len(participants) == 1:
+                for call in self.client.calls.list(
+                    phone_number_id, participants, created_after=since, max_results=100
+                ):
+                    if call.status not in ACTIVE_CALL_STATUSES:
+                        events.append(_backfill_event("call.completed", call))
+            else:
+                logger.debug("Skipping calls of group conversation %s", conversation.id)
+        return events
+
+    def _key(self, event: WebhookEvent) -> Optional[str]:
+        """Deduplication key of an event, or None if it is not reconciled."""
+        if event.type not in self.events:
+            return None
+        object_id = event.object.get("id")
+        return f"{event.type}:{object_id}" if object_id else None
+
+    def _claim(self, key: str) -> bool:
+        """
+        Whether an object is new and should be dispatched.
+
+        Deduplicators that can forget record the key now, so a live event
+        and a reconcile pass racing on one object dispatch it once, and
+        _release() forgets it if the dispatch fails. The others are only
+        checked here and _commit() records the key once the dispatch has
+        succeeded, so a failed dispatch is retried by the next pass.
+        """
+        if self.deduplicator.supports_forget:
+            return not self.deduplicator.seen(key)
+        return not self.deduplicator.contains(key)
+
+    def _commit(self, key: str) -> None:
+        """Record a claimed key after its dispatch succeeded."""
+        if not self.deduplicator.supports_forget:
+            self.deduplicator.add(key)
+
+    def _release(self, key: str) -> None:
+        """Release a claimed key after its dispatch failed."""
+        if self.deduplicator.supports_forget:
+            self.deduplicator.forget(key)
+
+    def _dispatch(self, event: WebhookEvent) -> int:
+        """Pass an event to the handler."""
+        if isinstance(self.handler, WebhookRouter):
+            return self.handler.dispatch(event)
+        self.handler(event)
+        return 1
+
+
+def _backfill_event(event_type: str, model: BaseModel) -> Tuple[float, WebhookEvent]:
+    """Wrap an API object in an event shaped like a webhook delivery."""
+    # Models add parsed snake_case fields next to the camelCase API fields
+    obj = {key: value for key, value in model.to_dict().items() if "_" not in key}
+    created_at = obj.get("createdAt")
+    event = WebhookEvent(
+        {
+            "id": f"backfill:{event_type}:{obj.get('id', '')}",
+            "object": "event",
+            "type": event_type,
+            "createdAt": created_at,
+            "data": {"object": obj},
+        }
+    )
+    created = _parse_timestamp(created_at) if created_at else 0.0
+    return created, event
+
+
+def _parse_timestamp(value: str) -> float:
+    """Epoch seconds of an ISO 8601 timestamp (naive values are UTC)."""
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def _format_timestamp(value: float) -> str:
+    """ISO 8601 timestamp in the format the API returns."""
+    text = datetime.fromtimestamp(value, timezone.utc).isoformat(
+        timespec="milliseconds"
+    )
+    return text.replace("+00:00", "Z")
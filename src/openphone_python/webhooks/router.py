@@ -0,0 +1,193 @@
+"""Webhook event dispatch for the OpenPhone Python SDK."""
+
+import asyncio
+import inspect
+import threading
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
+from openphone_python.models.webhook_event import ALL_EVENTS, WebhookEvent
+
+Handler = Callable[[WebhookEvent], Union[Any, Awaitable[Any]]]
+
+# Pattern that matches every event type
+ANY_EVENT = "*"
+
+
+def _patterns_for(event_type: str) -> Tuple[str, ...]:
+    """
+    Registration patterns matching an event type, most specific first.
+
+    ``call.summary.completed`` is matched by itself, ``call.summary.*``,
+    ``call.*`` and ``*``.
+    """
+    parts = event_type.split(".")
+    families = tuple(
+        ".".join(parts[:length]) + ".*" for length in range(len(parts) - 1, 0, -1)
+    )
+    return (event_type, *families, ANY_EVENT)
+
+
+class WebhookRouter:
+    """
+    Dispatch webhook events to handlers registered per event type.
+
+    Principles:
+    - O(1) dispatch through a precomputed handler table
+    - Sync and async handlers side by side
+    - Event objects converted to SDK models only when accessed
+
+    Handlers can be registered for an exact type (``call.completed``), a
+    family at any depth (``call.*``, ``call.summary.*``) or every event
+    (``*``).
+    """
+
+    def __init__(self) -> None:
+        """Initialize router with no handlers."""
+        self._handlers: Dict[str, List[Tuple[Handler, bool]]] = {}
+        self._table: Dict[str, Tuple[Tuple[Handler, bool], ...]] = {}
+        self._lock = threading.Lock()
+
+    def add_handler(self, event_type: str, handler: Handler) -> None:
+        """
+        Register a handler for an event type.
+
+        Args:
+            event_type: Event type, family pattern such as ``message.*`` or
+                ``call.summary.*``, or ``*``
+            handler: Callable or coroutine function taking a WebhookEvent
+
+        Raises:
+            ValueError: If the event type is not known
+        """
+        family = event_type[:-2] if event_type.endswith(".*") else None
+        known = (
+            event_type == ANY_EVENT
+            or event_type in ALL_EVENTS
+            or any(event.startswith(f"{family}.") for event in ALL_EVENTS)
+        )
+        if not known:
+            raise ValueError(
+                f"Unknown event type: {event_type}. Valid events: {sorted(ALL_EVENTS)}"
+            )
+
+        is_async = inspect.iscoroutinefunction(handler)
+        with self._lock:
+            self._handlers.setdefault(event_type, []).append((handler, is_async))
+            self._table = self._build_table()
+
+    def on(self, *event_types: str) -> Callable[[Handler], Handler]:
+        """
+        Register a handler for one or more event types, as a decorator.
+
+        Args:
+            *event_types: Event types or patterns
+
+        Returns:
+            Decorator returning the handler unchanged
+
+        Examples:
+            @router.on("message.received")
+            def handle_message(event):
+                print(event.model.text)
+        """
+
+        def decorator(handler: Handler) -> Handler:
+            for event_type in event_types:
+                self.add_handler(event_type, handler)
+            return handler
+
+        return decorator
+
+    def _build_table(self) -> Dict[str, Tuple[Tuple[Handler, bool], ...]]:
+        """Precompute the handlers of every known event type; caller holds the lock."""
+        return {event_type: self._resolve(event_type) for event_type in ALL_EVENTS}
+
+    def _resolve(self, event_type: str) -> Tuple[Tuple[Handler, bool], ...]:
+        """Collect the handlers matching an event type."""
+        handlers: List[Tuple[Handler, bool]] = []
+        for pattern in _patterns_for(event_type):
+            handlers.extend(self._handlers.get(pattern, ()))
+        return tuple(handlers)
+
+    def handlers_for(self, event_type: str) -> Tuple[Handler, ...]:
+        """
+        Handlers that would receive an event type.
+
+        Args:
+            event_type: Event type
+
+        Returns:
+            Tuple of handlers in call order
+        """
+        return tuple(handler for handler, _ in self._lookup(event_type))
+
+    def _lookup(self, event_type: str) -> Tuple[Tuple[Handler, bool], ...]:
+        """Handlers for an event type from the precomputed table."""
+        handlers = self._table.get(event_type)
+        if handlers is None:
+            # Event types added by OpenPhone after this release
+            with self._lock:
+                handlers = self._table.get(event_type)
+                if handlers is None:
+                    handlers = self._resolve(event_type)
+                    self._table = {**self._table, event_type: handlers}
+        return handlers
+
+    def dispatch(self, event: WebhookEvent) -> int:
+        """
+        Call the handlers of an event in registration order.
+
+        Coroutine handlers are run to completion with ``asyncio.run``; use
+        dispatch_async() from inside an event loop instead.
+
+        Args:
+            event: Parsed webhook event
+
+        Returns:
+            Number of handlers called
+
+        Raises:
+            Exception: Whatever a handler raises
+        """
+        handlers = self._lookup(event.type)
+        for handler, is_async in handlers:
+            if is_async:
+                asyncio.run(cast(Coroutine[Any, Any, Any], handler(event)))
+            else:
+                handler(event)
+        return len(handlers)
+
+    async def dispatch_async(
+        self, event: WebhookEvent, executor: Optional[Any] = None
+    ) -> int:
+        """
+        Call the handlers of an event from an event loop.
+
+        Coroutine handlers are awaited; plain handlers run in ``executor``
+        (the loop's default executor when None) so they cannot block the loop.
+
+        Args:
+            event: Parsed webhook event
+            executor: Optional concurrent.futures executor for sync handlers
+
+        Returns:
+            Number of handlers called
+        """
+        handlers = self._lookup(event.type)
+        loop = asyncio.get_running_loop()
+        for handler, is_async in handlers:
+            if is_async:
+                await handler(event)
+            else:
+                await loop.run_in_executor(executor, handler, event)
+        return len(handlers)
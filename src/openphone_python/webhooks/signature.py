@@ -0,0 +1,291 @@
+"""
+Webhook signature verification for the OpenPhone Python SDK.
+
+OpenPhone signs every delivery with the webhook's signing key and sends the
+result in the ``openphone-signature`` header::
+
+    hmac;1;<timestamp in ms>;<base64 HMAC-SHA256 digest>
+
+The digest covers ``<timestamp>.<raw request body>`` and is computed with
+the base64-decoded signing key. Several comma-separated signatures may be
+present while a key is being rotated.
+"""
+
+import base64
+import binascii
+import hashlib
+import hmac
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from openphone_python.exceptions import (
+    NotFoundError,
+    WebhookKeyUnavailableError,
+    WebhookVerificationError,
+)
+
+SIGNATURE_HEADER = "openphone-signature"
+SIGNATURE_SCHEME = "hmac"
+SIGNATURE_VERSION = "1"
+
+# Reject deliveries signed more than five minutes away from local time
+DEFAULT_TOLERANCE = 300.0
+
+# Seconds an unknown webhook ID or a failed key load is remembered
+DEFAULT_NEGATIVE_TTL = 30.0
+
+# Upper bound on remembered unknown webhook IDs
+_MAX_NEGATIVE_ENTRIES = 1024
+
+
+@lru_cache(maxsize=256)
+def _keyed_hmac(signing_key: str) -> "hmac.HMAC":
+    """
+    Build an HMAC object keyed with a decoded signing key.
+
+    Decoding the key and running the HMAC key schedule happen once per key;
+    verifications copy the returned object instead.
+    """
+    try:
+        key = base64.b64decode(signing_key, validate=True)
+    except (binascii.Error, ValueError) as e:
+        raise WebhookVerificationError("Webhook signing key is not valid base64") from e
+    return hmac.new(key, digestmod=hashlib.sha256)
+
+
+def _parse_signatures(header: str) -> List[Tuple[bytes, bytes]]:
+    """Split a signature header into (timestamp, digest) pairs."""
+    signatures = []
+    for entry in header.split(","):
+        parts = entry.strip().split(";")
+        if (
+            len(parts) == 4
+            and parts[0] == SIGNATURE_SCHEME
+            and parts[1] == SIGNATURE_VERSION
+            and parts[2].isdigit()
+        ):
+            signatures.append((parts[2].encode("ascii"), parts[3].encode("ascii")))
+    return signatures
+
+
+def compute_signature(payload: bytes, signing_key: str, timestamp_ms: int) -> str:
+    """
+    Compute a signature header value for a payload.
+
+    Useful for tests and local load generators.
+
+    Args:
+        payload: Raw request body
+        signing_key: Base64 webhook signing key (``Webhook.key``)
+        timestamp_ms: Signing time in milliseconds since the epoch
+
+    Returns:
+        Value for the ``openphone-signature`` header
+    """
+    mac = _keyed_hmac(signing_key).copy()
+    mac.update(f"{timestamp_ms}.".encode("ascii"))
+    mac.update(payload)
+    digest = base64.b64encode(mac.digest()).decode("ascii")
+    return f"{SIGNATURE_SCHEME};{SIGNATURE_VERSION};{timestamp_ms};{digest}"
+
+
+class SignatureVerifier:
+    """
+    Verify webhook signatures against one or more signing keys.
+
+    Principles:
+    - Keys decoded once and cached per webhook ID
+    - Unknown IDs and failed key loads cached briefly, and key loads
+      bounded, so unsigned traffic cannot fan out into API calls
+    - Constant-time digest comparison
+    - Timestamp tolerance against replayed deliveries
+    """
+
+    def __init__(
+        self,
+        signing_keys: Optional[Dict[str, str]] = None,
+        key_loader: Optional[Callable[[str], str]] = None,
+        tolerance: Optional[float] = DEFAULT_TOLERANCE,
+        negative_ttl: float = DEFAULT_NEGATIVE_TTL,
+        max_concurrent_loads: int = 4,
+    ):
+        """
+        Initialize signature verifier.
+
+        Args:
+            signing_keys: Signing keys keyed by webhook ID
+            key_loader: Optional callable returning the signing key of an
+                unknown webhook ID, e.g.
+                ``lambda webhook_id: client.webhooks.get(webhook_id).key``
+            tolerance: Maximum age in seconds of a signature timestamp
+                (None disables the check)
+            negative_ttl: Seconds an unknown webhook ID or a failed key
+                load is remembered before key_loader is called again
+            max_concurrent_loads: Maximum key_loader calls in flight; further
+                unknown IDs are refused with WebhookKeyUnavailableError
+        """
+        self.key_loader = key_loader
+        self.tolerance = tolerance
+        self.negative_ttl = negative_ttl
+        self._keys: Dict[str, "hmac.HMAC"] = {}
+        # webhook ID -> (monotonic expiry, load error or None if not found)
+        self._misses: "OrderedDict[str, Tuple[float, Optional[str]]]" = OrderedDict()
+        self._loads = threading.BoundedSemaphore(max_concurrent_loads)
+        self._lock = threading.Lock()
+        for webhook_id, signing_key in (signing_keys or {}).items():
+            self.add_key(webhook_id, signing_key)
+
+    def add_key(self, webhook_id: str, signing_key: str) -> None:
+        """
+        Register or replace the signing key of a webhook.
+
+        Args:
+            webhook_id: Webhook ID
+            signing_key: Base64 signing key (``Webhook.key``)
+
+        Raises:
+            WebhookVerificationError: If the key is not valid base64
+        """
+        mac = _keyed_hmac(signing_key)
+        with self._lock:
+            self._keys[webhook_id] = mac
+            self._misses.pop(webhook_id, None)
+
+    def remove_key(self, webhook_id: str) -> None:
+        """Forget the signing key of a webhook."""
+        with self._lock:
+            self._keys.pop(webhook_id, None)
+
+    def _macs_for(self, webhook_id: Optional[str]) -> Iterable["hmac.HMAC"]:
+        """Keyed HMAC objects to try for a delivery."""
+        if webhook_id is None:
+            return list(self._keys.values())
+
+        mac = self._keys.get(webhook_id)
+        if mac is None and self.key_loader is not None:
+            mac = self._load(webhook_id, self.key_loader)
+        return [mac] if mac is not None else []
+
+    def _load(
+        self, webhook_id: str, key_loader: Callable[[str], str]
+    ) -> Optional["hmac.HMAC"]:
+        """Load the key of an unknown webhook, consulting the negative cache."""
+        now = time.monotonic()
+        with self._lock:
+            miss = self._misses.get(webhook_id)
+            if miss is not None and miss[0] <= now:
+                del self._misses[webhook_id]
+                miss = None
+        if miss is not None:
+            if miss[1] is None:
+                return None
+            raise WebhookKeyUnavailableError(miss[1])
+
+        if not self._loads.acquire(blocking=False):
+            raise WebhookKeyUnavailableError("Too many signing key loads in flight")
+        try:
+            signing_key = key_loader(webhook_id)
+        except NotFoundError:
+            self._remember_miss(webhook_id, None)
+            return None
+        except Exception as e:
+            message = f"Could not load signing key for webhook {webhook_id}: {e}"
+            self._remember_miss(webhook_id, message)
+            raise WebhookKeyUnavailableError(message) from e
+        finally:
+            self._loads.release()
+        self.add_key(webhook_id, signing_key)
+        return self._keys.get(webhook_id)
+
+    def _remember_miss(self, webhook_id: str, error: Optional[str]) -> None:
+        """Cache an unknown webhook ID or a failed key load."""
+        if self.negative_ttl <= 0:
+            return
+        with self._lock:
+            self._misses[webhook_id] = (time.monotonic() + self.negative_ttl, error)
+            self._misses.move_to_end(webhook_id)
+            while len(self._misses) > _MAX_NEGATIVE_ENTRIES:
+                self._misses.popitem(last=False)
+
+    def verify(
+        self,
+        payload: bytes,
+        signature_header: Optional[str],
+        webhook_id: Optional[str] = None,
+        now: Optional[float] = None,
+    ) -> None:
+        """
+        Verify the signature of a webhook delivery.
+
+        Args:
+            payload: Raw request body, exactly as received
+            signature_header: Value of the ``openphone-signature`` header
+            webhook_id: Webhook the delivery belongs to; when omitted every
+                registered key is tried
+            now: Current time in seconds since the epoch (for testing)
+
+        Raises:
+            WebhookVerificationError: If the signature is missing, malformed,
+                outside the tolerance window or does not match
+            WebhookKeyUnavailableError: If the key_loader failed for a
+                reason other than the webhook not existing
+        """
+        if not signature_header:
+            raise WebhookVerificationError("Missing webhook signature header")
+
+        signatures = _parse_signatures(signature_header)
+        if not signatures:
+            raise WebhookVerificationError("Malformed webhook signature header")
+
+        macs = self._macs_for(webhook_id)
+        if not macs:
+            raise WebhookVerificationError(f"No signing key for webhook {webhook_id}")
+
+        if self.tolerance is not None:
+            now_ms = (time.time() if now is None else now) * 1000
+            tolerance_ms = self.tolerance * 1000
+            signatures = [
+                (timestamp, digest)
+                for timestamp, digest in signatures
+                if abs(now_ms - int(timestamp)) <= tolerance_ms
+            ]
+            if not signatures:
+                raise WebhookVerificationError(
+                    "Webhook signature timestamp outside tolerance"
+                )
+
+        for timestamp, digest in signatures:
+            for keyed in macs:
+                mac = keyed.copy()
+                mac.update(timestamp)
+                mac.update(b".")
+                mac.update(payload)
+                if hmac.compare_digest(base64.b64encode(mac.digest()), digest):
+                    return
+
+        raise WebhookVerificationError("Webhook signature does not match")
+
+
+def verify_signature(
+    payload: bytes,
+    signature_header: Optional[str],
+    signing_key: str,
+    tolerance: Optional[float] = DEFAULT_TOLERANCE,
+) -> None:
+    """
+    Verify a webhook delivery against a single signing key.
+
+    Args:
+        payload: Raw request body, exactly as received
+        signature_header: Value of the ``openphone-signature`` header
+        signing_key: Base64 webhook signing key (``Webhook.key``)
+        tolerance: Maximum age in seconds of the signature timestamp
+
+    Raises:
+        WebhookVerificationError: If the signature is not valid
+    """
+    verifier = SignatureVerifier(tolerance=tolerance)
+    verifier.add_key("", signing_key)
+    verifier.verify(payload, signature_header, webhook_id="")
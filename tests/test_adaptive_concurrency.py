@@ -0,0 +1,187 @@
+"""Tests for the adaptive (AIMD) concurrency limiter."""
+
+import threading
+import time
+
+import pytest
+
+from openphone_python import OpenPhoneClient
+from openphone_python.exceptions import RateLimitError
+from openphone_python.testing import MockOpenPhoneServer
+from openphone_python.transport import InMemoryTransport
+from openphone_python.utils import AdaptiveConcurrencyLimiter, MetricsRegistry
+
+
+def _fill(limiter):
+    """Acquire every slot of the current limit."""
+    return [limiter.acquire() for _ in range(limiter.limit)]
+
+
+def test_limit_grows_additively_and_halves_once_per_round():
+    """Healthy full rounds add a slot; a burst of 429s halves the limit once."""
+    limiter = AdaptiveConcurrencyLimiter(
+        initial_limit=4, max_limit=16, latency_tolerance=None
+    )
+
+    for _ in range(5):
+        for permit in _fill(limiter):
+            limiter.release(permit, 200)
+    grown = limiter.limit
+    assert 5 <= grown < 8
+
+    for permit in _fill(limiter):
+        limiter.release(permit, 429)
+    assert limiter.limit in (grown // 2, (grown + 1) // 2)
+    assert limiter.decreases == 1
+
+    for _ in range(10):
+        limiter.release(limiter.acquire(), 503)
+    assert limiter.limit == 1
+    assert limiter.in_flight == 0
+
+
+def test_idle_capacity_and_latency_spikes():
+    """The limit only grows when used, and slow responses count as overload."""
+    limiter = AdaptiveConcurrencyLimiter(
+        initial_limit=4, latency_tolerance=3.0, min_samples=5
+    )
+
+    for _ in range(20):
+        limiter.release(limiter.acquire(), 200, latency=0.01)
+    assert limiter.limit == 4
+    assert limiter.snapshot()["baseline_latency"]["*"] == pytest.approx(0.01, rel=0.5)
+
+    limiter.release(limiter.acquire(), 200, latency=1.0)
+    assert limiter.limit == 2
+
+
+def test_latency_baseline_is_kept_per_endpoint():
+    """A slow endpoint is judged against itself, not against a fast one."""
+    limiter = AdaptiveConcurrencyLimiter(
+        initial_limit=4, latency_tolerance=3.0, min_samples=5
+    )
+
+    for _ in range(50):
+        limiter.release(limiter.acquire(), 200, latency=0.02, endpoint="messages/MS1")
+        limiter.release(limiter.acquire(), 200, latency=0.15, endpoint="calls")
+    assert limiter.decreases == 0
+    assert limiter.limit == 4
+    assert set(limiter.snapshot()["baseline_latency"]) == {"messages/{id}", "calls"}
+
+    limiter.release(limiter.acquire(), 200, latency=1.0, endpoint="calls")
+    assert limiter.limit == 2
+
+
+def test_acquire_blocks_at_limit_and_honours_cancellation():
+    """A full limiter blocks new requests until cancelled or a slot frees up."""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=1)
+    permit = limiter.acquire()
+    cancel = threading.Event()
+    cancel.set()
+    assert limiter.acquire(cancel) is None
+
+    limiter.release(permit, 200)
+    assert limiter.acquire(cancel) is not None
+
+
+def test_bulk_gets_adapt_to_injected_rate_limits():
+    """Against the mock server the limit grows, then backs off on 429s."""
+    limiter = AdaptiveConcurrencyLimiter(
+        initial_limit=2, max_limit=12, latency_tolerance=None
+    )
+    with MockOpenPhoneServer(dataset_size=100, latency=0.002) as server:
+        client = OpenPhoneClient(
+            api_key=server.api_key,
+            base_url=server.base_url,
+            concurrency_limiter=limiter,
+        )
+        contact_ids = list(server.dataset.contacts)
+
+        batch = client.contacts.get_many(contact_ids, concurrency=12, rate_limit=None)
+        assert not batch.errors
+        grown = limiter.limit
+        assert grown > 2
+        assert limiter.max_in_flight <= 12
+
+        server.inject(429, count=5, retry_after=0)
+        batch = client.contacts.get_many(contact_ids, concurrency=12, rate_limit=None)
+
+    assert len(batch.errors) == 5
+    assert all(isinstance(error, RateLimitError) for error in batch.errors.values())
+    assert 1 <= limiter.decreases < 5
+    assert limiter.in_flight == 0
+
+
+def test_bulk_requests_leave_reserved_capacity():
+    """Bulk requests cannot take the reserved slots; interactive ones can."""
+    limiter = AdaptiveConcurrencyLimiter(
+        initial_limit=4, min_limit=4, max_limit=4, reserve=0.5
+    )
+    cancel = threading.Event()
+    cancel.set()
+
+    bulk = [limiter.acquire(priority="bulk") for _ in range(2)]
+    assert limiter.acquire(cancel, priority="bulk") is None
+    assert limiter.acquire(cancel, priority="interactive") is not None
+    assert limiter.acquire(cancel, priority="default") is not None
+    assert limiter.in_flight == 4
+    assert all(permit.priority == "bulk" for permit in bulk)
+
+
+def test_free_slot_goes_to_highest_priority_waiter():
+    """An interactive request queued after a bulk one still goes first."""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=1, reserve=0)
+    held = limiter.acquire()
+    order = []
+
+    def worker(priority):
+        permit = limiter.acquire(priority=priority)
+        order.append(priority)
+        limiter.release(permit, 200)
+
+    threads = []
+    for priority, waiting_key in (("bulk", "bulk"), ("interactive", "interactive")):
+        thread = threading.Thread(target=worker, args=(priority,))
+        thread.start()
+        threads.append(thread)
+        while not limiter.snapshot()["waiting"][waiting_key]:
+            time.sleep(0.001)
+
+    limiter.release(held, 200)
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert order == ["interactive", "bulk"]
+
+
+def test_queue_wait_metrics_by_priority_class():
+    """Bulk operations run as bulk unless the caller picked a class."""
+    transport = InMemoryTransport()
+    for call_id in ("AC1", "AC2"):
+        transport.add("GET", f"calls/{call_id}", {"data": {"id": call_id}})
+    metrics = MetricsRegistry()
+    client = OpenPhoneClient(
+        api_key="test_key",
+        transport=transport,
+        metrics=metrics,
+        concurrency_limiter=AdaptiveConcurrencyLimiter(),
+    )
+
+    client.calls.get_many(["AC1", "AC2"], rate_limit=None)
+    with client.priority("interactive"):
+        client.calls.get("AC1")
+        client.calls.get_many(["AC2"], rate_limit=None)
+    client.calls.get("AC2")
+
+    waits = metrics.snapshot()["queue_wait"]
+    assert {priority: wait["count"] for priority, wait in waits.items()} == {
+        "bulk": 2,
+        "default": 1,
+        "interactive": 2,
+    }
+    assert (
+        'openphone_queue_wait_seconds_count{priority="bulk"} 2'
+        in metrics.to_prometheus()
+    )
+    with pytest.raises(ValueError):
+        client.priority("urgent")
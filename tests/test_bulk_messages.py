@@ -0,0 +1,123 @@
+"""Tests for bulk message sending."""
+
+import json
+import threading
+
+import pytest
+import requests
+import responses
+
+from openphone_python import OpenPhoneClient
+from openphone_python.exceptions import (
+    ApiError,
+    NotEnoughCreditsError,
+    OperationCancelledError,
+)
+
+MESSAGES_URL = "https://api.openphone.com/v1/messages"
+
+
+@pytest.fixture
+def client():
+    """Client talking to the mocked API."""
+    return OpenPhoneClient(api_key="test_key")
+
+
+@responses.activate
+def test_send_bulk_streams_results_and_errors(client):
+    """Every job yields one result, failures do not abort the batch."""
+
+    def callback(request):
+        body = json.loads(request.body)
+        if body["to"] == ["+14155550102"]:
+            return (402, {}, json.dumps({"message": "No credits"}))
+        return (202, {}, json.dumps({"data": {"id": "AC1", "to": body["to"]}}))
+
+    responses.add_callback(responses.POST, MESSAGES_URL, callback=callback)
+
+    jobs = [
+        ("+1 415 555 0100", "+14155550101", "Hello"),
+        ("+1 415 555 0100", "+14155550102", "Hello"),
+        ("+1 415 555 0100", ["(415) 555-0103"], "Hello"),
+    ]
+    results = sorted(
+        client.messages.send_bulk(jobs, rate_limit=None), key=lambda r: r.index
+    )
+
+    assert [r.ok for r in results] == [True, False, False]
+    assert results[0].value.to == ["+14155550101"]
+    assert isinstance(results[1].error, NotEnoughCreditsError)
+    assert results[2].error is not None  # not E.164 without a country code
+    sent = [json.loads(call.request.body) for call in responses.calls]
+    assert all(body["from"] == "+14155550100" for body in sent)
+
+
+@responses.activate
+def test_send_bulk_retries_rate_limited_jobs(client):
+    """A 429 is retried after Retry-After, other failures are not re-sent."""
+    responses.add(
+        responses.POST, MESSAGES_URL, status=429, headers={"Retry-After": "0"}
+    )
+    responses.add(responses.POST, MESSAGES_URL, json={"data": {"id": "AC1"}})
+
+    [result] = client.messages.send_bulk(
+        [("+14155550100", "+14155550101", "Hi")], rate_limit=None
+    )
+
+    assert result.ok
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_send_bulk_never_resends_after_network_error(client):
+    """A POST that may have reached the server is not retried."""
+    responses.add(responses.POST, MESSAGES_URL, body=requests.ConnectionError("reset"))
+
+    [result] = client.messages.send_bulk(
+        [("+14155550100", "+14155550101", "Hi")], rate_limit=None
+    )
+
+    assert isinstance(result.error, ApiError)
+    assert len(responses.calls) == 1
+
+
+def test_send_bulk_cancelled_before_start(client):
+    """Jobs are not started once the cancel event is set, but still reported."""
+    cancel = threading.Event()
+    cancel.set()
+
+    results = list(
+        client.messages.send_bulk(
+            [("+14155550100", "+14155550101", "Hi")], cancel_event=cancel
+        )
+    )
+
+    assert [r.index for r in results] == [0]
+    assert isinstance(results[0].error, OperationCancelledError)
+
+
+@responses.activate
+def test_send_bulk_cancelled_midway_reports_every_job(client):
+    """Cancelling mid-batch yields a result for every job, started or not."""
+    responses.add(responses.POST, MESSAGES_URL, json={"data": {"id": "AC1"}})
+    cancel = threading.Event()
+    jobs = [("+14155550100", "+14155550101", f"Hi {n}") for n in range(100)]
+
+    results = []
+    for result in client.messages.send_bulk(
+        jobs, max_workers=2, rate_limit=None, cancel_event=cancel
+    ):
+        results.append(result)
+        if len(results) == 3:
+            cancel.set()
+
+    assert sorted(r.index for r in results) == list(range(100))
+    skipped = [r for r in results if isinstance(r.error, OperationCancelledError)]
+    assert len(skipped) == 100 - len(responses.calls)
+    assert len(skipped) >= 90
+
+
+def test_send_bulk_validates_max_workers_eagerly(client):
+    """An invalid pool size fails at the call, not on first iteration."""
+    with pytest.raises(ValueError):
+        client.messages.send_bulk([], max_workers=0)
@@ -0,0 +1,56 @@
+"""Tests for the call enrichment pipeline."""
+
+import pytest
+import responses
+
+from openphone_python import OpenPhoneClient
+from openphone_python.models import Call
+
+BASE_URL = "https://api.openphone.com/v1"
+
+
+@responses.activate
+def test_enrich_tolerates_missing_and_processing_artefacts():
+    """Missing artefacts are None and processing ones are reported as pending."""
+    client = OpenPhoneClient(api_key="test_key")
+    responses.add(
+        responses.GET,
+        f"{BASE_URL}/calls/AC2",
+        json={"data": {"id": "AC2", "status": "completed"}},
+    )
+    for call_id in ("AC1", "AC2"):
+        responses.add(
+            responses.GET,
+            f"{BASE_URL}/call-recordings/{call_id}",
+            json={"data": {"callId": call_id, "status": "completed"}},
+        )
+        responses.add(
+            responses.GET,
+            f"{BASE_URL}/call-summaries/{call_id}",
+            json={"data": {"callId": call_id, "status": "processing"}},
+        )
+    responses.add(
+        responses.GET, f"{BASE_URL}/call-transcripts/AC1", status=404, json={}
+    )
+    responses.add(
+        responses.GET, f"{BASE_URL}/call-transcripts/AC2", status=500, json={}
+    )
+
+    enriched = list(client.calls.enrich([Call({"id": "AC1"}), "AC2"], rate_limit=None))
+
+    assert [call.id for call in enriched] == ["AC1", "AC2"]
+    first, second = enriched
+    assert first.recording.call_id == "AC1"
+    assert first.transcript is None
+    assert first.pending == ["summary"]
+    assert not first.errors
+    assert "transcript" in second.errors
+    assert not second.is_complete
+
+
+def test_enrich_rejects_unknown_artefacts_when_called():
+    """Unknown artefact names raise before the stream is iterated."""
+    client = OpenPhoneClient(api_key="test_key")
+
+    with pytest.raises(ValueError, match="Unknown artefacts"):
+        client.calls.enrich(["AC1"], artefacts=("recording", "voicemail"))
@@ -0,0 +1,75 @@
+"""Tests for the record/replay cassette transport."""
+
+import pytest
+
+from openphone_python import OpenPhoneClient
+from openphone_python.exceptions import NotFoundError
+from openphone_python.testing import (
+    CassetteMissError,
+    CassetteTransport,
+    MockOpenPhoneServer,
+)
+
+
+@pytest.fixture(scope="module")
+def recorded(tmp_path_factory):
+    """Record a cassette against the mock server; return it and what was fetched."""
+    path = str(tmp_path_factory.mktemp("cassettes") / "session.jsonl.gz")
+    with MockOpenPhoneServer(dataset_size=120) as server:
+        call_id = next(iter(server.dataset.calls))
+        with CassetteTransport(path, mode="record") as cassette:
+            client = OpenPhoneClient(
+                api_key=server.api_key, base_url=server.base_url, transport=cassette
+            )
+            contacts = [contact.id for contact in client.contacts.list(max_results=50)]
+            call = client.calls.get(call_id)
+            with pytest.raises(NotFoundError):
+                client.calls.get("AC_missing")
+            raw = client.raw_request("phone-numbers")
+        requests_sent = server.request_count
+    return path, contacts, call, raw, requests_sent
+
+
+def test_replay_serves_recorded_responses_without_network(recorded):
+    """Replaying reproduces models, errors and raw responses offline."""
+    path, contacts, call, raw, requests_sent = recorded
+    cassette = CassetteTransport(path)
+    assert len(cassette) == requests_sent
+
+    # Nothing listens on this URL; only the path takes part in matching
+    client = OpenPhoneClient(
+        api_key="unused", base_url="http://127.0.0.1:9/v1", transport=cassette
+    )
+    assert [contact.id for contact in client.contacts.list(max_results=50)] == contacts
+    assert client.calls.get(call.id).to_dict() == call.to_dict()
+    with pytest.raises(NotFoundError):
+        client.calls.get("AC_missing")
+    assert client.raw_request("phone-numbers") == raw
+    assert cassette.misses == 0
+
+
+def test_replay_reports_unrecorded_requests(recorded):
+    """Requests that were never recorded fail loudly instead of hitting the network."""
+    client = OpenPhoneClient(api_key="unused", transport=CassetteTransport(recorded[0]))
+    with pytest.raises(CassetteMissError):
+        next(iter(client.contacts.list(max_results=10)))
+
+
+def test_ignored_params_match_any_value(tmp_path):
+    """Parameters listed in ignore_params do not take part in matching."""
+    path = str(tmp_path / "contacts.jsonl")
+    with MockOpenPhoneServer(dataset_size=20) as server:
+        with CassetteTransport(path, mode="record") as cassette:
+            client = OpenPhoneClient(
+                api_key=server.api_key, base_url=server.base_url, transport=cassette
+            )
+            client.raw_request(
+                "contacts", params={"maxResults": 5, "createdAfter": "a"}
+            )
+
+    cassette = CassetteTransport(path, ignore_params=["createdAfter"])
+    client = OpenPhoneClient(api_key="unused", transport=cassette)
+    response = client.raw_request(
+        "contacts", params={"maxResults": 5, "createdAfter": "b"}
+    )
+    assert len(response["data"]) == 5
@@ -0,0 +1,105 @@
+"""Tests for the per-endpoint circuit breaker."""
+
+import pytest
+
+from openphone_python import CircuitOpenError, OpenPhoneClient
+from openphone_python.exceptions import NotFoundError, ServerError
+from openphone_python.transport import InMemoryTransport
+from openphone_python.utils import CircuitBreaker, MetricsRegistry
+from openphone_python.utils import circuit_breaker as circuit_module
+
+
+class FakeClock:
+    """Manually advanced stand-in for time.monotonic."""
+
+    def __init__(self):
+        """Start the clock at an arbitrary time."""
+        self.now = 1000.0
+
+    def __call__(self):
+        """Return the current fake time."""
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Drive the circuit breaker with a FakeClock."""
+    fake = FakeClock()
+    monkeypatch.setattr(circuit_module.time, "monotonic", fake)
+    return fake
+
+
+def test_opens_on_error_rate_then_probes_and_closes(clock):
+    """Failures past the threshold open the circuit; a good probe closes it."""
+    breaker = CircuitBreaker(failure_threshold=0.5, min_requests=4, reset_timeout=10)
+    transitions = []
+    breaker.subscribe(lambda endpoint, state: transitions.append((endpoint, state)))
+
+    for success in (True, False, True):
+        breaker.record("call-transcripts/AC1", success)
+    assert breaker.state("call-transcripts/AC2") == "closed"
+    breaker.record("call-transcripts/AC3", False)
+    assert breaker.state("call-transcripts/AC9") == "open"
+    assert not breaker.allow("call-transcripts/AC9")
+    assert breaker.allow("calls/AC9")
+    assert breaker.retry_after("call-transcripts/AC9") == pytest.approx(10)
+
+    clock.now += 10
+    assert breaker.allow("call-transcripts/AC9")
+    assert not breaker.allow("call-transcripts/AC10")
+    breaker.record("call-transcripts/AC9", True)
+
+    assert breaker.state("call-transcripts/AC9") == "closed"
+    assert transitions == [
+        ("call-transcripts/{id}", "open"),
+        ("call-transcripts/{id}", "half_open"),
+        ("call-transcripts/{id}", "closed"),
+    ]
+
+
+def test_failed_probe_reopens_and_old_failures_expire(clock):
+    """A failing probe reopens the circuit; failures outside the window expire."""
+    breaker = CircuitBreaker(min_requests=2, window=5, reset_timeout=10)
+    breaker.record("calls", False)
+    clock.now += 6
+    breaker.record("calls", False)
+    assert breaker.state("calls") == "closed"
+
+    breaker.record("calls", False)
+    assert breaker.state("calls") == "open"
+    clock.now += 10
+    assert breaker.allow("calls")
+    breaker.record("calls", False)
+    assert breaker.state("calls") == "open"
+    assert not breaker.allow("calls")
+
+
+def test_client_fails_fast_and_reports_metrics(clock):
+    """An open circuit raises CircuitOpenError without a request; metrics show it."""
+    transport = InMemoryTransport()
+    transport.add("GET", "call-transcripts/AC1", {"message": "Boom"}, 500)
+    transport.add("GET", "calls/AC1", {"message": "Call not found"}, 404)
+    metrics = MetricsRegistry()
+    client = OpenPhoneClient(
+        api_key="test_key",
+        transport=transport,
+        metrics=metrics,
+        circuit_breaker=CircuitBreaker(min_requests=3, reset_timeout=30),
+    )
+
+    for _ in range(3):
+        with pytest.raises(ServerError):
+            client.call_transcripts.get("AC1")
+    for _ in range(3):
+        with pytest.raises(NotFoundError):
+            client.calls.get("AC1")
+    with pytest.raises(CircuitOpenError) as excinfo:
+        client.call_transcripts.get("AC1")
+
+    assert excinfo.value.retry_after == pytest.approx(30)
+    assert len(transport.requests) == 6
+    snapshot = metrics.snapshot()
+    assert snapshot["circuit_states"] == {"call-transcripts/{id}": "open"}
+    assert snapshot["circuit_rejections"] == {"call-transcripts/{id}": 1}
+    exposition = metrics.to_prometheus()
+    assert 'openphone_circuit_state{endpoint="call-transcripts/{id}"} 2' in exposition
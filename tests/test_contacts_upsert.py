@@ -0,0 +1,106 @@
+"""Tests for bulk contact upserts."""
+
+import json
+import threading
+
+import pytest
+import responses
+
+from openphone_python import OpenPhoneClient
+from openphone_python.exceptions import OperationCancelledError, ValidationError
+
+CONTACTS_URL = "https://api.openphone.com/v1/contacts"
+
+
+@pytest.fixture
+def client():
+    """Client talking to the mocked API."""
+    return OpenPhoneClient(api_key="test_key")
+
+
+@responses.activate
+def test_upsert_many_creates_updates_and_skips(client):
+    """Only missing or changed contacts are written."""
+    responses.add(
+        responses.GET,
+        CONTACTS_URL,
+        json={
+            "data": [
+                {
+                    "id": "CT1",
+                    "externalId": "crm-1",
+                    "defaultFields": {"firstName": "Ada", "lastName": "Lovelace"},
+                },
+                {
+                    "id": "CT2",
+                    "externalId": "crm-2",
+                    "defaultFields": {"firstName": "Alan", "company": "Old"},
+                },
+            ]
+        },
+    )
+    responses.add(responses.POST, CONTACTS_URL, json={"data": {"id": "CT3"}})
+    responses.add(responses.PATCH, f"{CONTACTS_URL}/CT2", json={"data": {"id": "CT2"}})
+
+    records = [
+        {"externalId": "crm-1", "defaultFields": {"firstName": "Ada"}},
+        {
+            "externalId": "crm-2",
+            "defaultFields": {"firstName": "Alan", "company": "New"},
+        },
+        {"externalId": "crm-3", "defaultFields": {"firstName": "Grace"}},
+        {"defaultFields": {"firstName": "No ID"}},
+    ]
+    results = list(client.contacts.upsert_many(records, rate_limit=None))
+
+    assert [r.action for r in results] == ["unchanged", "updated", "created", "failed"]
+    assert isinstance(results[3].error, ValidationError)
+
+    patch = next(c for c in responses.calls if c.request.method == "PATCH")
+    assert json.loads(patch.request.body) == {"defaultFields": {"company": "New"}}
+    lookups = [c for c in responses.calls if c.request.method == "GET"]
+    assert len(lookups) == 1
+
+
+def test_upsert_many_rejects_oversized_lookup_batches(client):
+    """Lookup batches are bounded by the contacts page size."""
+    with pytest.raises(ValidationError):
+        client.contacts.upsert_many([], lookup_batch_size=51)
+
+
+def test_upsert_many_reports_cancelled_records(client):
+    """Every record gets a result when the operation is cancelled up front."""
+    cancel = threading.Event()
+    cancel.set()
+
+    [result] = client.contacts.upsert_many([{"externalId": "a"}], cancel_event=cancel)
+
+    assert result.action == "failed"
+    assert isinstance(result.error, OperationCancelledError)
+
+
+@responses.activate
+def test_upsert_many_skips_writes_after_cancelled_lookups(client):
+    """Records whose lookups never ran are not planned as creates."""
+    cancel = threading.Event()
+
+    def lookup(request):
+        cancel.set()
+        return (200, {}, json.dumps({"data": []}))
+
+    responses.add_callback(responses.GET, CONTACTS_URL, callback=lookup)
+    records = [{"externalId": f"crm-{n}"} for n in range(5)]
+
+    results = list(
+        client.contacts.upsert_many(
+            records,
+            max_workers=1,
+            lookup_batch_size=1,
+            rate_limit=None,
+            cancel_event=cancel,
+        )
+    )
+
+    assert [r.index for r in results] == list(range(5))
+    assert all(isinstance(r.error, OperationCancelledError) for r in results)
+    assert all(c.request.method == "GET" for c in responses.calls)
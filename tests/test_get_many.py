@@ -0,0 +1,73 @@
+"""Tests for concurrent batch gets."""
+
+import pytest
+import responses
+
+from openphone_python import OpenPhoneClient
+from openphone_python.exceptions import ForbiddenError, NotFoundError
+
+BASE_URL = "https://api.openphone.com/v1"
+
+
+@responses.activate
+def test_get_many_dedupes_preserves_order_and_collects_errors():
+    """Duplicates are fetched once and a 404 does not abort the batch."""
+    client = OpenPhoneClient(api_key="test_key")
+    for call_id in ("AC1", "AC3"):
+        responses.add(
+            responses.GET, f"{BASE_URL}/calls/{call_id}", json={"data": {"id": call_id}}
+        )
+    responses.add(
+        responses.GET,
+        f"{BASE_URL}/calls/AC2",
+        status=404,
+        json={"message": "Call not found"},
+    )
+
+    batch = client.calls.get_many(["AC3", "AC2", "AC1", "AC3"], rate_limit=None)
+
+    assert [result.item for result in batch] == ["AC3", "AC2", "AC1"]
+    assert list(batch.results) == ["AC3", "AC1"]
+    assert batch.results["AC1"].id == "AC1"
+    assert isinstance(batch.errors["AC2"], NotFoundError)
+    assert len(responses.calls) == 3
+
+
+@pytest.mark.parametrize(
+    "resource, path, id_field, attribute",
+    [
+        ("messages", "messages", "id", "id"),
+        ("contacts", "contacts", "id", "id"),
+        ("call_summaries", "call-summaries", "callId", "call_id"),
+        ("call_transcripts", "call-transcripts", "callId", "call_id"),
+    ],
+)
+@responses.activate
+def test_get_many_records_partial_failures(resource, path, id_field, attribute):
+    """Every get_many() keeps successes when other IDs are missing or failing."""
+    client = OpenPhoneClient(api_key="test_key")
+    responses.add(
+        responses.GET, f"{BASE_URL}/{path}/ID1", json={"data": {id_field: "ID1"}}
+    )
+    responses.add(
+        responses.GET,
+        f"{BASE_URL}/{path}/ID2",
+        status=404,
+        json={"message": "Not found"},
+    )
+    responses.add(
+        responses.GET,
+        f"{BASE_URL}/{path}/ID3",
+        status=403,
+        json={"message": "Forbidden"},
+    )
+
+    batch = getattr(client, resource).get_many(["ID1", "ID2", "ID3"], rate_limit=None)
+
+    assert [result.item for result in batch] == ["ID1", "ID2", "ID3"]
+    assert list(batch.results) == ["ID1"]
+    assert (
+        getattr(batch.results["ID1"], "id" if id_field == "id" else "call_id") == "ID1"
+    )
+    assert isinstance(batch.errors["ID2"], NotFoundError)
+    assert isinstance(batch.errors["ID3"], ForbiddenError)
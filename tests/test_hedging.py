@@ -0,0 +1,97 @@
+"""Tests for hedged GET requests."""
+
+import itertools
+import threading
+import time
+
+import pytest
+
+from openphone_python import OpenPhoneClient
+from openphone_python.transport import InMemoryTransport, json_response
+from openphone_python.utils import HedgingPolicy, MetricsRegistry
+
+
+def _client(delays, policy, metrics=None):
+    """Client whose ``calls/{id}`` responses take the given delays in turn."""
+    transport = InMemoryTransport()
+    delays = iter(delays)
+    lock = threading.Lock()
+
+    def handler(request):
+        with lock:
+            delay = next(delays, 0.0)
+        time.sleep(delay)
+        return json_response({"data": {"id": "AC1", "delay": delay}})
+
+    transport.add("GET", "calls/AC1", handler=handler)
+    transport.add("POST", "messages", {"data": {"id": "MS1"}})
+    client = OpenPhoneClient(
+        api_key="test_key", transport=transport, metrics=metrics, hedging=policy
+    )
+    return client, transport
+
+
+def test_slow_get_is_hedged_and_first_response_wins():
+    """Past the latency percentile a second request is sent and wins."""
+    policy = HedgingPolicy(percentile=0.9, max_hedge_rate=0.5, min_samples=10)
+    metrics = MetricsRegistry()
+    client, transport = _client([0.0] * 10 + [1.0, 0.0], policy, metrics)
+
+    for _ in range(10):
+        client.calls.get("AC1")
+    assert policy.delay("calls/AC9") == pytest.approx(policy.min_delay, abs=0.01)
+
+    started = time.perf_counter()
+    call = client.calls.get("AC1")
+    assert time.perf_counter() - started < 0.5
+    assert call.id == "AC1"
+    assert len(transport.requests) == 12
+    assert policy.snapshot()["hedge_wins"] == 1
+    assert metrics.snapshot()["hedges"] == {"calls/{id}": 1}
+    assert metrics.snapshot()["hedge_wins"] == {"calls/{id}": 1}
+
+
+def test_losing_request_is_recorded():
+    """The discarded request still counts once it completes."""
+    policy = HedgingPolicy(percentile=0.9, max_hedge_rate=0.5, min_samples=10)
+    metrics = MetricsRegistry()
+    client, transport = _client([0.0] * 10 + [0.2, 0.0], policy, metrics)
+
+    for _ in range(11):
+        client.calls.get("AC1")
+
+    def requests_total():
+        return sum(metrics.snapshot()["requests"]["GET calls/{id}"].values())
+
+    deadline = time.monotonic() + 5
+    while requests_total() < 12 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert requests_total() == len(transport.requests) == 12
+
+
+def test_hedge_rate_is_capped():
+    """Slow responses beyond the budget are waited for instead of hedged."""
+    policy = HedgingPolicy(max_hedge_rate=0.1, burst=1.0, min_samples=5)
+    client, transport = _client(
+        itertools.chain([0.0] * 5, itertools.repeat(0.02)), policy
+    )
+
+    for _ in range(35):
+        client.calls.get("AC1")
+
+    assert 1 <= policy.hedges <= 4
+    assert policy.hedge_rate <= 0.1
+    assert len(transport.requests) == 35 + policy.hedges
+
+
+def test_only_gets_are_hedged():
+    """Non-idempotent requests never go through the hedging policy."""
+    policy = HedgingPolicy(min_samples=1)
+    client, transport = _client([], policy)
+
+    client.messages.send(
+        content="Hi", from_number="+14155550100", to_numbers=["+14155550101"]
+    )
+
+    assert policy.requests == 0
+    assert len(transport.requests) == 1
@@ -0,0 +1,149 @@
+"""Tests for request lifecycle hooks and tracing spans."""
+
+import pytest
+import requests
+
+from openphone_python import OpenPhoneClient
+from openphone_python.exceptions import NotFoundError
+from openphone_python.transport import InMemoryTransport, Transport, json_response
+from openphone_python.utils.tracing import InMemorySpanExporter, Tracer
+
+
+class FlakyTransport(Transport):
+    """Fails the first request with a connection error, then delegates."""
+
+    def __init__(self, inner, failures=1):
+        """Wrap a transport, failing its first ``failures`` requests."""
+        self.inner = inner
+        self.failures = failures
+
+    def send(self, request):
+        """Fail while failures remain, then delegate."""
+        if self.failures:
+            self.failures -= 1
+            raise requests.ConnectionError("connection reset")
+        return self.inner.send(request)
+
+
+@pytest.fixture
+def transport():
+    """In-memory transport serving two calls and a contact listing."""
+    transport = InMemoryTransport()
+    transport.add("GET", "calls/AC1", {"data": {"id": "AC1"}})
+    transport.add("GET", "calls/AC2", {"data": {"id": "AC2"}})
+
+    def contacts(request):
+        if request.params.get("pageToken"):
+            return json_response({"data": [{"id": "CT2"}]})
+        return json_response({"data": [{"id": "CT1"}], "nextPageToken": "p2"})
+
+    transport.add("GET", "contacts", handler=contacts)
+    return transport
+
+
+def test_hooks_see_every_stage(transport, monkeypatch):
+    """Callbacks fire for sends, responses, retries and final errors."""
+    monkeypatch.setattr("time.sleep", lambda seconds: None)
+    client = OpenPhoneClient(api_key="test_key", transport=FlakyTransport(transport))
+    seen = []
+    for event in ("before_send", "after_response", "on_retry", "on_error"):
+        client.on(event, lambda e: seen.append((e.name, e.endpoint, e.attempt)))
+    client.hooks.register("after_response", lambda e: 1 / 0)  # must not break requests
+
+    client.calls.get("AC1")
+    with pytest.raises(NotFoundError):
+        client.calls.get("AC404")
+
+    assert seen == [
+        ("before_send", "calls/AC1", 1),
+        ("on_retry", "calls/AC1", 1),
+        ("before_send", "calls/AC1", 2),
+        ("after_response", "calls/AC1", 2),
+        ("before_send", "calls/AC404", 1),
+        ("after_response", "calls/AC404", 1),
+        ("on_error", "calls/AC404", 1),
+    ]
+
+
+def test_raw_request_failures_reach_on_error(transport):
+    """Raw requests report transport errors and API errors to on_error."""
+    client = OpenPhoneClient(api_key="test_key", transport=FlakyTransport(transport))
+    errors = []
+    client.on("on_error", lambda e: errors.append(e.error))
+    with pytest.raises(requests.ConnectionError):
+        client.raw_request("messages", "POST", data={"content": "hi"})
+    with pytest.raises(NotFoundError):
+        client.raw_request("calls/AC404")
+    assert [type(error) for error in errors] == [
+        requests.ConnectionError,
+        NotFoundError,
+    ]
+
+
+def test_spans_nest_operations_attempts_and_pages(transport, monkeypatch):
+    """API calls, attempts, listings and bulk operations nest as spans."""
+    monkeypatch.setattr("time.sleep", lambda seconds: None)
+    exporter = InMemorySpanExporter()
+    client = OpenPhoneClient(
+        api_key="test_key", transport=FlakyTransport(transport), tracer=Tracer(exporter)
+    )
+
+    client.calls.get("AC1")
+    assert len(list(client.contacts.list())) == 2
+    client.calls.get_many(["AC1", "AC2"], rate_limit=None)
+
+    get, listing, get_many = [span for span in exporter.spans if span.parent_id is None]
+    assert get.name == "openphone GET calls/{id}"
+    attempts = exporter.children(get)
+    assert [a.attributes["http.attempt"] for a in attempts] == [1, 2]
+    assert not attempts[0].ok and attempts[1].attributes["http.status_code"] == 200
+
+    # Every page of a listing belongs to one trace under the listing span
+    assert listing.name == "openphone contacts.list"
+    assert listing.attributes["openphone.pages"] == 2
+    page1, page2 = exporter.children(listing)
+    assert {page1.trace_id, page2.trace_id} == {listing.trace_id}
+    assert page1.attributes == {"openphone.page": 1, "openphone.items": 1}
+    assert exporter.children(page2)[0].name == "openphone GET contacts"
+
+    # Requests made on worker threads still belong to the operation
+    assert get_many.name == "openphone calls.get_many"
+    assert len(exporter.children(get_many)) == 2
+
+    # A listing stopped early still ends its span
+    exporter.clear()
+    assert len(client.contacts.list().to_list(limit=1)) == 1
+    (listing,) = [span for span in exporter.spans if span.parent_id is None]
+    assert listing.name == "openphone contacts.list"
+    assert listing.attributes["openphone.pages"] == 1
+
+
+def test_breaking_out_of_a_listing_ends_its_span(transport):
+    """A for loop that stops before the last page still ends the listing span."""
+    exporter = InMemorySpanExporter()
+    client = OpenPhoneClient(
+        api_key="test_key", transport=transport, tracer=Tracer(exporter)
+    )
+
+    for contact in client.contacts.list():
+        break
+
+    (listing,) = [span for span in exporter.spans if span.parent_id is None]
+    assert listing.name == "openphone contacts.list"
+    assert listing.attributes["openphone.pages"] == 1
+
+
+def test_default_exporter_is_bounded(monkeypatch):
+    """A Tracer without an exporter keeps only the most recent spans."""
+    monkeypatch.setattr("openphone_python.utils.tracing.DEFAULT_MAX_SPANS", 3)
+    tracer = Tracer()
+    for index in range(5):
+        with tracer.span(f"span {index}"):
+            pass
+
+    assert tracer.exporter.max_spans == 3
+    assert [span.name for span in tracer.exporter.spans] == [
+        "span 2",
+        "span 3",
+        "span 4",
+    ]
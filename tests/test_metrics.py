@@ -0,0 +1,89 @@
+"""Tests for the request metrics registry."""
+
+import pytest
+
+from openphone_python import OpenPhoneClient
+from openphone_python.exceptions import NotFoundError, RateLimitError
+from openphone_python.transport import InMemoryTransport, json_response
+from openphone_python.utils.metrics import MetricsRegistry, endpoint_template
+
+
+def make_client():
+    """Client with a metrics registry over an in-memory API."""
+    transport = InMemoryTransport()
+    transport.add("GET", "calls/AC1", {"data": {"id": "AC1"}})
+    transport.add("GET", "calls/AC2", {"data": {"id": "AC2"}})
+    transport.add(
+        "GET", "calls/AC429", {"message": "Slow down"}, 429, {"Retry-After": "7"}
+    )
+
+    def contacts(request):
+        if request.params.get("pageToken"):
+            return json_response({"data": [{"id": "CT3"}]})
+        return json_response(
+            {"data": [{"id": "CT1"}, {"id": "CT2"}], "nextPageToken": "p2"}
+        )
+
+    transport.add("GET", "contacts", handler=contacts)
+    metrics = MetricsRegistry()
+    return (
+        OpenPhoneClient(api_key="test_key", transport=transport, metrics=metrics),
+        metrics,
+    )
+
+
+def test_endpoint_template_hides_ids():
+    """Endpoint paths have their IDs replaced by a placeholder."""
+    assert endpoint_template("/calls/AC123") == "calls/{id}"
+    assert endpoint_template("call-recordings/AC9") == "call-recordings/{id}"
+    assert endpoint_template("webhooks/messages") == "webhooks/messages"
+
+
+def test_requests_pages_and_rate_limits_are_recorded():
+    """Resources, pagination and raw requests all feed the registry."""
+    client, metrics = make_client()
+
+    client.calls.get("AC1")
+    client.calls.get("AC2")
+    with pytest.raises(NotFoundError):
+        client.calls.get("AC404")
+    with pytest.raises(RateLimitError):
+        client.calls.get("AC429")
+    assert len(list(client.contacts.list())) == 3
+    client.raw_request("calls/AC1")
+
+    snapshot = metrics.snapshot()
+    assert snapshot["requests"]["GET calls/{id}"] == {"200": 3, "404": 1, "429": 1}
+    assert snapshot["latency"]["GET calls/{id}"]["count"] == 5
+    assert snapshot["rate_limited"] == {"calls/{id}": 1}
+    assert snapshot["retry_after"]["calls/{id}"]["sum"] == 7.0
+    assert snapshot["pages"] == {"contacts": 2}
+    assert snapshot["page_items"] == {"contacts": 3}
+    assert snapshot["bytes_received"]["GET contacts"] > 0
+
+
+def test_prometheus_exposition():
+    """Histograms are cumulative and every family is typed."""
+    client, metrics = make_client()
+    client.calls.get("AC1")
+
+    text = metrics.to_prometheus()
+    assert "# TYPE openphone_request_duration_seconds histogram" in text
+    assert (
+        'openphone_requests_total{method="GET",endpoint="calls/{id}",status="200"} 1'
+        in text
+    )
+    assert (
+        "openphone_request_duration_seconds_bucket"
+        '{method="GET",endpoint="calls/{id}",le="+Inf"} 1' in text
+    )
+    assert text.endswith("\n")
+
+
+def test_clients_without_metrics_record_nothing():
+    """Metrics are optional and off by default."""
+    transport = InMemoryTransport()
+    transport.add("GET", "calls/AC1", {"data": {"id": "AC1"}})
+    client = OpenPhoneClient(api_key="test_key", transport=transport)
+    assert client.metrics is None
+    assert client.calls.get("AC1").id == "AC1"
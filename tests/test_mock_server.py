@@ -0,0 +1,132 @@
+"""Tests for the mock OpenPhone API server, exercising the SDK's HTTP path."""
+
+import json
+import threading
+
+import pytest
+
+from openphone_python import OpenPhoneClient
+from openphone_python.exceptions import (
+    AuthenticationError,
+    NotFoundError,
+    RateLimitError,
+)
+from openphone_python.testing import MockOpenPhoneServer
+
+
+@pytest.fixture(scope="module")
+def server():
+    """Mock server shared by the tests of this module."""
+    with MockOpenPhoneServer(dataset_size=250) as server:
+        yield server
+
+
+@pytest.fixture
+def client(server):
+    """Client talking to the mock server."""
+    return OpenPhoneClient(api_key=server.api_key, base_url=server.base_url)
+
+
+def test_pagination_walks_every_page(server, client):
+    """Listing follows nextPageToken across pages of the requested size."""
+    server.reset_stats()
+    contacts = list(client.contacts.list(max_results=50))
+
+    assert len(contacts) == 250
+    assert len({contact.id for contact in contacts}) == 250
+    assert server.requests["GET /v1/contacts"] == 5
+
+
+def test_conversations_messages_and_artefacts(server, client):
+    """Filtered list endpoints and call artefacts return consistent data."""
+    phone_number = client.phone_numbers.get_all()[0]
+    conversation = next(
+        iter(client.conversations.list(phone_numbers=[phone_number.number]))
+    )
+    messages = list(
+        client.messages.list(
+            phone_number.id, conversation.participants, max_results=100
+        )
+    )
+    assert messages and all(
+        message.phone_number_id == phone_number.id for message in messages
+    )
+
+    call = next(
+        iter(client.calls.list(phone_number.id, conversation.participants)), None
+    )
+    if call is not None:
+        assert client.call_summaries.get(call.id).status == "completed"
+
+
+def test_injected_failures_and_auth(server, client):
+    """Injected 429s carry Retry-After; unknown IDs and bad keys are rejected."""
+    server.inject(429, retry_after=3)
+    with pytest.raises(RateLimitError) as excinfo:
+        client.calls.get("CA00000000")
+    assert excinfo.value.retry_after == 3
+    assert client.calls.get("CA00000000").id == "CA00000000"
+
+    with pytest.raises(NotFoundError):
+        client.messages.get("missing")
+    with pytest.raises(AuthenticationError):
+        OpenPhoneClient(api_key="wrong", base_url=server.base_url).calls.get(
+            "CA00000000"
+        )
+
+
+def test_webhook_apply_round_trip(server, client):
+    """Webhooks created through apply() are listed and left alone next time."""
+    desired = [{"url": "https://example.com/hook", "events": ["message.received"]}]
+
+    assert len(client.webhooks.apply(desired).created) == 1
+    assert not client.webhooks.apply(desired).has_changes
+
+
+def test_lists_are_consistent_while_objects_are_created():
+    """List handlers snapshot the dataset while other threads insert."""
+    mock = MockOpenPhoneServer(dataset_size=50, api_key=None)
+    body = json.dumps({"defaultFields": {"firstName": "Ada"}}).encode()
+    stop = threading.Event()
+
+    def create():
+        while not stop.is_set():
+            mock.handle("POST", "/v1/contacts", {}, body)
+
+    writers = [threading.Thread(target=create) for _ in range(2)]
+    for writer in writers:
+        writer.start()
+    try:
+        statuses = [
+            mock.handle("GET", "/v1/contacts?maxResults=50", {}, b"")[0]
+            for _ in range(200)
+        ]
+    finally:
+        stop.set()
+        for writer in writers:
+            writer.join()
+    assert set(statuses) == {200}
+
+
+def test_sent_messages_are_listed(server, client):
+    """A sent message is stored with its phone number and listed afterwards."""
+    phone_number = client.phone_numbers.get_all()[0]
+    sent = client.messages.send("Hello", phone_number.number, ["+14155550199"])
+
+    messages = list(client.messages.list(phone_number.id, ["+14155550199"]))
+
+    assert [message.id for message in messages] == [sent.id]
+    assert messages[0].phone_number_id == phone_number.id
+
+
+def test_handler_bugs_answer_500():
+    """An unexpected error in a route handler is returned as a 500 body."""
+    mock = MockOpenPhoneServer(dataset_size=5, api_key=None)
+    mock.dataset.messages["AC-broken"] = {"id": "AC-broken"}
+
+    status, _, payload = mock.handle(
+        "GET", "/v1/messages?phoneNumberId=PN1&participants=%2B1", {}, b""
+    )
+
+    assert status == 500
+    assert "KeyError" in payload["message"]
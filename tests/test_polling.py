@@ -0,0 +1,111 @@
+"""Tests for the artefact waiter."""
+
+import threading
+
+import pytest
+
+from openphone_python import OpenPhoneClient
+from openphone_python.exceptions import ForbiddenError, NotFoundError
+from openphone_python.models import CallSummary
+from openphone_python.utils.polling import ArtefactWaiter
+
+
+def test_waiter_resolves_completed_failed_and_timed_out_items():
+    """Each ID resolves independently once it stops processing."""
+    polls = {"AC1": 0, "AC2": 0, "AC3": 0, "AC4": 0}
+
+    def fetch(call_id):
+        polls[call_id] += 1
+        if call_id == "AC1" and polls[call_id] < 3:
+            raise NotFoundError("not ready yet")
+        if call_id == "AC2":
+            raise ForbiddenError("forbidden")
+        if call_id == "AC3":
+            return CallSummary({"callId": call_id, "status": "processing"})
+        return CallSummary({"callId": call_id, "status": "completed"})
+
+    resolved = []
+    with ArtefactWaiter(
+        fetch, initial_delay=0.001, max_delay=0.01, timeout=0.2, rate_limit=None
+    ) as waiter:
+        futures = waiter.submit_many(polls, callback=resolved.append)
+        assert waiter.submit("AC1") is futures["AC1"]
+
+        assert futures["AC1"].result(timeout=5).status == "completed"
+        assert futures["AC4"].result(timeout=5).call_id == "AC4"
+        with pytest.raises(ForbiddenError):
+            futures["AC2"].result(timeout=5)
+        with pytest.raises(TimeoutError):
+            futures["AC3"].result(timeout=5)
+
+    assert polls["AC1"] == 3
+    assert polls["AC3"] > 1
+    assert len(resolved) == 4
+
+
+def test_close_without_cancelling_waits_for_pending_items():
+    """close(cancel_pending=False) lets pending IDs resolve instead of hanging."""
+    polls = []
+
+    def fetch(call_id):
+        polls.append(call_id)
+        status = "completed" if len(polls) >= 3 else "processing"
+        return CallSummary({"callId": call_id, "status": status})
+
+    waiter = ArtefactWaiter(
+        fetch, initial_delay=0.001, max_delay=0.005, rate_limit=None
+    )
+    future = waiter.submit("AC1")
+    waiter.close(cancel_pending=False)
+
+    assert future.result(timeout=0).status == "completed"
+    with pytest.raises(RuntimeError):
+        waiter.submit("AC2")
+
+
+def test_zero_timeout_gives_up_after_first_poll():
+    """timeout=0 is a deadline, not "wait forever"."""
+    waiter = ArtefactWaiter(
+        lambda call_id: CallSummary({"callId": call_id, "status": "processing"}),
+        initial_delay=0.001,
+        timeout=0,
+        rate_limit=None,
+    )
+    with waiter:
+        with pytest.raises(TimeoutError):
+            waiter.submit("AC1").result(timeout=5)
+
+
+def test_resource_waiters_share_client_rate_limit_state():
+    """Waiters built by resources pace polls with client.rate_limit."""
+    client = OpenPhoneClient(api_key="test_key")
+    waiter = client.call_summaries.waiter()
+    try:
+        assert waiter._rate_limiter.state is client.rate_limit
+    finally:
+        waiter.close()
+
+
+def test_rounds_share_one_pool_until_closed():
+    """Polling rounds reuse the waiter's threads, which stop on close()."""
+    threads = set()
+
+    def fetch(call_id):
+        threads.add(threading.current_thread())
+        status = "completed" if len(threads) > 50 else "processing"
+        return CallSummary({"callId": call_id, "status": status})
+
+    waiter = ArtefactWaiter(
+        fetch,
+        initial_delay=0.001,
+        max_delay=0.001,
+        timeout=0.2,
+        max_workers=2,
+        rate_limit=None,
+    )
+    with pytest.raises(TimeoutError):
+        waiter.submit("AC1").result(timeout=5)
+    waiter.close()
+
+    assert 1 <= len(threads) <= 2
+    assert not any(thread.is_alive() for thread in threads)
@@ -0,0 +1,86 @@
+"""Tests for rate-limit state tracking."""
+
+import pytest
+
+from openphone_python import OpenPhoneClient
+from openphone_python.exceptions import RateLimitError
+from openphone_python.transport import InMemoryTransport
+from openphone_python.utils.concurrency import RateLimiter
+from openphone_python.utils.rate_limit import RateLimitState, parse_retry_after
+
+NOW = 1_900_000_000.0
+
+
+def test_parse_retry_after_seconds_and_dates():
+    """Retry-After is parsed as seconds or an HTTP date."""
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after("Thu, 01 Jan 2032 00:00:10 GMT", now=1956528000.0) == 10.0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+def test_headers_are_tracked_and_pacing_slows_down_near_the_limit():
+    """Rate-limit headers are tracked and pacing grows near the limit."""
+    state = RateLimitState(low_watermark=0.2)
+    headers = {
+        "X-RateLimit-Limit": "10",
+        "X-RateLimit-Remaining": "5",
+        "X-RateLimit-Reset": "1",
+    }
+    state.update(200, headers, now=NOW)
+    assert (state.limit, state.reset_at) == (10, NOW + 1)
+    assert state.suggested_delay(now=NOW) == 0.0
+
+    state.update(200, {**headers, "X-RateLimit-Remaining": "1"}, now=NOW)
+    assert state.suggested_delay(now=NOW) == pytest.approx(0.5)
+
+    # An expired window no longer slows anything down
+    assert state.suggested_delay(now=NOW + 2) == 0.0
+
+
+def test_429_blocks_until_retry_after_and_counts_towards_the_rate():
+    """A 429 delays requests until Retry-After and raises the 429 rate."""
+    state = RateLimitState()
+    state.update(200, {}, now=NOW)
+    state.update(429, {"Retry-After": "4"}, now=NOW)
+    assert state.suggested_delay(now=NOW + 1) == pytest.approx(3.0)
+    assert state.last_retry_after == 4.0
+    assert state.recent_429_rate(now=NOW) == 0.5
+    assert state.recent_429_rate(now=NOW + 120) == 0.0
+
+
+def test_client_updates_state_from_every_response():
+    """Every client response updates client.rate_limit."""
+    transport = InMemoryTransport()
+    transport.add(
+        "GET",
+        "calls/AC1",
+        {"data": {"id": "AC1"}},
+        headers={
+            "X-RateLimit-Limit": "10",
+            "X-RateLimit-Remaining": "9",
+            "X-RateLimit-Reset": "1",
+        },
+    )
+    transport.add(
+        "GET", "calls/AC2", {"message": "Too many"}, 429, {"Retry-After": "2"}
+    )
+    client = OpenPhoneClient(api_key="test_key", transport=transport)
+
+    client.calls.get("AC1")
+    assert client.rate_limit.remaining == 9
+    with pytest.raises(RateLimitError):
+        client.raw_request("calls/AC2")
+    snapshot = client.rate_limit.snapshot()
+    assert snapshot["blocked_until"] is not None
+    assert 0 < snapshot["suggested_delay"] <= 2
+
+
+def test_rate_limiter_waits_out_the_state(monkeypatch):
+    """A RateLimiter sharing the state waits out a 429."""
+    sleeps = []
+    monkeypatch.setattr("time.sleep", sleeps.append)
+    state = RateLimitState()
+    state.update(429, {"Retry-After": "5"})
+    assert RateLimiter(100, state=state).acquire()
+    assert sleeps and 4 < sleeps[0] <= 5
@@ -0,0 +1,73 @@
+"""Tests for guarded request logging and slow request logging."""
+
+import logging
+
+from openphone_python import OpenPhoneClient
+from openphone_python.transport import InMemoryTransport, TransportResponse
+from openphone_python.utils.request_log import response_preview
+
+
+class CountingResponse(TransportResponse):
+    """Response counting full-body decodes."""
+
+    decodes = 0
+
+    @property
+    def text(self):
+        """Decode the body, counting how often that happens."""
+        CountingResponse.decodes += 1
+        return super().text
+
+
+def make_transport():
+    """Transport whose responses count body decodes."""
+    transport = InMemoryTransport()
+    body = b'{"data": {"id": "AC1", "transcript": "' + b"x" * 5000 + b'"}}'
+    transport.add(
+        "GET",
+        "calls/AC1",
+        handler=lambda request: CountingResponse(200, {}, body),
+    )
+    return transport
+
+
+def test_response_preview_decodes_only_the_prefix():
+    """Previews decode at most the first 500 bytes."""
+    assert response_preview(b"abc") == "abc"
+    assert response_preview(b"x" * 600) == "x" * 500 + "..."
+
+
+def test_no_body_decoding_when_debug_is_off(caplog):
+    """Response bodies are not decoded unless debug logging is on."""
+    caplog.set_level(logging.INFO, logger="openphone_python")
+    CountingResponse.decodes = 0
+    client = OpenPhoneClient(api_key="test_key", transport=make_transport())
+    client.calls.get("AC1")
+    client.raw_request("calls/AC1")
+    assert CountingResponse.decodes == 0
+    assert not caplog.records
+
+
+def test_slow_requests_are_logged_with_context(caplog):
+    """Slow requests are logged with context, subject to sampling."""
+    caplog.set_level(logging.WARNING, logger="openphone_python")
+    client = OpenPhoneClient(
+        api_key="test_key", transport=make_transport(), slow_request_threshold=0.0
+    )
+    client.calls.get("AC1")
+
+    (record,) = caplog.records
+    assert "Slow OpenPhone API request: GET calls/AC1" in record.getMessage()
+    assert record.openphone["attempt"] == 1
+    assert record.openphone["bytes_received"] > 5000
+
+    # A zero sample rate keeps slow requests out of the log
+    caplog.clear()
+    quiet = OpenPhoneClient(
+        api_key="test_key",
+        transport=make_transport(),
+        slow_request_threshold=0.0,
+        slow_request_sample_rate=0.0,
+    )
+    quiet.calls.get("AC1")
+    assert not caplog.records
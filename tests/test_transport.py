@@ -0,0 +1,72 @@
+"""Tests for pluggable HTTP transports."""
+
+import importlib.util
+
+import pytest
+
+from openphone_python import OpenPhoneClient
+from openphone_python.exceptions import NotFoundError, RateLimitError
+from openphone_python.transport import (
+    InMemoryTransport,
+    RecordingTransport,
+    create_transport,
+    json_response,
+)
+
+
+def test_in_memory_transport_serves_resources_and_raw_requests():
+    """Resources and raw requests go through the client's transport."""
+    transport = InMemoryTransport()
+    transport.add("GET", "calls/AC1", {"data": {"id": "AC1", "status": "completed"}})
+    transport.add(
+        "GET",
+        "contacts",
+        handler=lambda request: json_response(
+            {"data": [{"id": "CT1"}], "echo": request.params}
+        ),
+    )
+    client = OpenPhoneClient(api_key="test_key", transport=transport)
+
+    assert client.calls.get("AC1").status == "completed"
+    assert client.raw_request("contacts", params={"maxResults": 1})["echo"] == {
+        "maxResults": 1
+    }
+    with pytest.raises(NotFoundError):
+        client.messages.get("MS404")
+
+    first = transport.requests[0]
+    assert first.url == "https://api.openphone.com/v1/calls/AC1"
+    assert first.headers["Authorization"] == "test_key"
+
+
+def test_recording_transport_keeps_exchanges():
+    """Exchanges are recorded, including error responses."""
+    inner = InMemoryTransport()
+    inner.add("GET", "calls/AC1", {"message": "Slow down"}, 429, {"Retry-After": "3"})
+    transport = RecordingTransport(inner, max_exchanges=10)
+    client = OpenPhoneClient(api_key="test_key", transport=transport)
+
+    with pytest.raises(RateLimitError):
+        client.calls.get("AC1")
+
+    ((request, response, elapsed),) = transport.exchanges
+    assert request.method == "GET"
+    assert response.headers["retry-after"] == "3"
+    assert elapsed >= 0
+
+
+def test_transports_can_be_chosen_by_name():
+    """Deployments can pick a transport from configuration."""
+    client = OpenPhoneClient(api_key="test_key", transport="memory")
+    assert isinstance(client.transport, InMemoryTransport)
+    with pytest.raises(ValueError):
+        create_transport("carrier-pigeon")
+
+
+@pytest.mark.skipif(
+    importlib.util.find_spec("httpx") is not None, reason="httpx installed"
+)
+def test_http2_transport_requires_httpx():
+    """The HTTP/2 transport explains how to install its optional dependency."""
+    with pytest.raises(ImportError, match="http2"):
+        create_transport("http2")
@@ -0,0 +1,306 @@
+"""Tests for the WSGI and ASGI webhook ingestion apps."""
+
+import asyncio
+import base64
+import io
+import json
+import threading
+import time
+
+import pytest
+
+from openphone_python.webhooks import (
+    BloomDeduplicator,
+    LRUDeduplicator,
+    WebhookASGIApp,
+    WebhookReceiver,
+    WebhookWSGIApp,
+    compute_signature,
+)
+
+KEY = base64.b64encode(b"app-test-key").decode()
+
+
+def signed_request(event_id="EV1"):
+    """Signed body of a call.completed delivery."""
+    body = json.dumps(
+        {"id": event_id, "type": "call.completed", "data": {"object": {"id": "AC1"}}}
+    ).encode()
+    return body, compute_signature(body, KEY, int(time.time() * 1000))
+
+
+def call_wsgi(app, body, signature):
+    """POST a delivery to a WSGI app and return the status code."""
+    environ = {
+        "REQUEST_METHOD": "POST",
+        "CONTENT_LENGTH": str(len(body)),
+        "wsgi.input": io.BytesIO(body),
+        "HTTP_OPENPHONE_SIGNATURE": signature,
+    }
+    statuses = []
+    app(environ, lambda status, headers: statuses.append(status))
+    return int(statuses[0].split()[0])
+
+
+def test_wsgi_app_acknowledges_then_applies_backpressure():
+    """Events are acknowledged immediately and refused with 503 when full."""
+    started = threading.Event()
+    release = threading.Event()
+    handled = []
+
+    def handler(event):
+        started.set()
+        release.wait(5)
+        handled.append(event.id)
+
+    app = WebhookWSGIApp(
+        WebhookReceiver({"WH1": KEY}), handler, queue_size=1, workers=1
+    )
+    statuses = [call_wsgi(app, *signed_request("EV0"))]
+    assert started.wait(5)
+    statuses += [call_wsgi(app, *signed_request(f"EV{i}")) for i in range(1, 4)]
+
+    # One event is being handled, one waits in the queue, the rest are refused
+    assert statuses == [202, 202, 503, 503]
+    assert call_wsgi(app, b"{}", "hmac;1;0;bad") == 401
+
+    release.set()
+    app.join()
+    app.close()
+    stats = app.stats.snapshot()
+    assert stats["processed"] == stats["accepted"] == len(handled)
+    assert stats["rejected"] == statuses.count(503)
+    assert stats["invalid"] == 1
+
+
+@pytest.mark.parametrize("deduplicator", [LRUDeduplicator, BloomDeduplicator])
+def test_wsgi_app_processes_redelivery_after_503(deduplicator):
+    """A delivery refused with 503 is not remembered, so its retry is queued."""
+    started = threading.Event()
+    release = threading.Event()
+    handled = []
+
+    def handler(event):
+        started.set()
+        release.wait(5)
+        handled.append(event.id)
+
+    receiver = WebhookReceiver({"WH1": KEY}, deduplicator=deduplicator())
+    app = WebhookWSGIApp(receiver, handler, queue_size=1, workers=1)
+    assert call_wsgi(app, *signed_request("EV0")) == 202
+    assert started.wait(5)
+    assert call_wsgi(app, *signed_request("EV1")) == 202
+    assert call_wsgi(app, *signed_request("EV2")) == 503
+
+    release.set()
+    app.join()
+    assert call_wsgi(app, *signed_request("EV2")) == 202
+    assert call_wsgi(app, *signed_request("EV2")) == 200
+    app.join()
+    app.close()
+    assert handled == ["EV0", "EV1", "EV2"]
+    assert app.stats.snapshot()["duplicate"] == 1
+
+
+@pytest.mark.parametrize("deduplicator", [LRUDeduplicator, BloomDeduplicator])
+def test_wsgi_app_queues_concurrent_duplicates_once(deduplicator):
+    """Concurrent deliveries of one event are queued exactly once."""
+    handled = []
+    receiver = WebhookReceiver({"WH1": KEY}, deduplicator=deduplicator())
+    app = WebhookWSGIApp(receiver, lambda event: handled.append(event.id))
+    body, signature = signed_request("EV1")
+    barrier = threading.Barrier(8)
+    statuses = []
+
+    def deliver():
+        barrier.wait(5)
+        statuses.append(call_wsgi(app, body, signature))
+
+    threads = [threading.Thread(target=deliver) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+    app.join()
+    app.close()
+
+    assert sorted(statuses) == [200] * 7 + [202]
+    assert handled == ["EV1"]
+    assert app.stats.snapshot()["duplicate"] == 7
+
+
+def test_wsgi_app_refuses_oversized_bodies_unread():
+    """A Content-Length above max_body_size is answered 413 without reading."""
+    app = WebhookWSGIApp(
+        WebhookReceiver({"WH1": KEY}), lambda event: None, max_body_size=64
+    )
+    stream = io.BytesIO(b"x" * 1000)
+    environ = {
+        "REQUEST_METHOD": "POST",
+        "CONTENT_LENGTH": "1000",
+        "wsgi.input": stream,
+    }
+    statuses = []
+    app(environ, lambda status, headers: statuses.append(status))
+    app.close()
+
+    assert statuses == ["413 Payload Too Large"]
+    assert stream.tell() == 0
+    assert app.stats.snapshot()["invalid"] == 1
+
+
+def test_asgi_app_stops_reading_oversized_bodies():
+    """The ASGI app answers 413 and stops reading once the limit is passed."""
+    app = WebhookASGIApp(
+        WebhookReceiver({"WH1": KEY}), lambda event: None, max_body_size=64
+    )
+
+    async def run(headers):
+        messages = [
+            {"type": "http.request", "body": b"x" * 50, "more_body": True}
+            for _ in range(10)
+        ]
+        sent = []
+
+        async def receive():
+            return messages.pop(0)
+
+        async def send(message):
+            sent.append(message)
+
+        scope = {"type": "http", "method": "POST", "headers": headers}
+        await app(scope, receive, send)
+        await app.close()
+        return sent[0]["status"], len(messages)
+
+    # Streamed without a Content-Length: the second chunk passes the limit
+    assert asyncio.run(run([])) == (413, 8)
+    # Announced too large: nothing is read
+    assert asyncio.run(run([(b"content-length", b"500")])) == (413, 10)
+    assert app.stats.snapshot()["invalid"] == 2
+
+
+def test_asgi_app_processes_events_on_worker_tasks():
+    """Deliveries are verified, acknowledged and handled by async workers."""
+    handled = []
+
+    async def handler(event):
+        handled.append(event.id)
+
+    app = WebhookASGIApp(WebhookReceiver({"WH1": KEY}), handler)
+
+    async def run():
+        body, signature = signed_request()
+        messages = [{"type": "http.request", "body": body, "more_body": False}]
+        sent = []
+
+        async def receive():
+            return messages.pop(0)
+
+        async def send(message):
+            sent.append(message)
+
+        scope = {
+            "type": "http",
+            "method": "POST",
+            "headers": [(b"openphone-signature", signature.encode())],
+        }
+        await app(scope, receive, send)
+        await app.join()
+        await app.close()
+        return sent[0]["status"]
+
+    assert asyncio.run(run()) == 202
+    assert handled == ["EV1"]
+
+
+def test_asgi_app_loads_keys_off_the_loop_and_refuses_on_loader_failure():
+    """A blocking key_loader runs in a thread; its failures answer 503."""
+    loader_threads = []
+
+    def key_loader(webhook_id):
+        loader_threads.append(threading.get_ident())
+        if webhook_id == "WH-DOWN":
+            raise ConnectionError("API unreachable")
+        return KEY
+
+    async def deliver(app):
+        body, signature = signed_request()
+        messages = [{"type": "http.request", "body": body, "more_body": False}]
+        sent = []
+
+        async def receive():
+            return messages.pop(0)
+
+        async def send(message):
+            sent.append(message)
+
+        scope = {
+            "type": "http",
+            "method": "POST",
+            "headers": [(b"openphone-signature", signature.encode())],
+        }
+        await app(scope, receive, send)
+        await app.close()
+        return sent[0]
+
+    async def handler(event):
+        pass
+
+    statuses = {}
+    for webhook_id in ("WH1", "WH-DOWN"):
+        receiver = WebhookReceiver(key_loader=key_loader)
+        app = WebhookASGIApp(receiver, handler, webhook_id=webhook_id)
+        statuses[webhook_id] = asyncio.run(deliver(app))
+
+    assert statuses["WH1"]["status"] == 202
+    assert statuses["WH-DOWN"]["status"] == 503
+    assert (b"retry-after", b"1") in statuses["WH-DOWN"]["headers"]
+    assert app.stats.snapshot()["unavailable"] == 1
+    assert threading.get_ident() not in loader_threads
+
+
+def test_asgi_app_accepts_and_logs_off_the_loop():
+    """The event log append runs in a thread, not on the event loop."""
+    append_threads = []
+
+    class RecordingLog:
+        """Event log stand-in recording the thread of each append."""
+
+        def append(self, body):
+            append_threads.append(threading.get_ident())
+
+    async def handler(event):
+        pass
+
+    receiver = WebhookReceiver(
+        {"WH1": KEY}, deduplicator=LRUDeduplicator(), event_log=RecordingLog()
+    )
+    app = WebhookASGIApp(receiver, handler)
+
+    async def run():
+        body, signature = signed_request()
+        messages = [{"type": "http.request", "body": body, "more_body": False}]
+        sent = []
+
+        async def receive():
+            return messages.pop(0)
+
+        async def send(message):
+            sent.append(message)
+
+        scope = {
+            "type": "http",
+            "method": "POST",
+            "headers": [(b"openphone-signature", signature.encode())],
+        }
+        await app(scope, receive, send)
+        await app.join()
+        await app.close()
+        return sent[0]["status"], threading.get_ident()
+
+    status, loop_thread = asyncio.run(run())
+    assert status == 202
+    assert len(append_threads) == 1
+    assert loop_thread not in append_threads
+    assert app.stats.snapshot()["accepted"] == 1
@@ -0,0 +1,106 @@
+"""Tests for the webhook micro-batching sink."""
+
+import threading
+import time
+
+import pytest
+
+from openphone_python.models import WebhookEvent
+from openphone_python.webhooks import BatchingSink, conversation_key
+
+
+def make_event(index, conversation="CN1"):
+    """Message event of a conversation."""
+    return WebhookEvent(
+        {
+            "id": f"EV{index}",
+            "type": "message.received",
+            "data": {"object": {"id": f"MS{index}", "conversationId": conversation}},
+        }
+    )
+
+
+def test_batches_flush_on_size_and_latency():
+    """Full batches flush immediately; a partial batch flushes after max_latency."""
+    batches = []
+    with BatchingSink(
+        lambda events: batches.append([e.id for e in events]), 3, 0.05
+    ) as sink:
+        for index in range(7):
+            sink.submit(make_event(index))
+        assert sink.join(timeout=2)
+
+    assert batches == [["EV0", "EV1", "EV2"], ["EV3", "EV4", "EV5"], ["EV6"]]
+    assert sink.stats.snapshot() == {
+        "submitted": 7,
+        "batches": 3,
+        "acked": 7,
+        "failed": 0,
+    }
+
+
+def test_per_event_failures_and_batch_errors_settle_futures():
+    """Events reported as failed, or in a raising batch, fail their futures."""
+    calls = []
+
+    def handler(events):
+        calls.append(len(events))
+        if len(calls) == 2:
+            raise RuntimeError("database unavailable")
+        return {"EV1": ValueError("duplicate key")}
+
+    with BatchingSink(handler, max_batch_size=2, max_latency=1.0) as sink:
+        first = [sink.submit(make_event(index)) for index in range(2)]
+        sink.join(timeout=2)
+        second = [sink.submit(make_event(index)) for index in range(2, 4)]
+        sink.join(timeout=2)
+
+    assert first[0].result() is None
+    with pytest.raises(ValueError):
+        first[1].result()
+    for future in second:
+        with pytest.raises(RuntimeError):
+            future.result()
+    assert sink.stats.snapshot()["failed"] == 3
+
+
+def test_events_of_one_call_share_a_key():
+    """Call events are keyed by the call, whether or not they name a conversation."""
+    completed = WebhookEvent(
+        {
+            "type": "call.completed",
+            "data": {"object": {"id": "AC1", "conversationId": "CN1"}},
+        }
+    )
+    summary = WebhookEvent(
+        {"type": "call.summary.completed", "data": {"object": {"callId": "AC1"}}}
+    )
+    message = WebhookEvent(
+        {
+            "type": "message.received",
+            "data": {"object": {"id": "MS1", "conversationId": "CN1"}},
+        }
+    )
+
+    assert conversation_key(completed) == conversation_key(summary) == "AC1"
+    assert conversation_key(message) == "CN1"
+
+
+def test_order_is_preserved_per_conversation_across_lanes():
+    """Events of one conversation reach the handler in submission order."""
+    seen = {}
+    lock = threading.Lock()
+
+    def handler(events):
+        time.sleep(0.001)
+        with lock:
+            for event in events:
+                seen.setdefault(event.object["conversationId"], []).append(event.id)
+
+    with BatchingSink(handler, max_batch_size=16, max_latency=0.01, workers=4) as sink:
+        for index in range(400):
+            sink.submit(make_event(index, conversation=f"CN{index % 10}"))
+
+    assert sum(len(ids) for ids in seen.values()) == 400
+    for conversation, ids in seen.items():
+        assert ids == sorted(ids, key=lambda event_id: int(event_id[2:]))
@@ -0,0 +1,89 @@
+"""Tests for webhook event deduplication."""
+
+import time
+
+import pytest
+
+from openphone_python.webhooks import (
+    BaseDeduplicator,
+    BloomDeduplicator,
+    LRUDeduplicator,
+)
+
+
+@pytest.mark.parametrize(
+    "factory",
+    [
+        lambda path: LRUDeduplicator(path=path),
+        lambda path: BloomDeduplicator(1000, path=path),
+    ],
+)
+def test_duplicates_are_detected_and_survive_restart(tmp_path, factory):
+    """Seen IDs are reported as duplicates, also after save and reload."""
+    path = str(tmp_path / "dedup.state")
+    dedup = factory(path)
+
+    assert dedup.seen("EV1") is False
+    assert dedup.seen("EV1") is True
+    assert dedup.seen("EV2") is False
+    dedup.save()
+
+    restored = factory(path)
+    assert restored.seen("EV1") is True
+    assert restored.seen("EV3") is False
+
+
+@pytest.mark.parametrize("factory", [LRUDeduplicator, lambda: BloomDeduplicator(1000)])
+def test_contains_does_not_record_until_added(factory):
+    """contains() only checks; the ID counts as seen once add() is called."""
+    dedup = factory()
+    assert dedup.contains("EV1") is False
+    assert dedup.contains("EV1") is False
+
+    dedup.add("EV1")
+    assert dedup.contains("EV1") is True
+    assert dedup.seen("EV1") is True
+
+
+def test_forget_support_is_advertised():
+    """Only backends that can forget say so; the base class is abstract."""
+    lru = LRUDeduplicator()
+    lru.seen("EV1")
+    lru.forget("EV1")
+    assert lru.supports_forget is True
+    assert lru.contains("EV1") is False
+
+    bloom = BloomDeduplicator(1000)
+    bloom.seen("EV1")
+    bloom.forget("EV1")
+    assert bloom.supports_forget is False
+    assert bloom.contains("EV1") is True
+
+    with pytest.raises(TypeError):
+        BaseDeduplicator()  # type: ignore[abstract]
+
+
+def test_lru_bounds_entries_and_expires_ids():
+    """The LRU never exceeds max_entries and forgets IDs after the TTL."""
+    dedup = LRUDeduplicator(max_entries=2, ttl=0.05)
+    for event_id in ("EV1", "EV2", "EV3"):
+        dedup.seen(event_id)
+    assert len(dedup) == 2
+    assert dedup.seen("EV1") is False  # evicted
+
+    time.sleep(0.06)
+    assert dedup.seen("EV3") is False  # expired
+
+    dedup.forget("EV3")
+    assert dedup.seen("EV3") is False
+
+
+def test_bloom_respects_memory_ceiling_and_error_rate():
+    """The Bloom filter stays within max_bytes with few false positives."""
+    dedup = BloomDeduplicator(capacity=10_000, error_rate=0.01, max_bytes=64_000)
+    assert dedup.memory_bytes <= 64_000
+
+    for i in range(10_000):
+        dedup.seen(f"EV{i}")
+    false_positives = sum(dedup.seen(f"NEW{i}") for i in range(10_000))
+    assert false_positives < 300
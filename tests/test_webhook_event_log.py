@@ -0,0 +1,106 @@
+"""Tests for the append-only webhook event log."""
+
+import io
+import json
+import threading
+import time
+
+from openphone_python.webhooks import (
+    EventLog,
+    EventLogReader,
+    LRUDeduplicator,
+    WebhookReceiver,
+    WebhookRouter,
+    WebhookWSGIApp,
+)
+
+
+def make_body(index):
+    """Raw message.received delivery."""
+    return json.dumps(
+        {
+            "id": f"EV{index}",
+            "type": "message.received",
+            "data": {"object": {"id": f"MS{index}"}},
+        }
+    ).encode()
+
+
+def test_append_rotate_and_replay(tmp_path):
+    """Records keep their offsets across segments and replay into a router."""
+    directory = str(tmp_path / "log")
+    with EventLog(directory, segment_bytes=400, fsync_records=10) as log:
+        offsets = [log.append(make_body(index)) for index in range(20)]
+        reader = log.reader()
+
+        assert offsets == list(range(20))
+        assert len(list((tmp_path / "log").glob("*.log"))) > 1
+        assert json.loads(reader.get(13))["id"] == "EV13"
+        assert [offset for offset, _ in reader.read(5, 8)] == [5, 6, 7]
+
+    seen = []
+    router = WebhookRouter()
+    router.add_handler("message.received", lambda event: seen.append(event.id))
+    assert EventLogReader(directory).replay(router, start=18) == 2
+    assert seen == ["EV18", "EV19"]
+
+
+def test_torn_tail_is_truncated_on_reopen(tmp_path):
+    """A partially written last record is dropped and its offset reused."""
+    directory = str(tmp_path / "log")
+    with EventLog(directory) as log:
+        log.append(make_body(0))
+        log.append(make_body(1))
+    segment = next((tmp_path / "log").glob("*.log"))
+    segment.write_bytes(segment.read_bytes()[:-5])
+
+    with EventLog(directory) as log:
+        assert log.next_offset == 1
+        assert log.append(make_body(2)) == 1
+        events = [event.id for _, event in log.reader().events()]
+    assert events == ["EV0", "EV2"]
+
+
+def test_idle_log_is_synced_without_further_appends(tmp_path):
+    """The last record reaches the file even if no further event arrives."""
+    with EventLog(str(tmp_path / "log"), fsync_interval=0.02) as log:
+        log.append(make_body(0))
+        segment = next((tmp_path / "log").glob("*.log"))
+        deadline = time.monotonic() + 5
+        while segment.stat().st_size == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert segment.stat().st_size > 0
+
+
+def test_app_logs_only_accepted_deliveries(tmp_path):
+    """Deliveries refused with 503 and duplicates are not appended."""
+    release = threading.Event()
+    log = EventLog(str(tmp_path / "log"))
+    receiver = WebhookReceiver(
+        verify=False, deduplicator=LRUDeduplicator(), event_log=log
+    )
+    app = WebhookWSGIApp(
+        receiver, lambda event: release.wait(5), queue_size=1, workers=1
+    )
+
+    statuses = [call_wsgi(app, make_body(index)) for index in (0, 0, 1, 2, 3)]
+    release.set()
+    app.close()
+
+    logged = [event.id for _, event in log.reader().events()]
+    assert statuses.count(202) == len(logged)
+    assert statuses[1] == 200 and 503 in statuses
+    assert sorted(logged) == sorted(set(logged))
+    log.close()
+
+
+def call_wsgi(app, body):
+    """POST a delivery to a WSGI app and return the status code."""
+    environ = {
+        "REQUEST_METHOD": "POST",
+        "CONTENT_LENGTH": str(len(body)),
+        "wsgi.input": io.BytesIO(body),
+    }
+    statuses = []
+    app(environ, lambda status, headers: statuses.append(status))
+    return int(statuses[0].split()[0])
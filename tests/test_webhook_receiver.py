@@ -0,0 +1,150 @@
+"""Tests for webhook signature verification and parsing."""
+
+import base64
+import json
+import threading
+import time
+
+import pytest
+
+from openphone_python.exceptions import (
+    ApiError,
+    NotFoundError,
+    WebhookKeyUnavailableError,
+    WebhookVerificationError,
+)
+from openphone_python.models import Webhook
+from openphone_python.webhooks import (
+    SignatureVerifier,
+    WebhookReceiver,
+    compute_signature,
+)
+
+KEY = base64.b64encode(b"super-secret-signing-key").decode()
+NOW = 1_700_000_000.0
+BODY = json.dumps(
+    {
+        "id": "EV123",
+        "object": "event",
+        "type": "message.received",
+        "createdAt": "2024-01-01T00:00:00.000Z",
+        "data": {"object": {"id": "AC1", "text": "hi"}},
+    }
+).encode()
+
+
+def sign(body=BODY, key=KEY, timestamp=NOW):
+    """Signature header for a body."""
+    return compute_signature(body, key, int(timestamp * 1000))
+
+
+def test_receive_verifies_and_parses_event():
+    """A correctly signed delivery becomes a typed event."""
+    receiver = WebhookReceiver.from_webhooks([Webhook({"id": "WH1", "key": KEY})])
+    receiver.verifier.tolerance = None
+
+    event = receiver.receive(BODY, {"Openphone-Signature": sign()}, webhook_id="WH1")
+
+    assert event.id == "EV123"
+    assert event.type == "message.received"
+    assert event.object["text"] == "hi"
+    assert event.created_at.year == 2024
+    # Parsing timestamps leaves the raw payload serializable
+    assert json.loads(json.dumps(event.to_dict())) == json.loads(BODY)
+
+
+@pytest.mark.parametrize(
+    "header",
+    [
+        None,
+        "garbage",
+        sign(body=BODY + b" "),
+        sign(key=base64.b64encode(b"other").decode()),
+    ],
+)
+def test_receive_rejects_invalid_signatures(header):
+    """Missing, malformed and mismatching signatures are rejected."""
+    receiver = WebhookReceiver(signing_keys={"WH1": KEY}, tolerance=None)
+    headers = {} if header is None else {"openphone-signature": header}
+
+    with pytest.raises(WebhookVerificationError):
+        receiver.receive(BODY, headers)
+
+
+def test_verify_enforces_timestamp_tolerance():
+    """Signatures outside the tolerance window are rejected."""
+    receiver = WebhookReceiver(signing_keys={"WH1": KEY}, tolerance=300)
+    header = sign(timestamp=NOW - 301)
+
+    receiver.verifier.verify(BODY, sign(), now=NOW)
+    with pytest.raises(WebhookVerificationError):
+        receiver.verifier.verify(BODY, header, now=NOW)
+
+
+def test_key_loader_result_is_cached():
+    """Unknown webhook keys are loaded once and reused."""
+    loads = []
+
+    def loader(webhook_id):
+        loads.append(webhook_id)
+        return KEY
+
+    receiver = WebhookReceiver(key_loader=loader, tolerance=None)
+    for _ in range(3):
+        receiver.receive(BODY, {"HTTP_OPENPHONE_SIGNATURE": sign()}, webhook_id="WH9")
+
+    assert loads == ["WH9"]
+
+
+def test_unknown_ids_and_failed_loads_are_cached_briefly():
+    """Unsigned traffic for unknown IDs does not reach key_loader every time."""
+    loads = []
+
+    def loader(webhook_id):
+        loads.append(webhook_id)
+        if webhook_id == "WH404":
+            raise NotFoundError("no such webhook")
+        raise ApiError("API unavailable", 503)
+
+    verifier = SignatureVerifier(key_loader=loader, tolerance=None, negative_ttl=0.05)
+    for _ in range(3):
+        with pytest.raises(WebhookVerificationError, match="No signing key"):
+            verifier.verify(BODY, sign(), webhook_id="WH404")
+        with pytest.raises(WebhookKeyUnavailableError):
+            verifier.verify(BODY, sign(), webhook_id="WH500")
+    assert loads == ["WH404", "WH500"]
+
+    time.sleep(0.06)
+    with pytest.raises(WebhookVerificationError):
+        verifier.verify(BODY, sign(), webhook_id="WH404")
+    assert loads == ["WH404", "WH500", "WH404"]
+
+    verifier.add_key("WH404", KEY)
+    verifier.verify(BODY, sign(), webhook_id="WH404")
+
+
+def test_concurrent_key_loads_are_bounded():
+    """Loads beyond max_concurrent_loads are refused instead of queued."""
+    started = threading.Event()
+    release = threading.Event()
+
+    def loader(webhook_id):
+        started.set()
+        release.wait(5)
+        return KEY
+
+    verifier = SignatureVerifier(
+        key_loader=loader, tolerance=None, max_concurrent_loads=1
+    )
+    thread = threading.Thread(
+        target=verifier.verify, args=(BODY, sign()), kwargs={"webhook_id": "WH1"}
+    )
+    thread.start()
+    assert started.wait(5)
+    try:
+        with pytest.raises(WebhookKeyUnavailableError, match="in flight"):
+            verifier.verify(BODY, sign(), webhook_id="WH2")
+    finally:
+        release.set()
+        thread.join()
+    verifier.verify(BODY, sign(), webhook_id="WH1")
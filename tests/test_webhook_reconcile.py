@@ -0,0 +1,149 @@
+"""Tests for webhook gap reconciliation."""
+
+import responses
+
+from openphone_python import OpenPhoneClient
+from openphone_python.models import PhoneNumber, WebhookEvent
+from openphone_python.webhooks import BloomDeduplicator, WebhookReconciler
+
+BASE_URL = "https://api.openphone.com/v1"
+PHONE_NUMBER = PhoneNumber({"id": "PN1", "number": "+14155550100"})
+
+
+def add_backlog():
+    """One conversation with an inbound message, an outbound message and a call."""
+    responses.add(
+        responses.GET,
+        f"{BASE_URL}/conversations",
+        json={
+            "data": [
+                {"id": "CV1", "phoneNumberId": "PN1", "participants": ["+14155550101"]}
+            ]
+        },
+    )
+    responses.add(
+        responses.GET,
+        f"{BASE_URL}/messages",
+        json={
+            "data": [
+                {
+                    "id": "MS2",
+                    "direction": "incoming",
+                    "createdAt": "2030-01-01T00:00:02Z",
+                },
+                {
+                    "id": "MS3",
+                    "direction": "outgoing",
+                    "createdAt": "2030-01-01T00:00:03Z",
+                },
+                {
+                    "id": "MS1",
+                    "direction": "incoming",
+                    "createdAt": "2030-01-01T00:00:01Z",
+                },
+            ]
+        },
+    )
+    responses.add(
+        responses.GET,
+        f"{BASE_URL}/calls",
+        json={
+            "data": [
+                {
+                    "id": "AC1",
+                    "status": "completed",
+                    "createdAt": "2030-01-01T00:00:04Z",
+                }
+            ]
+        },
+    )
+
+
+@responses.activate
+def test_reconcile_backfills_missed_events_once(tmp_path):
+    """Missed objects are dispatched in order; live and repeated ones are not."""
+    add_backlog()
+    client = OpenPhoneClient(api_key="test_key")
+    handled = []
+    reconciler = WebhookReconciler(
+        client,
+        lambda event: handled.append((event.type, event.object["id"])),
+        phone_numbers=[PHONE_NUMBER],
+        state_path=str(tmp_path / "state.json"),
+    )
+    live = WebhookEvent(
+        {"id": "EV1", "type": "message.received", "data": {"object": {"id": "MS2"}}}
+    )
+    assert reconciler.handle(live) == 1
+
+    report = reconciler.reconcile()
+
+    assert handled == [
+        ("message.received", "MS2"),
+        ("message.received", "MS1"),
+        ("call.completed", "AC1"),
+    ]
+    assert (report.dispatched, report.duplicates, report.ok) == (2, 1, True)
+    assert reconciler.watermark("PN1") is not None
+    assert (tmp_path / "state.json").exists()
+
+    reconciler.reconcile()
+    assert len(handled) == 3
+    assert "updatedAfter" in responses.calls[-3].request.url
+
+
+@responses.activate
+def test_failed_events_hold_back_the_watermark():
+    """A failing handler keeps the watermark before the failed object for a retry."""
+    add_backlog()
+    client = OpenPhoneClient(api_key="test_key")
+    attempts = []
+
+    def handler(event):
+        attempts.append(event.object["id"])
+        if event.object["id"] == "MS2" and attempts.count("MS2") == 1:
+            raise RuntimeError("database unavailable")
+
+    reconciler = WebhookReconciler(client, handler, phone_numbers=[PHONE_NUMBER])
+
+    report = reconciler.reconcile()
+    assert report.failed == 1
+    assert reconciler.watermark("PN1") == "2030-01-01T00:00:02.000Z"
+
+    reconciler.reconcile()
+    assert attempts == ["MS1", "MS2", "AC1", "MS2"]
+
+
+@responses.activate
+def test_failed_events_are_retried_with_a_bloom_deduplicator():
+    """A deduplicator that cannot forget only records objects once handled."""
+    add_backlog()
+    client = OpenPhoneClient(api_key="test_key")
+    attempts = []
+
+    def handler(event):
+        attempts.append(event.object["id"])
+        if event.object["id"] == "MS1" and attempts.count("MS1") == 1:
+            raise RuntimeError("database unavailable")
+
+    reconciler = WebhookReconciler(
+        client,
+        handler,
+        phone_numbers=[PHONE_NUMBER],
+        deduplicator=BloomDeduplicator(1000),
+    )
+
+    first = reconciler.reconcile()
+    assert (first.dispatched, first.failed) == (2, 1)
+
+    second = reconciler.reconcile()
+    assert (second.dispatched, second.duplicates, second.failed) == (1, 2, 0)
+    assert attempts == ["MS1", "MS2", "AC1", "MS1"]
+
+    live = WebhookEvent(
+        {"id": "EV1", "type": "call.completed", "data": {"object": {"id": "AC2"}}}
+    )
+    handler_calls = len(attempts)
+    assert reconciler.handle(live) == 1
+    assert reconciler.handle(live) == 0
+    assert len(attempts) == handler_calls + 1
@@ -0,0 +1,80 @@
+"""Tests for webhook event dispatch."""
+
+import asyncio
+
+import pytest
+
+from openphone_python.models import Call, Message, WebhookEvent
+from openphone_python.webhooks import WebhookRouter
+
+
+def make_event(event_type, obj=None):
+    """Webhook event of a type with a minimal object."""
+    return WebhookEvent(
+        {"id": "EV1", "type": event_type, "data": {"object": obj or {"id": "AC1"}}}
+    )
+
+
+def test_dispatch_routes_by_type_family_and_wildcard():
+    """Exact, family and wildcard handlers run in that order."""
+    router = WebhookRouter()
+    calls = []
+
+    @router.on("message.received")
+    def exact(event):
+        calls.append(("exact", event.model))
+
+    router.add_handler("message.*", lambda event: calls.append(("family", None)))
+    router.add_handler("*", lambda event: calls.append(("any", None)))
+
+    assert router.dispatch(make_event("message.received")) == 3
+    assert [name for name, _ in calls] == ["exact", "family", "any"]
+    assert isinstance(calls[0][1], Message)
+    assert router.dispatch(make_event("call.completed")) == 1
+
+
+def test_model_conversion_is_lazy_and_typed():
+    """Event objects become SDK models on first access only."""
+    event = make_event("call.completed", {"id": "AC9", "status": "completed"})
+    assert "_model" not in event.__dict__
+    assert isinstance(event.model, Call)
+    assert event.model is event.model
+    assert event.model.status == "completed"
+
+
+def test_async_handlers():
+    """Coroutine handlers work from both sync and async dispatch."""
+    router = WebhookRouter()
+    seen = []
+
+    @router.on("call.ringing")
+    async def handler(event):
+        seen.append(event.id)
+
+    router.add_handler("call.ringing", lambda event: seen.append("sync"))
+
+    router.dispatch(make_event("call.ringing"))
+    asyncio.run(router.dispatch_async(make_event("call.ringing")))
+    assert seen == ["EV1", "sync", "EV1", "sync"]
+
+
+def test_unknown_event_type_is_rejected():
+    """Handlers cannot be registered for unknown event types."""
+    with pytest.raises(ValueError):
+        WebhookRouter().add_handler("message.exploded", print)
+
+
+def test_nested_family_handlers():
+    """Family patterns match at every depth of the event type."""
+    router = WebhookRouter()
+    calls = []
+    router.add_handler("call.*", lambda event: calls.append("call"))
+    router.add_handler("call.summary.*", lambda event: calls.append("summary"))
+    router.add_handler("call.recording.*", lambda event: calls.append("recording"))
+
+    assert router.dispatch(make_event("call.summary.completed")) == 2
+    assert calls == ["summary", "call"]
+    assert router.dispatch(make_event("call.recording.completed")) == 2
+    assert router.dispatch(make_event("call.completed")) == 1
+    with pytest.raises(ValueError):
+        router.add_handler("call.summary.completed.*", print)
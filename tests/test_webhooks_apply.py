@@ -0,0 +1,104 @@
+"""Tests for declarative webhook configuration."""
+
+import json
+
+import responses
+
+from openphone_python import OpenPhoneClient
+from openphone_python.exceptions import OperationCancelledError
+
+BASE_URL = "https://api.openphone.com/v1"
+HOOK_URL = "https://example.com/hooks"
+
+
+def add_existing():
+    """One matching webhook, a duplicate of it and one stale webhook."""
+    responses.add(
+        responses.GET,
+        f"{BASE_URL}/webhooks",
+        json={
+            "data": [
+                {
+                    "id": "WH1",
+                    "url": HOOK_URL,
+                    "events": ["message.delivered", "message.received"],
+                    "resourceIds": ["*"],
+                },
+                {
+                    "id": "WH2",
+                    "url": HOOK_URL,
+                    "events": ["message.received", "message.delivered"],
+                },
+                {
+                    "id": "WH3",
+                    "url": HOOK_URL,
+                    "events": ["call.ringing"],
+                    "resourceIds": ["PN1"],
+                },
+            ]
+        },
+    )
+
+
+DESIRED = [
+    {"url": HOOK_URL, "events": ["message.received", "message.delivered"]},
+    {"url": HOOK_URL, "events": ["call.completed"], "resourceIds": ["PN1"]},
+    {"url": HOOK_URL, "events": ["call.summary.completed"]},
+]
+
+
+@responses.activate
+def test_apply_creates_missing_and_deletes_extra_webhooks():
+    """Only the differences are written, each through its specialized endpoint."""
+    add_existing()
+    responses.add(
+        responses.POST, f"{BASE_URL}/webhooks/calls", json={"data": {"id": "WH4"}}
+    )
+    responses.add(
+        responses.POST,
+        f"{BASE_URL}/webhooks/call-summaries",
+        json={"data": {"id": "WH5"}},
+    )
+    for webhook_id in ("WH2", "WH3"):
+        responses.add(responses.DELETE, f"{BASE_URL}/webhooks/{webhook_id}", status=204)
+
+    client = OpenPhoneClient(api_key="test_key")
+    plan = client.webhooks.apply(DESIRED)
+
+    assert plan.ok
+    assert [webhook.id for webhook in plan.unchanged] == ["WH1"]
+    assert sorted(webhook.id for webhook in plan.delete) == ["WH2", "WH3"]
+    assert [webhook.id for webhook in plan.created] == ["WH4", "WH5"]
+    assert sum(call.request.method == "GET" for call in responses.calls) == 1
+    posted = [
+        json.loads(call.request.body)
+        for call in responses.calls
+        if call.request.method == "POST"
+    ]
+    assert sorted(body["events"][0] for body in posted) == [
+        "call.completed",
+        "call.summary.completed",
+    ]
+
+
+@responses.activate
+def test_dry_run_and_failed_creates_do_not_delete():
+    """A dry run writes nothing, and deletes are skipped once a create failed."""
+    add_existing()
+    responses.add(responses.POST, f"{BASE_URL}/webhooks/calls", status=400, json={})
+    responses.add(
+        responses.POST,
+        f"{BASE_URL}/webhooks/call-summaries",
+        json={"data": {"id": "WH5"}},
+    )
+    client = OpenPhoneClient(api_key="test_key")
+
+    plan = client.webhooks.apply(DESIRED, dry_run=True)
+    assert plan.has_changes and plan.results == []
+    assert len(responses.calls) == 1
+
+    plan = client.webhooks.apply(DESIRED)
+    assert not plan.ok
+    deletes = [result for result in plan.results if result.item in plan.delete]
+    assert len(deletes) == 2
+    assert all(isinstance(result.error, OperationCancelledError) for result in deletes)